@@ -0,0 +1,252 @@
+# down_allocation_app/core/allocation_engine.py
+
+import math
+
+import numpy as np
+
+
+def parse_qty(text):
+    """Panel quantity rule used everywhere: plain digits only, anything else is 0."""
+    text = str(text).strip() if text is not None else ""
+    return int(text) if text.isdigit() else 0
+
+
+def parse_area(text):
+    """Sewing area rule: any finite float, anything else is 0.0."""
+    if not text:
+        return 0.0
+    try:
+        value = float(text)
+    except (TypeError, ValueError):
+        return 0.0
+    return value if math.isfinite(value) else 0.0
+
+
+def number_text(value):
+    """Cell text for a stored number: blank for 0, no decimals for whole values."""
+    if value == 0:
+        return ""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def parse_weight(text):
+    """Ecodown / garment weight input rule: float, blank or invalid is 0.0."""
+    try:
+        return float(text or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class PanelGrid:
+    """
+    Numeric mirror of the top table's data rows.
+
+    Holds panel names, a quantity vector and a panel x size area matrix so
+    totals and allocations are array operations instead of per-cell string
+    parsing. Row/column indexes are data coordinates (row 0 = first panel,
+    column 0 = first size), not table coordinates.
+    """
+
+    def __init__(self, rows=0, cols=0):
+        self.names = [""] * rows
+        self.qty = np.zeros(rows, dtype=np.int64)
+        self.areas = np.zeros((rows, cols), dtype=np.float64)
+        self.sizes = [""] * cols
+
+    @property
+    def shape(self):
+        return self.areas.shape
+
+    # region Construction
+    @classmethod
+    def from_saved(cls, saved_data):
+        """Builds a grid from TopTableSection.save_table_content() / .dax 'top_table_data'."""
+        size_names = list(saved_data.get('size_names', []))
+        panel_data = saved_data.get('panel_data', [])
+        cols = max([len(size_names)] + [len(p.get('areas', [])) for p in panel_data])
+        grid = cls(len(panel_data), cols)
+        for col, name in enumerate(size_names):
+            grid.sizes[col] = str(name).strip()
+        for row, panel in enumerate(panel_data):
+            grid.names[row] = str(panel.get('name', '')).strip()
+            grid.qty[row] = parse_qty(panel.get('qty', ''))
+            for col, text in enumerate(panel.get('areas', [])):
+                grid.areas[row, col] = parse_area(text)
+        return grid
+
+    @classmethod
+    def from_arrays(cls, names, qty, sizes, areas):
+        grid = cls()
+        grid.names = [str(n).strip() for n in names]
+        grid.qty = np.asarray(qty, dtype=np.int64).copy()
+        grid.areas = np.asarray(areas, dtype=np.float64).reshape(len(grid.names), len(sizes)).copy()
+        grid.sizes = [str(s).strip() for s in sizes]
+        return grid
+
+    def copy(self):
+        return PanelGrid.from_arrays(self.names, self.qty, self.sizes, self.areas)
+
+    def to_saved(self):
+        """Inverse of from_saved(): save_table_content()-shaped data (numbers as text)."""
+        return {
+            'size_names': list(self.sizes),
+            'panel_data': [
+                {'name': name, 'qty': str(qty) if qty else "",
+                 'areas': [number_text(value) for value in row]}
+                for name, qty, row in zip(self.names, self.qty.tolist(), self.areas.tolist())
+            ],
+        }
+    # endregion
+
+    # region Cell updates
+    def set_name(self, row, text):
+        self.names[row] = str(text).strip()
+
+    def set_qty(self, row, text):
+        self.qty[row] = parse_qty(text)
+
+    def set_area(self, row, col, text):
+        self.areas[row, col] = parse_area(text)
+
+    def set_size(self, col, text):
+        self.sizes[col] = str(text).strip()
+    # endregion
+
+    # region Structural updates
+    def resize(self, rows, cols):
+        """Grows or truncates the grid at the end, keeping existing values."""
+        cur_rows, cur_cols = self.shape
+        if rows > cur_rows:
+            self.insert_rows(cur_rows, rows - cur_rows)
+        elif rows < cur_rows:
+            self.remove_rows(rows, cur_rows - rows)
+        if cols > cur_cols:
+            self.insert_cols(cur_cols, cols - cur_cols)
+        elif cols < cur_cols:
+            self.remove_cols(cols, cur_cols - cols)
+
+    def insert_rows(self, at, count):
+        self.names[at:at] = [""] * count
+        self.qty = np.insert(self.qty, at, np.zeros(count, dtype=np.int64))
+        self.areas = np.insert(self.areas, at, np.zeros((count, self.areas.shape[1])), axis=0)
+
+    def remove_rows(self, at, count):
+        del self.names[at:at + count]
+        self.qty = np.delete(self.qty, np.s_[at:at + count])
+        self.areas = np.delete(self.areas, np.s_[at:at + count], axis=0)
+
+    def insert_cols(self, at, count):
+        self.sizes[at:at] = [""] * count
+        self.areas = np.insert(self.areas, [at] * count, 0.0, axis=1)
+
+    def remove_cols(self, at, count):
+        del self.sizes[at:at + count]
+        self.areas = np.delete(self.areas, np.s_[at:at + count], axis=1)
+    # endregion
+
+    # region Derived values
+    def total_qty(self):
+        return int(self.qty.sum())
+
+    def area_totals(self):
+        """Quantity-weighted sewing area per size (the top table TOTAL row)."""
+        return self.qty.astype(np.float64) @ self.areas
+
+    def valid_mask(self):
+        """Panels that take part in the allocation: named and quantity > 0."""
+        named = np.fromiter((bool(n) for n in self.names), dtype=bool, count=len(self.names))
+        return named & (self.qty > 0)
+
+    def to_calculation_data(self):
+        """Same shape as the old TopTableSection.get_table_data_for_calculation()."""
+        mask = self.valid_mask()
+        return {
+            'sizes': list(self.sizes),
+            'panels': [
+                {'name': self.names[row], 'qty': int(self.qty[row]),
+                 'areas': self.areas[row].tolist()}
+                for row in np.flatnonzero(mask)
+            ]
+        }
+    # endregion
+
+
+class AllocationResult:
+    """Per-panel and total down/garment weights for one set of inputs."""
+
+    def __init__(self, sizes, names, qty, down, garment, base_col, total_base_area,
+                 show_garment):
+        self.sizes = sizes  # size header names (one per area column)
+        self.names = names  # names of the allocated (valid) panels
+        self.qty = qty  # quantity of each allocated panel
+        self.down = down  # per-panel down weight, rounded to 2 decimals (panels x sizes)
+        self.garment = garment  # per-panel garment weight, rounded to 2 decimals
+        self.base_col = base_col  # index into sizes, -1 if base size not found
+        self.total_base_area = total_base_area
+        self.show_garment = show_garment  # garment rows are only shown for weight > 0
+
+    @property
+    def down_totals(self):
+        """TOTAL DOWN WEIGHT per size: displayed per-panel values times quantity."""
+        return self.qty.astype(np.float64) @ self.down
+
+    @property
+    def garment_totals(self):
+        return self.qty.astype(np.float64) @ self.garment
+
+    def to_dict(self):
+        """Plain JSON-serialisable form (used by the allocation service)."""
+        return {
+            'sizes': list(self.sizes),
+            'base_size_index': self.base_col,
+            'total_base_area': self.total_base_area,
+            'panels': [{'name': name, 'qty': int(qty)}
+                       for name, qty in zip(self.names, self.qty.tolist())],
+            'down': self.down.tolist(),
+            'garment': self.garment.tolist() if self.show_garment else None,
+            'down_totals': self.down_totals.tolist(),
+            'garment_totals': self.garment_totals.tolist() if self.show_garment else None,
+        }
+
+
+def compute_allocation(grid, base_size, ecodown_weight, garment_weight):
+    """
+    Distributes the ecodown/garment weight over every valid panel and size in
+    proportion to sewing area, normalised by the total base size area.
+    """
+    mask = grid.valid_mask()
+    names = [grid.names[row] for row in np.flatnonzero(mask)]
+    qty = grid.qty[mask]
+    areas = grid.areas[mask]
+
+    base_size = (base_size or "").strip()
+    try:
+        base_col = grid.sizes.index(base_size) if base_size else -1
+    except ValueError:
+        base_col = -1  # Base size not found in current sizes
+
+    total_base_area = float(qty @ areas[:, base_col]) if base_col != -1 else 0.0
+
+    if total_base_area > 0:
+        # (weight / total_base_area) * qty * area, divided back by qty per panel
+        down = np.round(areas * (ecodown_weight / total_base_area), 2)
+        garment = np.round(areas * (garment_weight / total_base_area), 2)
+    else:
+        down = np.zeros_like(areas)
+        garment = np.zeros_like(areas)
+
+    return AllocationResult(list(grid.sizes), names, qty, down, garment, base_col,
+                            total_base_area, garment_weight > 0)
+
+
+def allocate_saved(top_table_data, input_data):
+    """
+    Runs an allocation straight from .dax-shaped data: `top_table_data` as
+    written by TopTableSection.save_table_content() and `input_data` as
+    written by TopInputSection.get_input_data() (only base_size,
+    ecodown_weight and garment_weight are used).
+    """
+    grid = PanelGrid.from_saved(top_table_data)
+    return compute_allocation(grid, input_data.get('base_size', ''),
+                              parse_weight(input_data.get('ecodown_weight')),
+                              parse_weight(input_data.get('garment_weight')))
@@ -0,0 +1,285 @@
+# down_allocation_app/core/allocation_service.py
+"""
+Headless local HTTP service around the allocation engine.
+
+Run with:  python -m core.allocation_service --port 8765
+
+Endpoints (localhost only, JSON in/out):
+    GET  /health    -> {"status": "ok", "cache_entries": n}
+    POST /allocate  -> body is one style payload
+                       {"top_table_data": {...}, "input_data": {...}}
+                       (the same shape as a .dax file), or a batch
+                       {"batch": [payload, ...]} -> {"results": [...]}
+
+Single requests arriving within a short window are batched together and run
+on a process pool; results are cached by payload hash, and identical
+payloads in flight at the same time are computed once.
+"""
+
+import argparse
+import asyncio
+import json
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from core.allocation_engine import allocate_saved
+from core.hashing import payload_hash
+
+HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+def allocate_payload(payload):
+    """Allocates one style payload; errors are returned, not raised, so one bad style can't fail a batch."""
+    try:
+        if not isinstance(payload, dict):
+            raise ValueError("payload must be an object")
+        return allocate_saved(payload['top_table_data'], payload.get('input_data', {})).to_dict()
+    except KeyError as e:
+        return {'error': f"missing field {e}"}
+    except (TypeError, ValueError, AttributeError) as e:
+        return {'error': f"invalid payload: {e}"}
+
+
+def allocate_batch(payloads):
+    """Worker entry point: allocates a list of payloads in one process round trip."""
+    return [allocate_payload(payload) for payload in payloads]
+
+
+class AllocationService:
+    """
+    Batching, caching front end to allocate_batch().
+
+    :param workers: process pool size; 0 computes inline on the event loop (tests, tiny loads)
+    :param batch_window: seconds to wait for more requests before dispatching a batch
+    :param max_batch: dispatch immediately once this many payloads are queued
+    :param cache_size: number of results kept (LRU)
+    """
+
+    def __init__(self, workers=None, batch_window=0.005, max_batch=64, cache_size=1024):
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # payload hash -> result dict
+        self._in_flight = {}  # payload hash -> future shared by identical requests
+        self._pending = []  # (hash, payload, future) waiting for the next batch
+        self._flush_handle = None
+        self._executor = ProcessPoolExecutor(workers) if workers != 0 else None
+
+    def close(self):
+        if self._executor:
+            self._executor.shutdown(cancel_futures=True)
+
+    @property
+    def cache_entries(self):
+        return len(self._cache)
+
+    async def allocate(self, payload):
+        key = payload_hash(payload)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        if key in self._in_flight:
+            return await asyncio.shield(self._in_flight[key])
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._in_flight[key] = future
+        self._pending.append((key, payload, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await asyncio.shield(future)
+
+    async def allocate_many(self, payloads):
+        """Allocates a client batch; members join the same dispatch batches as single requests."""
+        return list(await asyncio.gather(*(self.allocate(payload) for payload in payloads)))
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        payloads = [payload for _key, payload, _future in batch]
+        # Errors raised here (inline allocation, or e.g. BrokenProcessPool on submit) must
+        # still resolve the batch, or its keys stay in _in_flight with futures that never finish
+        try:
+            if self._executor is None:
+                results = allocate_batch(payloads)
+            else:
+                task = asyncio.get_running_loop().run_in_executor(self._executor, allocate_batch, payloads)
+        except Exception as e:
+            self._resolve(batch, error=e)
+            return
+        if self._executor is None:
+            self._resolve(batch, results=results)
+            return
+        task.add_done_callback(lambda done: self._on_batch_done(batch, done))
+
+    def _on_batch_done(self, batch, done):
+        if done.cancelled():
+            self._resolve(batch, error=asyncio.CancelledError())
+        elif done.exception() is not None:
+            self._resolve(batch, error=done.exception())
+        else:
+            self._resolve(batch, results=done.result())
+
+    def _resolve(self, batch, results=None, error=None):
+        for index, (key, _payload, future) in enumerate(batch):
+            self._in_flight.pop(key, None)
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+                continue
+            result = results[index]
+            if 'error' not in result:
+                self._store(key, result)
+            future.set_result(result)
+
+    def _store(self, key, result):
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+class AllocationHttpServer:
+    """Minimal HTTP/1.1 (keep-alive, Content-Length bodies) front end for AllocationService."""
+
+    def __init__(self, service, port=DEFAULT_PORT):
+        self.service = service
+        self.port = port
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_connection, HOST, self.port)
+        # Port 0 picks a free port; report the real one
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, response = await self._dispatch(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                self._write_response(writer, status, response, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except ValueError as e:  # Malformed request line/headers or oversized body
+            status = 413 if "too large" in str(e) else 400
+            self._write_response(writer, status, {'error': str(e)}, keep_alive=False)
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader):
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3:
+            raise ValueError("malformed request line")
+        method, path, _version = parts
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get('content-length', 0) or 0)
+        if length > MAX_BODY_BYTES:
+            raise ValueError("request body too large")
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), path.split('?', 1)[0], headers, body
+
+    async def _dispatch(self, method, path, body):
+        if path == '/health':
+            if method != 'GET':
+                return 405, {'error': "use GET"}
+            return 200, {'status': 'ok', 'cache_entries': self.service.cache_entries}
+        if path != '/allocate':
+            return 404, {'error': f"unknown path {path}"}
+        if method != 'POST':
+            return 405, {'error': "use POST"}
+
+        try:
+            payload = json.loads(body or b'null')
+        except ValueError as e:
+            return 400, {'error': f"invalid JSON: {e}"}
+        try:
+            if isinstance(payload, dict) and 'batch' in payload:
+                if not isinstance(payload['batch'], list):
+                    return 400, {'error': "'batch' must be a list"}
+                return 200, {'results': await self.service.allocate_many(payload['batch'])}
+            result = await self.service.allocate(payload)
+        except Exception as e:  # Worker crash or pool shutdown
+            return 500, {'error': str(e)}
+        return (400 if 'error' in result else 200), result
+
+    @staticmethod
+    def _write_response(writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+
+
+async def run_server(port=DEFAULT_PORT, workers=None, batch_window=0.005, max_batch=64,
+                     cache_size=1024):
+    service = AllocationService(workers, batch_window, max_batch, cache_size)
+    server = await AllocationHttpServer(service, port).start()
+    print(f"Allocation service listening on http://{HOST}:{server.port}")
+    try:
+        await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local down allocation HTTP service")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="process pool size (default: CPU count, 0: compute inline)")
+    parser.add_argument('--batch-window-ms', type=float, default=5.0)
+    parser.add_argument('--max-batch', type=int, default=64)
+    parser.add_argument('--cache-size', type=int, default=1024)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(run_server(args.port, args.workers, args.batch_window_ms / 1000.0,
+                               args.max_batch, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+# down_allocation_app/core/cad_import.py
+"""
+Pattern piece import from CAD exports: sewing area per panel and size.
+
+Two sources are read, both streamed so large markers never sit in memory
+as text:
+
+* DXF (AAMA/ASTM style pattern exports or plain drawings). Each BLOCK is a
+  piece: its boundary is the largest closed polyline (layer "1" preferred),
+  name and size come from "Piece Name:" / "Size:" text, falling back to the
+  block name. Polylines outside blocks are pieces named by their layer,
+  "FRONT_M" or "FRONT-M" meaning panel FRONT, size M. Arc bulges are taken
+  as straight edges.
+* Polygon CSV with a header row and columns piece (or panel/name), size,
+  x, y and optionally part; consecutive rows with the same piece/size/part
+  are the vertices of one piece.
+
+All vertices end up in two flat coordinate arrays with per-piece offsets,
+so every area is computed in one vectorised shoelace pass.
+"""
+
+import csv
+from array import array
+
+import numpy as np
+
+# DXF $INSUNITS code -> drawing unit
+DXF_UNITS = {1: 'in', 4: 'mm', 5: 'cm', 6: 'm'}
+# Length of one drawing unit in centimetres / one area unit in square centimetres
+UNIT_TO_CM = {'mm': 0.1, 'cm': 1.0, 'm': 100.0, 'in': 2.54}
+AREA_UNIT_TO_CM2 = {'cm²': 1.0, 'in²': 2.54 ** 2, 'mm²': 0.01}
+
+
+class PieceSet:
+    """Pattern pieces as flat vertex arrays: piece i is x/y[offsets[i]:offsets[i + 1]]."""
+
+    def __init__(self, names, sizes, x, y, offsets, units=None):
+        self.names = names
+        self.sizes = sizes
+        self.x = x
+        self.y = y
+        self.offsets = offsets
+        self.units = units  # drawing unit from the file, if it says ('mm', 'cm', 'in', 'm')
+
+    def __len__(self):
+        return len(self.names)
+
+    def areas(self):
+        return polygon_areas(self.x, self.y, self.offsets)
+
+
+class _PieceBuilder:
+    """Accumulates pieces into typed arrays while a file is streamed."""
+
+    def __init__(self):
+        self.names = []
+        self.sizes = []
+        self.lengths = array('q')
+        self.x = array('d')
+        self.y = array('d')
+
+    def add(self, name, size, xs, ys):
+        if len(xs) < 3:
+            return  # Not a polygon
+        self.names.append(name.strip().upper())
+        self.sizes.append(size.strip().upper())
+        self.lengths.append(len(xs))
+        self.x.extend(xs)
+        self.y.extend(ys)
+
+    def build(self, units=None):
+        offsets = np.zeros(len(self.lengths) + 1, dtype=np.intp)
+        np.cumsum(np.frombuffer(self.lengths, dtype=np.int64), out=offsets[1:])
+        return PieceSet(self.names, self.sizes, np.frombuffer(self.x, dtype=np.float64),
+                        np.frombuffer(self.y, dtype=np.float64), offsets, units)
+
+
+def polygon_areas(x, y, offsets):
+    """Shoelace area of every piece at once; each piece needs at least 3 vertices."""
+    if len(offsets) < 2:
+        return np.zeros(0)
+    starts = offsets[:-1]
+    # Index of the next vertex, wrapping each piece's last vertex to its first
+    following = np.arange(1, len(x) + 1)
+    following[offsets[1:] - 1] = starts
+    cross = x * y[following] - x[following] * y
+    return np.abs(np.add.reduceat(cross, starts)) / 2.0
+
+
+# region CSV
+def read_polygon_csv(path):
+    builder = _PieceBuilder()
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = [h.strip().lower() for h in next(reader, [])]
+
+        def column(*names):
+            for name in names:
+                if name in header:
+                    return header.index(name)
+            return None
+
+        name_col = column('piece', 'panel', 'name')
+        size_col, x_col, y_col, part_col = column('size'), column('x'), column('y'), column('part')
+        if name_col is None or x_col is None or y_col is None:
+            raise ValueError("CSV needs piece, x and y columns")
+
+        width = max(col for col in (name_col, size_col, x_col, y_col, part_col) if col is not None) + 1
+        key, xs, ys = None, [], []
+        try:
+            for line_no, row in enumerate(reader, start=2):
+                if not row or not any(cell.strip() for cell in row):
+                    continue
+                if len(row) < width:
+                    raise ValueError(f"line {line_no}: expected {width} columns, found {len(row)}")
+                row_key = (row[name_col], row[size_col] if size_col is not None else "",
+                           row[part_col] if part_col is not None else "")
+                if row_key != key:
+                    if key is not None:
+                        builder.add(key[0], key[1], xs, ys)
+                    key, xs, ys = row_key, [], []
+                try:
+                    xs.append(float(row[x_col]))
+                    ys.append(float(row[y_col]))
+                except ValueError:
+                    raise ValueError(f"line {line_no}: invalid coordinates") from None
+        except csv.Error as e:
+            raise ValueError(f"line {reader.line_num}: {e}") from None
+        if key is not None:
+            builder.add(key[0], key[1], xs, ys)
+    return builder.build()
+# endregion
+
+
+# region DXF
+def _dxf_pairs(f):
+    """Yields (group code, value) pairs from an ASCII DXF stream."""
+    while True:
+        code = f.readline()
+        value = f.readline()
+        if not code or not value:
+            return
+        try:
+            yield int(code), value.strip()
+        except ValueError:
+            raise ValueError(f"invalid DXF group code {code.strip()!r}") from None
+
+
+def _split_layer(layer):
+    """'FRONT_M' / 'FRONT-M' -> ('FRONT', 'M'); a layer without a separator is a name only."""
+    for separator in ('_', '-'):
+        name, sep, size = layer.rpartition(separator)
+        if sep and name and size:
+            return name, size
+    return layer, ""
+
+
+def _labelled(texts, label):
+    """Value of a 'Label: value' text line, or None."""
+    for text in texts:
+        head, sep, value = text.partition(':')
+        if sep and head.strip().lower() == label:
+            return value.strip()
+    return None
+
+
+class _DxfReader:
+    def __init__(self):
+        self.builder = _PieceBuilder()
+        self.units = None
+        self.section = None
+        self.block = None  # {'name', 'polylines': [(layer, xs, ys)], 'texts'} while inside a BLOCK
+        self.entity = None
+        self.polyline = None  # Open POLYLINE collecting VERTEX entities
+
+    def read(self, f):
+        variable = None
+        for code, value in _dxf_pairs(f):
+            if code == 0:
+                self._finish_entity()
+                self._start_entity(value)
+                continue
+            entity = self.entity
+            if entity is None:
+                continue
+            kind = entity['type']
+            if kind == 'SECTION' and code == 2 and self.section is None:
+                self.section = value
+            elif self.section == 'HEADER':
+                if code == 9:
+                    variable = value
+                elif variable == '$INSUNITS' and code == 70:
+                    self.units = DXF_UNITS.get(int(value))
+            elif code == 8:
+                entity['layer'] = value
+            elif code == 10:
+                entity['x'].append(float(value))
+            elif code == 20:
+                entity['y'].append(float(value))
+            elif code == 1:
+                entity['text'] = value
+            elif code == 2 and kind == 'BLOCK':
+                entity['name'] = value
+        self._finish_entity()
+        return self.builder.build(self.units)
+
+    def _start_entity(self, kind):
+        if kind == 'ENDSEC':
+            self.section = None
+        elif kind == 'ENDBLK':
+            self._finish_block()
+        self.entity = {'type': kind, 'layer': "", 'x': [], 'y': [], 'text': "", 'name': ""}
+
+    def _finish_entity(self):
+        entity = self.entity
+        if entity is None:
+            return
+        kind = entity['type']
+        if kind == 'BLOCK':
+            self.block = {'name': entity['name'], 'polylines': [], 'texts': []}
+        elif kind == 'LWPOLYLINE':
+            self._add_polyline(entity['layer'], entity['x'], entity['y'])
+        elif kind == 'POLYLINE':
+            # The POLYLINE's own 10/20 is a dummy point; vertices follow as VERTEX entities
+            self.polyline = dict(entity, x=[], y=[])
+        elif kind == 'VERTEX' and self.polyline is not None:
+            self.polyline['x'].extend(entity['x'])
+            self.polyline['y'].extend(entity['y'])
+        elif kind == 'SEQEND' and self.polyline is not None:
+            self._add_polyline(self.polyline['layer'], self.polyline['x'], self.polyline['y'])
+            self.polyline = None
+        elif kind in ('TEXT', 'MTEXT') and self.block is not None:
+            self.block['texts'].append(entity['text'])
+        self.entity = None
+
+    def _add_polyline(self, layer, xs, ys):
+        if self.block is not None:
+            self.block['polylines'].append((layer, xs, ys))
+        elif self.section == 'ENTITIES':
+            name, size = _split_layer(layer)
+            self.builder.add(name, size, xs, ys)
+
+    def _finish_block(self):
+        block, self.block = self.block, None
+        if block is None or block['name'].startswith('*') or not block['polylines']:
+            return  # Model/paper space blocks and annotation-only blocks are not pieces
+        candidates = [p for p in block['polylines'] if p[0] == '1'] or block['polylines']
+        candidates = [p for p in candidates if len(p[1]) >= 3]
+        if not candidates:
+            return
+        layer, xs, ys = max(candidates, key=lambda p: _single_area(p[1], p[2]))
+        name = _labelled(block['texts'], 'piece name') or block['name']
+        size = _labelled(block['texts'], 'size') or ""
+        self.builder.add(name, size, xs, ys)
+
+
+def _single_area(xs, ys):
+    x = np.asarray(xs)
+    y = np.asarray(ys)
+    return abs(float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))) / 2.0
+
+
+def read_dxf(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return _DxfReader().read(f)
+# endregion
+
+
+class CadImport:
+    """Pieces grouped into a panel x size area matrix ready for the top table."""
+
+    def __init__(self, names, sizes, areas, qty, piece_count):
+        self.names = names  # panel names, in first-seen order
+        self.sizes = sizes  # size names, in first-seen order
+        self.areas = areas  # panels x sizes mean piece area, NaN where no piece was found
+        self.qty = qty  # pieces per panel (the most found for any one size)
+        self.piece_count = piece_count
+        self.rejected = []  # [(panel index, size index, area)] left out by reject_above()
+
+    def reject_above(self, max_area):
+        """Blanks (NaN) the areas above `max_area` and records them in `rejected`."""
+        with np.errstate(invalid='ignore'):
+            over = self.areas > max_area
+        self.rejected = [(int(row), int(col), float(self.areas[row, col])) for row, col in zip(*np.nonzero(over))]
+        self.areas[over] = np.nan
+
+
+def group_pieces(pieces, areas, default_size=""):
+    """Averages piece areas per (panel, size); pieces without a size go to `default_size`."""
+    names = list(dict.fromkeys(pieces.names))
+    piece_sizes = [size or default_size for size in pieces.sizes]
+    sizes = list(dict.fromkeys(piece_sizes))
+    name_index = {name: i for i, name in enumerate(names)}
+    size_index = {size: i for i, size in enumerate(sizes)}
+
+    rows = np.fromiter((name_index[n] for n in pieces.names), dtype=np.intp, count=len(pieces))
+    cols = np.fromiter((size_index[s] for s in piece_sizes), dtype=np.intp, count=len(pieces))
+    sums = np.zeros((len(names), len(sizes)))
+    counts = np.zeros((len(names), len(sizes)), dtype=np.int64)
+    np.add.at(sums, (rows, cols), areas)
+    np.add.at(counts, (rows, cols), 1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(counts > 0, sums / counts, np.nan)
+    qty = counts.max(axis=1) if len(sizes) else np.zeros(len(names), dtype=np.int64)
+    return CadImport(names, sizes, means, qty, len(pieces))
+
+
+def import_pattern(path, drawing_unit=None, area_unit='cm²', default_size="", max_area=None):
+    """
+    Reads a .dxf or polygon .csv file and returns a CadImport with areas in
+    `area_unit`. `drawing_unit` overrides the unit declared by the file
+    (DXF $INSUNITS); without either, coordinates are taken as centimetres.
+    Areas above `max_area` (usually a wrong unit) are left out, see
+    CadImport.reject_above().
+    """
+    if path.lower().endswith('.dxf'):
+        pieces = read_dxf(path)
+    else:
+        pieces = read_polygon_csv(path)
+    unit = drawing_unit or pieces.units or 'cm'
+    scale = UNIT_TO_CM[unit] ** 2 / AREA_UNIT_TO_CM2[area_unit]
+    result = group_pieces(pieces, pieces.areas() * scale, default_size)
+    if max_area is not None:
+        result.reject_above(max_area)
+    return result
@@ -0,0 +1,126 @@
+# down_allocation_app/core/cell_block.py
+"""
+Typed rectangular block of top table cells, as published on the clipboard.
+
+A block keeps the kind of every column it covers (panel name, quantity,
+sewing area) so another table or another instance can paste it without
+parsing and validating text: names and size headers are strings,
+quantities an int32 vector and areas a float64 matrix (NaN for blank).
+"""
+
+import json
+import struct
+
+import numpy as np
+
+MIME_TYPE = "application/x-down-allocation-cells"
+_MAGIC = b"DAXCELLS"
+_VERSION = 1
+# Magic, version, meta length, data rows, area columns
+_HEADER = struct.Struct("<8sHIII")
+
+
+class CellBlock:
+    """
+    Cells copied from the top table, in table coordinates: `first_row` is 1
+    if the block starts on the size header row (then `sizes` holds the
+    headers of its size columns), otherwise a data row; `first_col` 0/1/2+
+    says whether it starts on the name, quantity or an area column.
+    """
+
+    def __init__(self, first_row, first_col, col_count, names=None, qty=None, areas=None, sizes=None):
+        self.first_row = first_row
+        self.first_col = first_col
+        self.col_count = col_count
+        self.names = names  # list, if column 0 is covered
+        self.qty = qty  # int32 vector, if column 1 is covered
+        self.areas = areas  # float64 (rows x area columns), if area columns are covered
+        self.sizes = sizes  # list, if the size header row is covered
+
+    @property
+    def data_rows(self):
+        for column in (self.names, self.qty, self.areas):
+            if column is not None:
+                return len(column)
+        return 0
+
+    @property
+    def row_count(self):
+        return self.data_rows + (1 if self.sizes is not None else 0)
+
+    @classmethod
+    def from_texts(cls, first_row, first_col, texts):
+        """
+        Block from cell texts (a list of rows). Returns None if the block
+        covers cells that are not names, quantities, areas or size headers,
+        or holds text that is not a valid number in a numeric column (or a
+        quantity out of int32 range); the copy then falls back to plain text.
+        """
+        if first_row < 1 or not texts:
+            return None
+        col_count = len(texts[0])
+        sizes = None
+        if first_row == 1:
+            sizes = [str(text).strip().upper() for text in texts[0][max(0, 2 - first_col):]]
+            texts = texts[1:]
+        rows = len(texts)
+        names = qty = areas = None
+        offset = 0
+        try:
+            if first_col == 0:
+                names = [str(row[0]).strip().upper() for row in texts]
+                offset = 1
+            if first_col <= 1 and col_count > offset:
+                column = [str(row[offset]).strip() for row in texts]
+                if not all(text.isdigit() or not text for text in column):
+                    return None
+                qty = np.array([int(text) if text else 0 for text in column], dtype=np.int32)
+                offset += 1
+            area_texts = [row[offset:] for row in texts]
+            if col_count > offset:
+                areas = np.array([[float(text) if str(text).strip() else np.nan for text in row]
+                                  for row in area_texts], dtype=np.float64).reshape(rows, col_count - offset)
+        except (ValueError, OverflowError):  # e.g. a quantity too large for int32
+            return None
+        if areas is not None and not np.isfinite(areas[~np.isnan(areas)]).all():
+            return None
+        return cls(first_row, first_col, col_count, names, qty, areas, sizes)
+
+    # region Serialization
+    def encode(self):
+        meta = {'first_row': self.first_row, 'first_col': self.first_col, 'col_count': self.col_count,
+                'names': self.names, 'sizes': self.sizes, 'has_qty': self.qty is not None}
+        meta_bytes = json.dumps(meta).encode('utf-8')
+        parts = [_HEADER.pack(_MAGIC, _VERSION, len(meta_bytes), self.data_rows,
+                              self.areas.shape[1] if self.areas is not None else 0), meta_bytes]
+        if self.qty is not None:
+            parts.append(np.ascontiguousarray(self.qty, dtype='<i4').tobytes())
+        if self.areas is not None:
+            parts.append(np.ascontiguousarray(self.areas, dtype='<f8').tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, data):
+        """Inverse of encode(); raises ValueError on anything else."""
+        data = bytes(data)
+        if len(data) < _HEADER.size:
+            raise ValueError("truncated cell block")
+        magic, version, meta_length, rows, area_cols = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("not a cell block of this version")
+        offset = _HEADER.size
+        meta = json.loads(data[offset:offset + meta_length].decode('utf-8'))
+        offset += meta_length
+        qty = areas = None
+        try:
+            if meta['has_qty']:
+                qty = np.frombuffer(data, dtype='<i4', count=rows, offset=offset).astype(np.int32)
+                offset += 4 * rows
+            if area_cols:
+                areas = np.frombuffer(data, dtype='<f8', count=rows * area_cols,
+                                      offset=offset).reshape(rows, area_cols).copy()
+        except ValueError as e:  # Buffer shorter than the header says
+            raise ValueError(f"truncated cell block: {e}") from e
+        return cls(meta['first_row'], meta['first_col'], meta['col_count'], meta['names'], qty, areas,
+                   meta['sizes'])
+    # endregion
@@ -0,0 +1,72 @@
+# down_allocation_app/core/document.py
+
+import os
+
+# Title of a document that has neither a file nor a style
+UNTITLED = "Untitled"
+
+
+class Document:
+    """
+    One open project in the tabbed workspace.
+
+    Only the active document lives in the section widgets; every other tab is
+    parked here as a PanelGrid (names, qty vector, area matrix) plus its input
+    fields, grading rules, factory info and the baseline its unsaved-changes
+    check compares against. Parking drops the undo history along with the table widgets.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.input_data = {}
+        self.grid = None  # None while the document is active (the widgets hold it)
+        self.grading_rules = {}
+        self.factory_info = {}  # {'name', 'location'} as saved in the .dax
+        self.counts = None  # (panel rows, size columns) of the table
+        # Unsaved-changes baseline: inputs and counts at the last save/load, and
+        # whether the table had been edited since
+        self.clean_input_data = None
+        self.clean_counts = None
+        self.table_dirty = False
+
+    @property
+    def parked(self):
+        return self.grid is not None
+
+    @property
+    def dirty(self):
+        if not self.parked:
+            return False  # The active document's state is in the widgets
+        return (self.table_dirty or self.input_data != self.clean_input_data
+                or self.counts != self.clean_counts)
+
+    def title(self):
+        if self.path:
+            return os.path.splitext(os.path.basename(self.path))[0]
+        return self.input_data.get('style', '').strip() or UNTITLED
+
+    def park(self, path, input_data, grid, grading_rules, factory_info, counts, clean_input_data,
+             clean_counts, table_dirty):
+        """Stores the state read out of the widgets when the tab is deactivated."""
+        self.path = path
+        self.input_data = dict(input_data)
+        self.grid = grid.copy()
+        self.grading_rules = grading_rules
+        self.factory_info = dict(factory_info)
+        self.counts = counts
+        self.clean_input_data = clean_input_data
+        self.clean_counts = clean_counts
+        self.table_dirty = table_dirty
+
+    def unpark(self):
+        """.dax-shaped data to load into the widgets; the parked arrays are released."""
+        project_data = {
+            'input_data': dict(self.input_data),
+            'top_table_data': self.grid.to_saved(),
+            'grading_rules': self.grading_rules,
+            'factory_info': dict(self.factory_info),
+            'adjust_table_counts': {'rows': int(self.counts[0]), 'cols': int(self.counts[1])},
+        }
+        self.grid = None
+        return project_data
+
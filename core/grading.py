@@ -0,0 +1,119 @@
+# down_allocation_app/core/grading.py
+
+import numpy as np
+
+GRADE_NONE = 'none'
+GRADE_LINEAR = 'linear'  # fixed area increment per size step
+GRADE_PERCENT = 'percent'  # percentage of the base area per size step
+GRADE_TABLE = 'table'  # explicit multiplier of the base area per size name
+GRADE_KINDS = (GRADE_NONE, GRADE_LINEAR, GRADE_PERCENT, GRADE_TABLE)
+
+
+class GradeRule:
+    """How one panel's sewing area grows or shrinks away from the base size."""
+
+    def __init__(self, kind=GRADE_NONE, value=0.0, table=None):
+        if kind not in GRADE_KINDS:
+            raise ValueError(f"unknown grade rule '{kind}'")
+        self.kind = kind
+        self.value = float(value)  # increment (linear) or percent per size step
+        self.table = dict(table or {})  # size name -> multiplier of the base area (table)
+
+    def to_dict(self):
+        data = {'kind': self.kind}
+        if self.kind == GRADE_TABLE:
+            data['table'] = dict(self.table)
+        elif self.kind != GRADE_NONE:
+            data['value'] = self.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('kind', GRADE_NONE), data.get('value', 0.0),
+                   {str(k).strip().upper(): float(v) for k, v in data.get('table', {}).items()})
+
+    def to_text(self):
+        """Value as typed in the grading dialog."""
+        if self.kind == GRADE_TABLE:
+            return ", ".join(f"{size}:{factor:g}" for size, factor in self.table.items())
+        return f"{self.value:g}" if self.kind != GRADE_NONE else ""
+
+    @classmethod
+    def from_text(cls, kind, text):
+        """Parses the dialog's value field: a number, or "S:0.9, M:1, L:1.1" for tables."""
+        text = (text or "").strip()
+        if kind == GRADE_NONE:
+            return cls()
+        if kind != GRADE_TABLE:
+            return cls(kind, float(text or 0))
+        table = {}
+        for token in text.replace(',', ' ').split():
+            size, sep, factor = token.partition(':')
+            if not sep or not size:
+                raise ValueError(f"'{token}' must be SIZE:FACTOR")
+            table[size.strip().upper()] = float(factor)
+        return cls(kind, table=table)
+
+
+class GradingRules:
+    """Grade rules of a style keyed by panel name; panels without a rule are left alone."""
+
+    def __init__(self, rules=None):
+        self.rules = dict(rules or {})
+
+    def __bool__(self):
+        return any(rule.kind != GRADE_NONE for rule in self.rules.values())
+
+    def get(self, panel_name):
+        return self.rules.get(panel_name)
+
+    def set(self, panel_name, rule):
+        if rule is None or rule.kind == GRADE_NONE:
+            self.rules.pop(panel_name, None)
+        else:
+            self.rules[panel_name] = rule
+
+    def to_dict(self):
+        return {name: rule.to_dict() for name, rule in self.rules.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls({name: GradeRule.from_dict(rule) for name, rule in (data or {}).items()})
+
+
+def grade_areas(base_areas, base_col, sizes, rules, max_area=None):
+    """
+    Generates the panel x size area matrix from each panel's base size area.
+
+    Size steps follow column order: the column k places right of the base
+    column is k steps up. `rules` has one GradeRule (or None) per panel.
+    Returns (areas, graded): `areas` is rounded to 2 decimals and NaN where
+    a cell should be left as it is (the base column, unnamed size columns,
+    ungraded panels, table rules without a factor for that size); `graded` flags the panels that
+    have a rule.
+    """
+    base_areas = np.asarray(base_areas, dtype=np.float64)
+    panels, cols = len(base_areas), len(sizes)
+
+    kinds = np.array([rule.kind if rule else GRADE_NONE for rule in rules], dtype=object)
+    values = np.array([rule.value if rule else 0.0 for rule in rules], dtype=np.float64)
+    factors = np.full((panels, cols), np.nan)
+    for row, rule in enumerate(rules):
+        if rule and rule.kind == GRADE_TABLE:
+            factors[row] = [rule.table.get(size, np.nan) for size in sizes]
+
+    steps = np.arange(cols, dtype=np.float64) - base_col
+    base = base_areas[:, None]
+    linear = base + values[:, None] * steps
+    percent = base * (1.0 + values[:, None] / 100.0 * steps)
+    table = base * factors
+
+    areas = np.select(
+        [(kinds == GRADE_LINEAR)[:, None], (kinds == GRADE_PERCENT)[:, None],
+         (kinds == GRADE_TABLE)[:, None]],
+        [linear, percent, table], default=np.nan)
+    areas = np.round(np.clip(areas, 0.0, max_area), 2)
+    # The base column is the input, never rewritten
+    areas[:, base_col] = np.nan
+    areas[:, [not size for size in sizes]] = np.nan
+    return areas, kinds != GRADE_NONE
@@ -0,0 +1,14 @@
+# down_allocation_app/core/hashing.py
+
+import hashlib
+import json
+
+
+def canonical_json(obj):
+    """Stable JSON text for `obj`: sorted keys, no whitespace, so equal data hashes equally."""
+    return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def payload_hash(obj):
+    """SHA-256 hex digest of the canonical JSON form of `obj`."""
+    return hashlib.sha256(canonical_json(obj).encode('utf-8')).hexdigest()
@@ -0,0 +1,78 @@
+# down_allocation_app/core/panel_filter.py
+"""
+Row filter for the top table: which panels match a name search, have
+missing sewing areas or exceed a quantity. Evaluated over the PanelGrid
+mirror, so a whole table is a few array operations and a single edited row
+can be re-checked on its own.
+"""
+
+import re
+
+import numpy as np
+
+
+class PanelFilter:
+    """
+    Criteria combined with AND; unset criteria match every row. `text`
+    matches panel names as a case-insensitive substring, or as a regular
+    expression if `regex` is set (an invalid pattern raises ValueError).
+    `missing_areas` keeps named panels with a blank area under any named
+    size; `min_qty` keeps panels whose quantity is greater than it.
+    """
+
+    def __init__(self, text="", regex=False, missing_areas=False, min_qty=None):
+        self.text = text.strip()
+        self.regex = regex
+        self.missing_areas = missing_areas
+        self.min_qty = min_qty
+        self.pattern = None
+        if self.text and regex:
+            try:
+                self.pattern = re.compile(self.text, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid pattern: {e}") from e
+
+    @property
+    def active(self):
+        return bool(self.text) or self.missing_areas or self.min_qty is not None
+
+    def _name_matches(self, name):
+        if self.pattern is not None:
+            return self.pattern.search(name) is not None
+        return self.text.upper() in name.upper()
+
+    def mask(self, grid):
+        """Boolean vector over the grid's data rows: True where the panel matches."""
+        rows = len(grid.names)
+        keep = np.ones(rows, dtype=bool)
+        if self.text:
+            if self.pattern is not None:
+                keep &= np.fromiter((self._name_matches(name) for name in grid.names), dtype=bool, count=rows)
+            else:
+                names = np.array(grid.names, dtype=str) if rows else np.array([], dtype=str)
+                keep &= np.char.find(np.char.upper(names), self.text.upper()) >= 0
+        if self.missing_areas:
+            keep &= self._missing_areas(grid)
+        if self.min_qty is not None:
+            keep &= grid.qty > self.min_qty
+        return keep
+
+    def row_matches(self, grid, row):
+        """mask(grid)[row] without evaluating the other rows (after a single cell edit)."""
+        if self.text and not self._name_matches(grid.names[row]):
+            return False
+        if self.missing_areas and not self._missing_areas(grid, row)[0]:
+            return False
+        if self.min_qty is not None and grid.qty[row] <= self.min_qty:
+            return False
+        return True
+
+    @staticmethod
+    def _missing_areas(grid, row=None):
+        sized = np.array([bool(size) for size in grid.sizes], dtype=bool)
+        areas = grid.areas if row is None else grid.areas[row:row + 1]
+        names = grid.names if row is None else grid.names[row:row + 1]
+        named = np.array([bool(name) for name in names], dtype=bool)
+        if not sized.any():
+            return np.zeros(len(names), dtype=bool)
+        return named & (areas[:, sized] == 0).any(axis=1)
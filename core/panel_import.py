@@ -0,0 +1,216 @@
+# down_allocation_app/core/panel_import.py
+"""
+Streaming import of panel sheets (BOM exports) from .xlsx or .csv.
+
+Rows are read one at a time (openpyxl read-only mode / csv module), mapped
+to panel name, quantity and size area columns through a MappingProfile,
+and validated in bulk once the columns are collected as arrays.
+"""
+
+import csv
+import math
+import re
+from contextlib import closing
+
+import numpy as np
+
+_NAME_HEADER = re.compile(r'^(panel|panel name|name|part|piece|component)$', re.IGNORECASE)
+_QTY_HEADER = re.compile(r'^(qty|quantity|panel qty|pcs|count)$', re.IGNORECASE)
+
+
+class MappingProfile:
+    """
+    Which sheet columns hold what, by header text (so a profile survives
+    columns being reordered). `size_columns` maps header -> size name; an
+    empty mapping takes every other non-empty header as a size.
+    """
+
+    def __init__(self, header_row=1, name_column="", qty_column="", size_columns=None,
+                 sheet=""):
+        self.header_row = int(header_row)  # 1-based row holding the column headers
+        self.name_column = name_column
+        self.qty_column = qty_column
+        self.size_columns = dict(size_columns or {})
+        self.sheet = sheet  # worksheet name for .xlsx; empty for the first sheet
+
+    def to_dict(self):
+        return {'header_row': self.header_row, 'name_column': self.name_column,
+                'qty_column': self.qty_column, 'size_columns': dict(self.size_columns),
+                'sheet': self.sheet}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('header_row', 1), data.get('name_column', ""),
+                   data.get('qty_column', ""), data.get('size_columns'), data.get('sheet', ""))
+
+    @classmethod
+    def guess(cls, headers, header_row=1, sheet=""):
+        """Profile from common header names: PANEL/NAME, QTY, everything else a size."""
+        name_column = next((h for h in headers if _NAME_HEADER.match(h)), "")
+        qty_column = next((h for h in headers if _QTY_HEADER.match(h)), "")
+        sizes = {h: h.upper() for h in headers if h and h not in (name_column, qty_column)}
+        return cls(header_row, name_column, qty_column, sizes, sheet)
+
+
+# region Reading
+def sheet_names(path):
+    """Worksheet names of an .xlsx file ([] for csv)."""
+    if not path.lower().endswith('.xlsx'):
+        return []
+    workbook = _open_workbook(path)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def _open_workbook(path):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("reading .xlsx files needs openpyxl: pip install openpyxl") from None
+    return load_workbook(path, read_only=True, data_only=True)
+
+
+def _cell_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def iter_rows(path, sheet=""):
+    """Yields every row of the sheet as a list of strings, streaming the file."""
+    if path.lower().endswith('.xlsx'):
+        workbook = _open_workbook(path)
+        try:
+            worksheet = workbook[sheet] if sheet else workbook.worksheets[0]
+            for row in worksheet.iter_rows(values_only=True):
+                yield [_cell_text(value) for value in row]
+        finally:
+            workbook.close()
+    else:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            sample = f.read(4096)
+            f.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+            except csv.Error:
+                dialect = csv.excel
+            for row in csv.reader(f, dialect):
+                yield [cell.strip() for cell in row]
+
+
+def read_headers(path, header_row=1, sheet=""):
+    with closing(iter_rows(path, sheet)) as rows:
+        for row_no, row in enumerate(rows, start=1):
+            if row_no == header_row:
+                return row
+    return []
+# endregion
+
+
+class PanelImport:
+    """Validated panel sheet: names, quantities and a panel x size area matrix."""
+
+    def __init__(self, names, qty, sizes, areas, issues, source_rows):
+        self.names = names
+        self.qty = qty  # int array, 0 where missing/invalid
+        self.sizes = sizes
+        self.areas = areas  # float matrix, 0 where missing/invalid
+        self.issues = issues  # [(sheet row number, message)]
+        self.source_rows = source_rows  # sheet row number of each panel
+
+    def to_saved(self):
+        """TopTableSection.save_table_content() shaped data for a batched restore."""
+        return {
+            'size_names': list(self.sizes),
+            'panel_data': [
+                {'name': name, 'qty': str(qty) if qty else "",
+                 'areas': [f"{a:.2f}".rstrip('0').rstrip('.') if a else "" for a in row]}
+                for name, qty, row in zip(self.names, self.qty.tolist(), self.areas.tolist())
+            ],
+        }
+
+
+def read_panel_sheet(path, profile, max_qty, max_area):
+    """
+    Streams the sheet and returns a PanelImport. Rows without a panel name
+    are skipped; quantities outside 1..max_qty and areas that are not
+    numbers in 0..max_area are blanked and reported in `issues`.
+    """
+    with closing(iter_rows(path, profile.sheet)) as rows:
+        return _read_mapped(rows, profile, max_qty, max_area)
+
+
+def _read_mapped(rows, profile, max_qty, max_area):
+    headers = []
+    for row_no, row in enumerate(rows, start=1):
+        if row_no == profile.header_row:
+            headers = row
+            break
+    if not headers:
+        raise ValueError(f"header row {profile.header_row} not found")
+
+    def index_of(header):
+        try:
+            return headers.index(header)
+        except ValueError:
+            raise ValueError(f"column '{header}' not found in the header row") from None
+
+    if not profile.name_column:
+        raise ValueError("no panel name column mapped")
+    name_index = index_of(profile.name_column)
+    qty_index = index_of(profile.qty_column) if profile.qty_column else None
+    size_map = profile.size_columns or MappingProfile.guess(headers).size_columns
+    size_indexes = [index_of(header) for header in size_map]
+    sizes = [size.strip().upper() for size in size_map.values()]
+
+    # Collect raw columns while streaming; validation happens on whole arrays below
+    names, qty_text, area_text, source_rows = [], [], [], []
+    width = len(headers)
+    for row_no, row in enumerate(rows, start=profile.header_row + 1):
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        name = row[name_index].upper()
+        if not name:
+            continue
+        names.append(name)
+        qty_text.append(row[qty_index] if qty_index is not None else "")
+        area_text.append([row[i] for i in size_indexes])
+        source_rows.append(row_no)
+
+    issues = []
+    source = np.array(source_rows, dtype=np.int64)
+
+    qty_digits = np.array([text.isdigit() for text in qty_text], dtype=bool)
+    qty = np.array([int(text) if ok else 0 for text, ok in zip(qty_text, qty_digits)],
+                   dtype=np.int64)
+    bad_qty = (~qty_digits & np.array([bool(t) for t in qty_text], dtype=bool)) | \
+              (qty_digits & ((qty < 1) | (qty > max_qty)))
+    for row_no in source[bad_qty]:
+        issues.append((int(row_no), f"quantity must be 1-{max_qty}"))
+    qty[bad_qty] = 0
+
+    areas = np.array([[_parse_cell(text) for text in row] for row in area_text],
+                     dtype=np.float64).reshape(len(names), len(sizes))
+    bad_area = np.isnan(areas) | (areas < 0) | (areas > max_area)
+    for row_index, col_index in zip(*np.nonzero(bad_area)):
+        issues.append((int(source[row_index]),
+                       f"{sizes[col_index]}: area must be a number 0-{max_area}"))
+    areas[bad_area] = 0.0
+
+    issues.sort()
+    return PanelImport(names, qty, sizes, areas, issues, source_rows)
+
+
+def _parse_cell(text):
+    """Area cell value: blank is 0, anything that isn't a finite number is NaN."""
+    if not text:
+        return 0.0
+    try:
+        value = float(text)
+    except ValueError:
+        return math.nan
+    return value if math.isfinite(value) else math.nan
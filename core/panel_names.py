@@ -0,0 +1,128 @@
+# down_allocation_app/core/panel_names.py
+"""
+Prefix index of historical panel names for autocompletion.
+
+Names are kept in one sorted list, so the names starting with a prefix are a
+contiguous range found with two bisections. That list is the leaf level of a
+trie whose upper levels are only materialized where they are needed: every
+prefix matching more than `threshold` names (a "heavy" node) caches its most
+used completions. A lookup is then either a cache hit or a scan of at most
+`threshold` names, whatever the size of the library.
+"""
+
+from bisect import bisect_left, insort
+from heapq import nsmallest
+
+# Completions cached per heavy prefix; complete() returns at most this many
+CACHED_COMPLETIONS = 16
+_MAX_CHAR = '\U0010ffff'
+
+
+def normalize_panel_name(name):
+    """Panel names are compared upper-cased with single spaces, as the name column stores them."""
+    return " ".join(str(name).split()).upper()
+
+
+class PanelNameIndex:
+    """
+    Panel names with usage counts (how many projects use each name),
+    completed by prefix in order of use. add() updates it in place.
+    """
+
+    def __init__(self, counts=None, threshold=256):
+        self.threshold = threshold
+        self._counts = {}
+        for name, count in (counts or {}).items():
+            name = normalize_panel_name(name)
+            if name:
+                self._counts[name] = self._counts.get(name, 0) + count
+        self._names = sorted(self._counts)
+        self._top = {}  # Heavy prefix -> its CACHED_COMPLETIONS best names
+        if self._names:
+            self._build("", 0, len(self._names))
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return normalize_panel_name(name) in self._counts
+
+    def count(self, name):
+        return self._counts.get(normalize_panel_name(name), 0)
+
+    def _rank(self, name):
+        # Most used first, then alphabetical
+        return -self._counts[name], name
+
+    def _best(self, names):
+        return nsmallest(CACHED_COMPLETIONS, names, key=self._rank)
+
+    def _range(self, prefix):
+        names = self._names
+        lo = bisect_left(names, prefix)
+        return lo, bisect_left(names, prefix + _MAX_CHAR, lo)
+
+    def _build(self, prefix, lo, hi):
+        """Best names in names[lo:hi] (all starting with `prefix`), caching heavy prefixes bottom-up."""
+        names = self._names
+        if hi - lo <= self.threshold:
+            return self._best(names[lo:hi])
+        # A heavy node's best names are the best of its children's
+        depth = len(prefix)
+        candidates = []
+        i = lo
+        if len(names[i]) == depth:  # The prefix itself is a name (it sorts first)
+            candidates.append(names[i])
+            i += 1
+        while i < hi:
+            child = prefix + names[i][depth]
+            j = bisect_left(names, prefix + chr(ord(names[i][depth]) + 1), i, hi)
+            candidates.extend(self._build(child, i, j))
+            i = j
+        best = self._best(candidates)
+        self._top[prefix] = best
+        return best
+
+    def complete(self, prefix, limit=10):
+        """Up to `limit` (at most CACHED_COMPLETIONS) known names starting with `prefix`, most used first."""
+        key = normalize_panel_name(prefix)
+        if key and prefix[-1:].isspace():
+            key += " "  # "FRONT " narrows to the multi-word FRONT names
+        limit = min(limit, CACHED_COMPLETIONS)
+        best = self._top.get(key)
+        if best is None:
+            lo, hi = self._range(key)
+            best = self._best(self._names[lo:hi])
+        return best[:limit]
+
+    def add(self, name, count=1):
+        """Records `count` more uses of `name` (e.g. a newly saved project's panel)."""
+        name = normalize_panel_name(name)
+        if not name or count <= 0:
+            return
+        if name not in self._counts:
+            self._counts[name] = 0
+            insort(self._names, name)
+        self._counts[name] += count
+
+        rank = self._rank(name)
+        for depth in range(len(name) + 1):
+            prefix = name[:depth]
+            best = self._top.get(prefix)
+            if best is None:
+                lo, hi = self._range(prefix)
+                if hi - lo <= self.threshold:
+                    break  # Longer prefixes match fewer names, so none of them is cached
+                # The new name made this prefix heavy
+                self._top[prefix] = self._best(self._names[lo:hi])
+                continue
+            if name in best:
+                best.sort(key=self._rank)
+            elif len(best) < CACHED_COMPLETIONS or rank < self._rank(best[-1]):
+                best.append(name)
+                best.sort(key=self._rank)
+                del best[CACHED_COMPLETIONS:]
+
+    def add_many(self, names):
+        for name in names:
+            self.add(name)
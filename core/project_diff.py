@@ -0,0 +1,200 @@
+# down_allocation_app/core/project_diff.py
+"""
+Comparison of two project versions (.dax data).
+
+Panels are aligned by name and sizes by header into one union grid; both
+versions are scattered into it, so every cell delta, quantity change and
+down weight change is a whole-array operation.
+
+Run with:  python -m core.project_diff OLD NEW [--csv OUT]
+OLD and NEW are .dax files, or folders whose .dax files are paired by name.
+"""
+
+import argparse
+import csv
+import json
+import os
+
+import numpy as np
+
+from core.allocation_engine import PanelGrid, compute_allocation, parse_weight
+
+# Changes smaller than this (cm² / g) are display rounding, not edits
+AREA_TOLERANCE = 0.005
+WEIGHT_TOLERANCE = 0.005
+
+
+def load_project(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _unique_names(names):
+    """Panel names made unique by occurrence ('POCKET', 'POCKET #2') so repeated panels still align."""
+    seen = {}
+    unique = []
+    for name in names:
+        seen[name] = seen.get(name, 0) + 1
+        unique.append(name if seen[name] == 1 else f"{name} #{seen[name]}")
+    return unique
+
+
+def _union(first, second):
+    return list(dict.fromkeys(first + second))
+
+
+def _scatter(values, row_index, col_index, shape):
+    """`values` (rows x cols) placed at the union positions; NaN elsewhere."""
+    aligned = np.full(shape, np.nan)
+    aligned[np.ix_(row_index, col_index)] = values
+    return aligned
+
+
+class _Side:
+    """One version reduced to named panels and named sizes, with its allocation."""
+
+    def __init__(self, project_data):
+        self.input_data = project_data.get('input_data', {})
+        grid = PanelGrid.from_saved(project_data.get('top_table_data', {}))
+        rows = [i for i, name in enumerate(grid.names) if name]
+        self.size_cols = [i for i, size in enumerate(grid.sizes) if size]
+        self.names = _unique_names([grid.names[i] for i in rows])
+        self.sizes = [grid.sizes[i] for i in self.size_cols]
+        self.qty = grid.qty[rows]
+        self.areas = grid.areas[np.ix_(rows, self.size_cols)]
+
+        result = compute_allocation(grid, self.input_data.get('base_size', ''),
+                                    parse_weight(self.input_data.get('ecodown_weight')),
+                                    parse_weight(self.input_data.get('garment_weight')))
+        # Allocated panels are the named ones with qty > 0, in table order; the rest get 0 g
+        self.down = np.zeros_like(self.areas)
+        self.down[self.qty > 0] = result.down[:, self.size_cols]
+        self.down_totals = result.down_totals[self.size_cols]
+
+
+class ProjectDiff:
+    """
+    Two project versions on a common panel x size grid. Arrays are aligned to
+    `names` (old panels first, then panels only in the new version) and
+    `sizes` (likewise); values absent from a version are NaN.
+    """
+
+    def __init__(self, old_data, new_data):
+        old, new = _Side(old_data), _Side(new_data)
+        self.names = _union(old.names, new.names)
+        self.sizes = _union(old.sizes, new.sizes)
+        shape = (len(self.names), len(self.sizes))
+        name_index = {name: i for i, name in enumerate(self.names)}
+        size_index = {size: i for i, size in enumerate(self.sizes)}
+
+        self.input_changes = {
+            key: (old.input_data.get(key, ''), new.input_data.get(key, ''))
+            for key in sorted(set(old.input_data) | set(new.input_data))
+            if old.input_data.get(key, '') != new.input_data.get(key, '')
+        }
+
+        sides = []
+        for side in (old, new):
+            rows = np.array([name_index[n] for n in side.names], dtype=np.intp)
+            cols = np.array([size_index[s] for s in side.sizes], dtype=np.intp)
+            present = np.zeros(len(self.names), dtype=bool)
+            present[rows] = True
+            qty = np.zeros(len(self.names), dtype=np.int64)
+            qty[rows] = side.qty
+            areas = _scatter(side.areas, rows, cols, shape)
+            down = _scatter(side.down, rows, cols, shape)
+            down_totals = np.full(len(self.sizes), np.nan)
+            down_totals[cols] = side.down_totals
+            sides.append((present, qty, areas, down, down_totals))
+        ((self.old_present, self.old_qty, self.old_areas, self.old_down, self.old_down_totals),
+         (self.new_present, self.new_qty, self.new_areas, self.new_down, self.new_down_totals)) = sides
+
+        self.added_panels = self.new_present & ~self.old_present
+        self.removed_panels = self.old_present & ~self.new_present
+        self.qty_changed = self.old_present & self.new_present & (self.old_qty != self.new_qty)
+        self.area_delta = np.nan_to_num(self.new_areas) - np.nan_to_num(self.old_areas)
+        self.area_changed = (np.abs(self.area_delta) > AREA_TOLERANCE) | \
+            (np.isnan(self.old_areas) != np.isnan(self.new_areas))
+        self.down_delta = np.nan_to_num(self.new_down) - np.nan_to_num(self.old_down)
+        self.down_changed = np.abs(self.down_delta) > WEIGHT_TOLERANCE
+        self.down_totals_delta = np.nan_to_num(self.new_down_totals) - np.nan_to_num(self.old_down_totals)
+
+    @property
+    def added_sizes(self):
+        return [s for s, missing in zip(self.sizes, np.isnan(self.old_down_totals)) if missing]
+
+    @property
+    def removed_sizes(self):
+        return [s for s, missing in zip(self.sizes, np.isnan(self.new_down_totals)) if missing]
+
+    def has_changes(self):
+        return bool(self.input_changes or self.added_panels.any() or self.removed_panels.any()
+                    or self.qty_changed.any() or self.area_changed.any() or self.down_changed.any())
+
+    def summary(self):
+        """Counts and per-size total down change, for logs and batch comparisons."""
+        return {
+            'input_changes': dict(self.input_changes),
+            'panels_added': [n for n, a in zip(self.names, self.added_panels) if a],
+            'panels_removed': [n for n, r in zip(self.names, self.removed_panels) if r],
+            'sizes_added': self.added_sizes,
+            'sizes_removed': self.removed_sizes,
+            'qty_changes': int(self.qty_changed.sum()),
+            'area_changes': int((self.area_changed & self.old_present[:, None]
+                                 & self.new_present[:, None]).sum()),
+            'down_total_delta': {s: round(float(d), 2) for s, d in
+                                 zip(self.sizes, self.down_totals_delta) if abs(d) > WEIGHT_TOLERANCE},
+        }
+
+
+def compare_files(old_path, new_path):
+    return ProjectDiff(load_project(old_path), load_project(new_path))
+
+
+def pair_projects(old_dir, new_dir):
+    """(old, new) .dax paths with the same file name in both folders."""
+    old_files = {name.lower(): name for name in os.listdir(old_dir) if name.lower().endswith('.dax')}
+    pairs = []
+    for name in sorted(os.listdir(new_dir)):
+        if name.lower() in old_files:
+            pairs.append((os.path.join(old_dir, old_files[name.lower()]), os.path.join(new_dir, name)))
+    return pairs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two versions of down allocation projects")
+    parser.add_argument('old', help=".dax file or folder")
+    parser.add_argument('new', help=".dax file or folder (files paired with OLD by name)")
+    parser.add_argument('--csv', help="write one summary row per compared pair to this file")
+    args = parser.parse_args(argv)
+
+    if os.path.isdir(args.old) and os.path.isdir(args.new):
+        pairs = pair_projects(args.old, args.new)
+    else:
+        pairs = [(args.old, args.new)]
+
+    rows = []
+    for old_path, new_path in pairs:
+        try:
+            summary = compare_files(old_path, new_path).summary()
+        except (OSError, ValueError) as e:  # json.JSONDecodeError is a ValueError
+            print(f"{os.path.basename(new_path)}: could not compare: {e}")
+            continue
+        rows.append((os.path.basename(new_path), summary))
+        print(f"{os.path.basename(new_path)}: {json.dumps(summary)}")
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['project', 'input_changes', 'panels_added', 'panels_removed',
+                             'sizes_added', 'sizes_removed', 'qty_changes', 'area_changes',
+                             'down_total_delta'])
+            for name, s in rows:
+                writer.writerow([name, json.dumps(s['input_changes']), " ".join(s['panels_added']),
+                                 " ".join(s['panels_removed']), " ".join(s['sizes_added']),
+                                 " ".join(s['sizes_removed']), s['qty_changes'], s['area_changes'],
+                                 json.dumps(s['down_total_delta'])])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+# down_allocation_app/core/project_index.py
+"""
+SQLite index of .dax projects: one row per project file with the fields
+people search by (buyer, style, season, stage, date, factory) and a content
+hash, so a project library can be queried without opening every file.
+A second table lists each project's panel names for name autocompletion.
+"""
+
+import json
+import os
+import sqlite3
+
+from core.hashing import payload_hash
+from core.panel_names import normalize_panel_name
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    factory_name TEXT NOT NULL DEFAULT '',
+    buyer TEXT NOT NULL DEFAULT '',
+    style TEXT NOT NULL DEFAULT '',
+    season TEXT NOT NULL DEFAULT '',
+    garments_stage TEXT NOT NULL DEFAULT '',
+    date TEXT NOT NULL DEFAULT '',
+    base_size TEXT NOT NULL DEFAULT '',
+    ecodown_weight TEXT NOT NULL DEFAULT '',
+    garment_weight TEXT NOT NULL DEFAULT '',
+    panel_count INTEGER NOT NULL DEFAULT 0,
+    sizes TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS projects_buyer_style ON projects (buyer, style);
+CREATE INDEX IF NOT EXISTS projects_season ON projects (season, garments_stage);
+CREATE TABLE IF NOT EXISTS panels (
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (path, name)
+);
+"""
+
+# Columns that can be filtered on exactly in search()
+FILTER_COLUMNS = ('factory_name', 'buyer', 'style', 'season', 'garments_stage', 'base_size')
+# Columns matched by the free-text part of search()
+_TEXT_COLUMNS = ('buyer', 'style', 'season', 'garments_stage', 'factory_name', 'path')
+
+
+def panel_names(project_data):
+    """Distinct normalized panel names used in a project."""
+    names = (normalize_panel_name(p.get('name', ''))
+             for p in project_data.get('top_table_data', {}).get('panel_data', []))
+    return sorted({name for name in names if name})
+
+
+def project_record(path, project_data, source=""):
+    """Index row for one project: searchable fields plus a hash of the data that affects allocation."""
+    input_data = project_data.get('input_data', {})
+    top_table_data = project_data.get('top_table_data', {})
+    factory_info = project_data.get('factory_info', {})
+    panels = [p for p in top_table_data.get('panel_data', []) if str(p.get('name', '')).strip()]
+    return {
+        'path': os.path.abspath(path),
+        'content_hash': payload_hash({'input_data': input_data, 'top_table_data': top_table_data}),
+        'mtime': os.path.getmtime(path) if os.path.exists(path) else 0.0,
+        'factory_name': factory_info.get('name', ''),
+        'buyer': input_data.get('buyer', ''),
+        'style': input_data.get('style', ''),
+        'season': input_data.get('season', ''),
+        'garments_stage': input_data.get('garments_stage', ''),
+        'date': input_data.get('date', ''),
+        'base_size': input_data.get('base_size', ''),
+        'ecodown_weight': input_data.get('ecodown_weight', ''),
+        'garment_weight': input_data.get('garment_weight', ''),
+        'panel_count': len(panels),
+        'sizes': ",".join(s for s in top_table_data.get('size_names', []) if s),
+        'source': source,
+    }
+
+
+class ProjectIndex:
+    """
+    Index database at `db_path` (created on first use). Writes go through
+    add()/add_many(); each call is one transaction.
+    """
+
+    def __init__(self, db_path):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+    def add(self, path, project_data, source=""):
+        self.add_many([(path, project_data, source)])
+
+    def add_many(self, entries):
+        """Adds or refreshes (path, project_data, source) entries in one transaction."""
+        records = [project_record(path, data, source) for path, data, source in entries]
+        if not records:
+            return
+        columns = list(records[0])
+        sql = (f"INSERT OR REPLACE INTO projects ({', '.join(columns)}) "
+               f"VALUES ({', '.join(':' + c for c in columns)})")
+        panels = [(record['path'], name) for record, (_path, data, _source) in zip(records, entries)
+                  for name in panel_names(data)]
+        with self.connection:
+            self.connection.executemany(sql, records)
+            self.connection.executemany("DELETE FROM panels WHERE path = ?",
+                                        [(record['path'],) for record in records])
+            self.connection.executemany("INSERT OR IGNORE INTO panels (path, name) VALUES (?, ?)", panels)
+
+    def add_file(self, path, source=""):
+        with open(path, 'r') as f:
+            self.add(path, json.load(f), source)
+
+    def remove(self, path):
+        with self.connection:
+            self.connection.execute("DELETE FROM projects WHERE path = ?", (os.path.abspath(path),))
+            self.connection.execute("DELETE FROM panels WHERE path = ?", (os.path.abspath(path),))
+
+    def prune_missing(self):
+        """Drops entries whose file no longer exists; returns how many were removed."""
+        missing = [(row['path'],) for row in self.connection.execute("SELECT path FROM projects")
+                   if not os.path.exists(row['path'])]
+        with self.connection:
+            self.connection.executemany("DELETE FROM projects WHERE path = ?", missing)
+            self.connection.executemany("DELETE FROM panels WHERE path = ?", missing)
+        return len(missing)
+
+    def panel_name_counts(self):
+        """{panel name: number of indexed projects using it}, for PanelNameIndex."""
+        return dict(self.connection.execute("SELECT name, COUNT(*) FROM panels GROUP BY name"))
+
+    def panel_names_for(self, path):
+        rows = self.connection.execute("SELECT name FROM panels WHERE path = ?", (os.path.abspath(path),))
+        return {row['name'] for row in rows}
+
+    def search(self, text="", **filters):
+        """
+        Projects matching every exact `filters` column (see FILTER_COLUMNS) and,
+        if given, containing `text` in buyer, style, season, stage, factory or
+        path. Returns dicts, newest date first.
+        """
+        clauses, params = [], []
+        for column, value in filters.items():
+            if column not in FILTER_COLUMNS:
+                raise ValueError(f"cannot filter on '{column}'")
+            if value:
+                clauses.append(f"{column} = ? COLLATE NOCASE")
+                params.append(value)
+        if text:
+            clauses.append("(" + " OR ".join(f"{c} LIKE ?" for c in _TEXT_COLUMNS) + ")")
+            params.extend([f"%{text}%"] * len(_TEXT_COLUMNS))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.connection.execute(
+            f"SELECT * FROM projects {where} ORDER BY date DESC, style", params)
+        return [dict(row) for row in rows]
+
+    def paths(self, text="", **filters):
+        return [row['path'] for row in self.search(text, **filters)]
@@ -0,0 +1,218 @@
+# down_allocation_app/core/report_import.py
+"""
+Rebuilds .dax projects from Excel reports written by export_to_excel.
+
+Run with:  python -m core.report_import REPORT_DIR OUTPUT_DIR [--index DB]
+
+A report holds the factory block, the input block and the bottom table
+(per-panel down/garment weight per size), but no sewing areas. Since the
+allocation is proportional to area, each panel's areas are rebuilt as its
+weights (the larger of the down/garment series, for precision): allocating
+the rebuilt project with the same inputs gives back the report's weights
+(to within their 0.01 g rounding).
+
+Workbooks are streamed in openpyxl read-only mode, one per worker process.
+"""
+
+import argparse
+import json
+import os
+import re
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from core.allocation_engine import parse_weight
+from core.panel_import import iter_rows
+
+REPORT_SHEET = 'Report'
+
+# Input block label -> input_data key, as written by _write_excel_report
+_INPUT_LABELS = {
+    "Date": 'date',
+    "Buyer": 'buyer',
+    "Style": 'style',
+    "Season": 'season',
+    "Garments Stage": 'garments_stage',
+    "Base Size": 'base_size',
+    "Ecodown Weight": 'ecodown_weight',
+    "Garments Weight": 'garment_weight',
+    "Approx Weight": 'approx_weight',
+}
+_QTY_TEXT = re.compile(r'^1X(\d+)$', re.IGNORECASE)
+
+
+def _weights(cells):
+    values = []
+    for text in cells:
+        try:
+            values.append(float(text) if text else 0.0)
+        except ValueError:
+            values.append(0.0)
+    return values
+
+
+def parse_report_rows(rows):
+    """
+    Project data (the .dax dictionary) from the rows of a report sheet, each
+    a list of cell strings. Raises ValueError if the layout isn't a report.
+    """
+    factory_info = {'name': "", 'location': ""}
+    input_data = {key: "" for key in _INPUT_LABELS.values()}
+    sizes = None  # Set to [] at the PANEL NAME header, then to the size header row
+    panels = []  # [name, qty, down weights, garment weights]
+    size_count = None
+    size_row = False
+
+    for row in rows:
+        first = row[0] if row else ""
+        if sizes is None:
+            value = row[1] if len(row) > 1 else ""
+            if first == 'Factory Name:':
+                factory_info['name'] = value
+            elif first == 'Location:':
+                factory_info['location'] = value
+            elif first in _INPUT_LABELS:
+                input_data[_INPUT_LABELS[first]] = value
+            elif first == 'PANEL NAME':
+                sizes = []
+                size_row = True
+            continue
+        if size_row:
+            sizes = row[3:]  # Trimmed once the column count is known
+            size_row = False
+            continue
+        label = row[2] if len(row) > 2 else ""
+        if label == 'DOWN WEIGHT':
+            match = _QTY_TEXT.match(row[1])
+            panels.append([first, match.group(1) if match else "", row[3:], []])
+        elif label == 'GARMENTS WEIGHT' and panels:
+            panels[-1][3] = row[3:]
+        elif first == 'TOTAL DOWN WEIGHT':
+            # Totals are written for every size column, so they give the table width
+            cells = row[3:]
+            while cells and not cells[-1]:
+                cells.pop()
+            size_count = len(cells)
+            break
+
+    if sizes is None or size_count is None:
+        raise ValueError("not a down allocation report (allocation table not found)")
+    if not panels:
+        raise ValueError("the report has no panels")
+
+    sizes = (list(sizes) + [""] * size_count)[:size_count]
+    use_garment = parse_weight(input_data['garment_weight']) > parse_weight(input_data['ecodown_weight'])
+    panel_data = []
+    for name, qty, down_cells, garment_cells in panels:
+        weights = _weights(((garment_cells if use_garment and garment_cells else down_cells)
+                            + [""] * size_count)[:size_count])
+        panel_data.append({
+            'name': name,
+            'qty': qty,
+            'areas': [f"{w:.2f}".rstrip('0').rstrip('.') if w else "" for w in weights],
+        })
+
+    return {
+        'factory_info': factory_info,
+        'input_data': input_data,
+        'top_table_data': {'size_names': sizes, 'panel_data': panel_data},
+        'grading_rules': {},
+        'adjust_table_counts': {'rows': len(panel_data), 'cols': size_count},
+    }
+
+
+def read_report(path):
+    """Project data rebuilt from one report workbook."""
+    try:
+        with closing(iter_rows(path, REPORT_SHEET)) as rows:
+            return parse_report_rows(rows)
+    except KeyError:
+        raise ValueError(f"no '{REPORT_SHEET}' sheet") from None
+
+
+def _read_report_job(path):
+    """Worker entry point: errors are returned, not raised, so one bad workbook can't stop a run."""
+    try:
+        return path, read_report(path), None
+    except Exception as e:  # Unreadable, corrupt or foreign workbook
+        return path, None, str(e) or type(e).__name__
+
+
+def find_reports(directory):
+    """Every .xlsx under `directory` (Office lock files skipped), sorted."""
+    found = []
+    for root, _dirs, files in os.walk(directory):
+        found.extend(os.path.join(root, name) for name in files
+                     if name.lower().endswith('.xlsx') and not name.startswith('~$'))
+    return sorted(found)
+
+
+def _output_path(output_dir, report_path, taken):
+    base = os.path.splitext(os.path.basename(report_path))[0]
+    candidate, counter = base, 2
+    # Reports sharing a file name (from different folders) get numbered; re-runs overwrite
+    while candidate.lower() in taken:
+        candidate = f"{base} ({counter})"
+        counter += 1
+    taken.add(candidate.lower())
+    return os.path.join(output_dir, candidate + ".dax")
+
+
+def rebuild_projects(report_paths, output_dir, index=None, workers=None, progress=None):
+    """
+    Rebuilds a .dax per report into `output_dir` on a process pool and adds
+    each to `index` (a ProjectIndex) if given. `progress(done, total)` is
+    called as workbooks finish. Returns ([(report, dax path)], [(report, error)]).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written, failed, indexed, taken = [], [], [], set()
+    total = len(report_paths)
+    if not total:
+        return written, failed
+    # Named up front so duplicate report names are numbered in input order, not completion order
+    dax_paths = {path: _output_path(output_dir, path, taken) for path in report_paths}
+
+    # Only the parsing runs in the workers; files and the index are written here
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(_read_report_job, path) for path in report_paths]
+        for done, future in enumerate(as_completed(futures), start=1):
+            report_path, project_data, error = future.result()
+            if error is None:
+                dax_path = dax_paths[report_path]
+                with open(dax_path, 'w') as f:
+                    json.dump(project_data, f, indent=4)
+                indexed.append((dax_path, project_data, os.path.abspath(report_path)))
+                written.append((report_path, dax_path))
+            else:
+                failed.append((report_path, error))
+            if progress:
+                progress(done, total)
+    if index is not None:
+        index.add_many(indexed)
+    return written, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild .dax projects from exported Excel reports")
+    parser.add_argument('reports', help="folder searched recursively for .xlsx reports")
+    parser.add_argument('output', help="folder the .dax files are written to")
+    parser.add_argument('--index', help="project index database to add the projects to")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="process pool size (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    from core.project_index import ProjectIndex
+    index = ProjectIndex(args.index) if args.index else None
+    try:
+        written, failed = rebuild_projects(find_reports(args.reports), args.output, index,
+                                           args.workers)
+    finally:
+        if index is not None:
+            index.close()
+    for report_path, error in failed:
+        print(f"skipped {report_path}: {error}")
+    print(f"{len(written)} projects rebuilt, {len(failed)} skipped")
+
+
+if __name__ == '__main__':
+    main()
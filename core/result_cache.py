@@ -0,0 +1,160 @@
+# down_allocation_app/core/result_cache.py
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from core.allocation_engine import AllocationResult
+from core.hashing import payload_hash
+
+# input_data fields the allocation depends on
+ALLOCATION_INPUTS = ('base_size', 'ecodown_weight', 'garment_weight')
+
+
+def allocation_payload(top_table_data, input_data):
+    """The part of a project an allocation depends on, in allocate_saved() form."""
+    return {
+        'top_table_data': top_table_data,
+        'input_data': {key: input_data.get(key, '') for key in ALLOCATION_INPUTS},
+    }
+
+
+def allocation_key(top_table_data, input_data):
+    return payload_hash(allocation_payload(top_table_data, input_data))
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache for allocation arrays and rendered exports.
+
+    Entries are files named <key>.<kind> (kind is e.g. 'npz', 'xlsx', 'pdf'),
+    where key is a payload_hash() of everything the artifact depends on.
+    Access time is tracked through the file mtime; once the cache grows past
+    max_bytes the least recently used files are evicted.
+    """
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path_for(self, key, kind):
+        # Two-character fan-out keeps directories small
+        return os.path.join(self.directory, key[:2], f"{key}.{kind}")
+
+    # region Lookup
+    def lookup(self, key, kind):
+        """Returns the cached file path (marking it recently used), or None."""
+        path = self.path_for(key, kind)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def get_bytes(self, key, kind):
+        path = self.lookup(key, kind)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def copy_to(self, key, kind, destination):
+        """Copies a cached artifact to `destination`; returns False on a miss."""
+        path = self.lookup(key, kind)
+        if path is None:
+            return False
+        try:
+            shutil.copyfile(path, destination)
+        except OSError:
+            return False
+        return True
+
+    def get_allocation(self, key):
+        """Returns a cached AllocationResult, or None."""
+        path = self.lookup(key, 'npz')
+        if path is None:
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return AllocationResult(
+                    data['sizes'].tolist(), data['names'].tolist(), data['qty'],
+                    data['down'], data['garment'], int(data['base_col']),
+                    float(data['total_base_area']), bool(data['show_garment']))
+        except (OSError, ValueError, KeyError):
+            return None
+    # endregion
+
+    # region Store
+    # `evict=False` skips the size check, for bulk writers that call evict() once at the end
+    def put_bytes(self, key, kind, data, evict=True):
+        self._write(key, kind, lambda f: f.write(data), evict)
+
+    def put_file(self, key, kind, source):
+        """Stores a copy of the file at `source` (e.g. a freshly written export)."""
+        def copy(f):
+            with open(source, 'rb') as src:
+                shutil.copyfileobj(src, f)
+        self._write(key, kind, copy)
+
+    def put_allocation(self, key, result, evict=True):
+        def save(f):
+            np.savez(f, sizes=np.array(result.sizes, dtype=str), names=np.array(result.names, dtype=str),
+                     qty=result.qty, down=result.down, garment=result.garment,
+                     base_col=result.base_col, total_base_area=result.total_base_area,
+                     show_garment=result.show_garment)
+        self._write(key, 'npz', save, evict)
+
+    def _write(self, key, kind, write, evict=True):
+        """Writes through a temp file + rename so readers never see partial entries."""
+        path = self.path_for(key, kind)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    write(f)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            return  # A cache that can't be written is just a cache miss next time
+        if evict:
+            self.evict()
+    # endregion
+
+    def evict(self):
+        """Deletes least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for root, _dirs, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _mtime, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
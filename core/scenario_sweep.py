@@ -0,0 +1,130 @@
+# down_allocation_app/core/scenario_sweep.py
+
+import itertools
+
+import numpy as np
+
+# Largest scenarios x panels x sizes block evaluated at once (~64 MB of float64)
+_MAX_BLOCK_ELEMENTS = 8_000_000
+
+
+def parse_weight_list(text):
+    """
+    Parses a list of weights: comma/space separated values ("180, 200, 220")
+    and start:stop:step ranges ("180:220:10", stop inclusive) can be mixed.
+    Raises ValueError on anything else.
+    """
+    weights = []
+    for token in text.replace(',', ' ').split():
+        if ':' in token:
+            parts = token.split(':')
+            if len(parts) != 3:
+                raise ValueError(f"range '{token}' must be start:stop:step")
+            start, stop, step = (float(p) for p in parts)
+            if step <= 0:
+                raise ValueError(f"range '{token}' needs a positive step")
+            count = int(np.floor((stop - start) / step + 1e-9)) + 1
+            weights.extend(round(start + i * step, 6) for i in range(max(count, 0)))
+        else:
+            weights.append(float(token))
+    if any(not np.isfinite(w) or w < 0 for w in weights):
+        raise ValueError("weights must be non-negative numbers")
+    return weights
+
+
+class SweepResult:
+    """
+    Allocation totals for every scenario of a sweep, one row per scenario.
+
+    Scenarios are the product base_sizes x ecodown_weights x garment_weights
+    in that order (base size varies slowest).
+    """
+
+    def __init__(self, sizes, base_sizes, ecodown, garment, total_base_area, down_totals,
+                 garment_totals):
+        self.sizes = sizes  # size header names (columns of the totals)
+        self.base_sizes = base_sizes  # base size of each scenario
+        self.ecodown = ecodown  # ecodown weight of each scenario
+        self.garment = garment  # garment weight of each scenario
+        self.total_base_area = total_base_area  # qty-weighted base size area per scenario
+        self.down_totals = down_totals  # scenarios x sizes TOTAL DOWN WEIGHT
+        self.garment_totals = garment_totals  # scenarios x sizes TOTAL GARMENT WEIGHT
+
+    def __len__(self):
+        return len(self.base_sizes)
+
+    @property
+    def show_garment(self):
+        return bool((self.garment > 0).any())
+
+    def headers(self):
+        headers = ["Base Size", "Ecodown Weight", "Garments Weight", "Base Area"]
+        headers += [f"DOWN {size}" for size in self.sizes]
+        if self.show_garment:
+            headers += [f"GARMENT {size}" for size in self.sizes]
+        return headers
+
+    def columns(self):
+        """Numeric columns matching headers() (base sizes stay text), e.g. for a spreadsheet."""
+        columns = [list(self.base_sizes), self.ecodown, self.garment, self.total_base_area]
+        columns += list(self.down_totals.T)
+        if self.show_garment:
+            columns += list(self.garment_totals.T)
+        return columns
+
+    def rows(self):
+        """Display rows matching headers(); weights formatted like the bottom table."""
+        show_garment = self.show_garment
+        for index in range(len(self)):
+            row = [self.base_sizes[index], f"{self.ecodown[index]:g}", f"{self.garment[index]:g}",
+                   f"{self.total_base_area[index]:.2f}"]
+            row += [f"{value:.2f}" for value in self.down_totals[index]]
+            if show_garment:
+                row += [f"{value:.2f}" for value in self.garment_totals[index]]
+            yield row
+
+
+def sweep_allocation(grid, base_sizes, ecodown_weights, garment_weights=(0.0,)):
+    """
+    Evaluates compute_allocation() for every combination of base size and
+    ecodown/garment weight in one broadcast: the per-panel weights of all
+    scenarios are a scenarios x panels x sizes array, rounded to 2 decimals
+    like the bottom table, then reduced by quantity into per-size totals.
+    Base sizes not among grid.sizes give all-zero rows, as in the main view;
+    size columns without a name are left out.
+    """
+    mask = grid.valid_mask()
+    named = [col for col, size in enumerate(grid.sizes) if size]
+    qty = grid.qty[mask].astype(np.float64)
+    areas = grid.areas[np.ix_(mask, named)]
+    sizes = [grid.sizes[col] for col in named]
+
+    # Qty-weighted area of every size column; a base size picks one of them
+    column_areas = qty @ areas
+    base_areas = np.array([column_areas[sizes.index(b)] if b in sizes else 0.0
+                           for b in base_sizes], dtype=np.float64)
+
+    scenarios = list(itertools.product(range(len(base_sizes)), ecodown_weights, garment_weights))
+    base_index = np.array([s[0] for s in scenarios], dtype=np.intp)
+    ecodown = np.array([s[1] for s in scenarios], dtype=np.float64)
+    garment = np.array([s[2] for s in scenarios], dtype=np.float64)
+    total_base_area = base_areas[base_index] if len(scenarios) else np.zeros(0)
+
+    # Weight per unit of sewing area; 0 where the base size has no area
+    safe_area = np.where(total_base_area > 0, total_base_area, 1.0)
+    down_factor = np.where(total_base_area > 0, ecodown / safe_area, 0.0)
+    garment_factor = np.where(total_base_area > 0, garment / safe_area, 0.0)
+
+    down_totals = np.zeros((len(scenarios), len(sizes)))
+    garment_totals = np.zeros((len(scenarios), len(sizes)))
+    chunk = max(1, _MAX_BLOCK_ELEMENTS // max(1, areas.size))
+    for start in range(0, len(scenarios), chunk):
+        block = slice(start, start + chunk)
+        down = np.round(areas[None, :, :] * down_factor[block, None, None], 2)
+        down_totals[block] = np.einsum('p,nps->ns', qty, down)
+        if garment_factor[block].any():
+            garment_block = np.round(areas[None, :, :] * garment_factor[block, None, None], 2)
+            garment_totals[block] = np.einsum('p,nps->ns', qty, garment_block)
+
+    return SweepResult(sizes, [base_sizes[i] for i in base_index], ecodown, garment,
+                       total_base_area, down_totals, garment_totals)
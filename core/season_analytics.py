@@ -0,0 +1,198 @@
+# down_allocation_app/core/season_analytics.py
+"""
+Down requirement totals over a project library.
+
+Every project's allocation is computed (or read from the result cache, keyed
+by the hash of the data it depends on) on a process pool, reduced to the
+TOTAL DOWN / GARMENT WEIGHT rows of its bottom table, and the totals are
+summed per season, buyer, garments stage and size.
+
+Run with:  python -m core.season_analytics FOLDER [--cache DIR] [--excel OUT]
+      or:  python -m core.season_analytics --index DB [--season S] [--buyer B] ...
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from core.allocation_engine import allocate_saved
+from core.result_cache import ResultCache, allocation_key
+
+GROUP_COLUMNS = ['season', 'buyer', 'garments_stage']
+
+
+class ProjectTotals:
+    """One project's per-size totals and the fields it is grouped by."""
+
+    def __init__(self, path, input_data, sizes, down_totals, garment_totals):
+        self.path = path
+        self.season = input_data.get('season', '')
+        self.buyer = input_data.get('buyer', '')
+        self.garments_stage = input_data.get('garments_stage', '')
+        self.style = input_data.get('style', '')
+        self.sizes = sizes
+        self.down_totals = down_totals
+        self.garment_totals = garment_totals
+
+    @classmethod
+    def from_result(cls, path, input_data, result):
+        # Unnamed size columns carry no areas anyone asked for; sizes are compared case-insensitively
+        named = [i for i, size in enumerate(result.sizes) if size]
+        garment = result.garment_totals[named] if result.show_garment else np.zeros(len(named))
+        return cls(path, input_data, [result.sizes[i].upper() for i in named],
+                   result.down_totals[named], garment)
+
+
+def _project_job(path, cache_dir):
+    """
+    Worker entry point: loads one project and returns (path, ProjectTotals,
+    key, result to cache or None, error). Cache hits are read here; only new
+    results go back to the parent to be written, so workers never write.
+    """
+    try:
+        with open(path, 'r') as f:
+            project_data = json.load(f)
+        input_data = project_data.get('input_data', {})
+        top_table_data = project_data.get('top_table_data', {})
+        key = allocation_key(top_table_data, input_data)
+        result = ResultCache(cache_dir).get_allocation(key) if cache_dir else None
+        computed = None
+        if result is None:
+            result = computed = allocate_saved(top_table_data, input_data)
+        return path, ProjectTotals.from_result(path, input_data, result), key, computed, None
+    except Exception as e:  # Unreadable or malformed project
+        return path, None, None, None, str(e) or type(e).__name__
+
+
+def find_projects(directory):
+    """Every .dax under `directory`, sorted."""
+    found = []
+    for root, _dirs, files in os.walk(directory):
+        found.extend(os.path.join(root, name) for name in files if name.lower().endswith('.dax'))
+    return sorted(found)
+
+
+def collect_totals(paths, cache=None, workers=None, progress=None):
+    """
+    ProjectTotals for each project in `paths`, in order. `cache` is a
+    ResultCache; `workers=0` computes in this process. `progress(done, total)`
+    is called as projects finish. Returns (totals, [(path, error)], computed count).
+    """
+    cache_dir = cache.directory if cache is not None else None
+    outcomes = {}
+    if workers == 0:
+        for done, path in enumerate(paths, start=1):
+            outcomes[path] = _project_job(path, cache_dir)
+            if progress:
+                progress(done, len(paths))
+    elif paths:
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(_project_job, path, cache_dir) for path in paths]
+            for done, future in enumerate(as_completed(futures), start=1):
+                outcome = future.result()
+                outcomes[outcome[0]] = outcome
+                if progress:
+                    progress(done, len(paths))
+
+    totals, failed, computed = [], [], 0
+    for path in paths:
+        _path, project_totals, key, result, error = outcomes[path]
+        if error is not None:
+            failed.append((path, error))
+            continue
+        totals.append(project_totals)
+        if result is not None:
+            computed += 1
+            if cache is not None:
+                cache.put_allocation(key, result, evict=False)
+    if cache is not None and computed:
+        cache.evict()
+    return totals, failed, computed
+
+
+def aggregate(totals):
+    """
+    Long-form pandas DataFrame with one row per (season, buyer,
+    garments_stage, size): the number of styles, total down and total
+    garment weight, in first-seen size order.
+    """
+    # pandas is only needed here; importing it lazily keeps it off the startup path
+    import pandas as pd
+
+    records = {'season': [], 'buyer': [], 'garments_stage': [], 'size': [], 'style': [],
+               'down_weight': [], 'garment_weight': []}
+    for project in totals:
+        count = len(project.sizes)
+        for column in GROUP_COLUMNS + ['style']:
+            records[column].extend([getattr(project, column)] * count)
+        records['size'].extend(project.sizes)
+        records['down_weight'].extend(project.down_totals.tolist())
+        records['garment_weight'].extend(project.garment_totals.tolist())
+    frame = pd.DataFrame(records)
+
+    size_order = list(dict.fromkeys(frame['size']))
+    frame['size'] = pd.Categorical(frame['size'], categories=size_order, ordered=True)
+    grouped = frame.groupby(GROUP_COLUMNS + ['size'], observed=True, sort=True).agg(
+        styles=('style', 'nunique'), down_weight=('down_weight', 'sum'),
+        garment_weight=('garment_weight', 'sum'))
+    return grouped.reset_index()
+
+
+def pivot_by_size(summary, value='down_weight'):
+    """`aggregate()` output as one row per season/buyer/stage and one column per size, plus TOTAL."""
+    table = summary.pivot_table(index=GROUP_COLUMNS, columns='size', values=value,
+                                aggfunc='sum', fill_value=0.0, observed=True)
+    table.columns = [str(size) for size in table.columns]
+    table['TOTAL'] = table.sum(axis=1)
+    styles = summary.groupby(GROUP_COLUMNS, observed=True)['styles'].max()
+    table.insert(0, 'styles', styles)
+    return table.reset_index()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Total down required per season, buyer, stage and size")
+    parser.add_argument('folder', nargs='?', help="folder searched recursively for .dax projects")
+    parser.add_argument('--index', help="project index database to query instead of a folder")
+    parser.add_argument('--season', default="")
+    parser.add_argument('--buyer', default="")
+    parser.add_argument('--stage', default="", help="garments stage")
+    parser.add_argument('--search', default="", help="free text matched in the index")
+    parser.add_argument('--cache', help="result cache folder, so re-runs only compute changed projects")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="process pool size (default: CPU count, 0: compute inline)")
+    parser.add_argument('--excel', help="write the size pivot and the long table to this .xlsx")
+    args = parser.parse_args(argv)
+
+    if args.index:
+        from core.project_index import ProjectIndex
+        with ProjectIndex(args.index) as index:
+            paths = index.paths(args.search, season=args.season, buyer=args.buyer,
+                                garments_stage=args.stage)
+    elif args.folder:
+        paths = find_projects(args.folder)
+    else:
+        parser.error("give a folder or --index")
+
+    cache = ResultCache(args.cache) if args.cache else None
+    totals, failed, computed = collect_totals(paths, cache, args.workers)
+    for path, error in failed:
+        print(f"skipped {path}: {error}")
+    print(f"{len(totals)} projects ({computed} computed, {len(totals) - computed} cached)")
+    if not totals:
+        return
+
+    summary = aggregate(totals)
+    pivot = pivot_by_size(summary)
+    print(pivot.to_string(index=False, float_format=lambda v: f"{v:.0f}"))
+    if args.excel:
+        import pandas as pd
+        with pd.ExcelWriter(args.excel, engine='xlsxwriter') as writer:
+            pivot.to_excel(writer, sheet_name='By Size', index=False)
+            summary.to_excel(writer, sheet_name='Detail', index=False)
+
+
+if __name__ == '__main__':
+    main()
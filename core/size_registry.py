@@ -0,0 +1,94 @@
+# down_allocation_app/core/size_registry.py
+
+
+class SizeRegistry:
+    """
+    Ordered, hashed set of size names for the size header row.
+
+    Sizes are keyed by table column so lookups, duplicate checks and header
+    edits are O(1). `version` is bumped whenever the ordered size list changes,
+    letting consumers (e.g. the base size dropdown) skip work when nothing moved.
+    """
+
+    def __init__(self):
+        self._name_by_column = {}  # column -> upper-case size name
+        self._columns_by_name = {}  # upper-case size name -> set of columns
+        self._ordered = []
+        self._ordered_dirty = False
+        self.version = 0
+
+    @staticmethod
+    def normalize(name):
+        return str(name).strip().upper() if name else ""
+
+    def reset(self, names_by_column):
+        """Replaces the whole registry from a {column: name} mapping."""
+        name_by_column = {}
+        for col, name in names_by_column.items():
+            name = self.normalize(name)
+            if name:
+                name_by_column[col] = name
+        if name_by_column == self._name_by_column:
+            return False
+        self._name_by_column = name_by_column
+        self._columns_by_name = {}
+        for col, name in name_by_column.items():
+            self._columns_by_name.setdefault(name, set()).add(col)
+        self._bump()
+        return True
+
+    def set(self, col, name):
+        """Sets (or clears, with an empty name) the size held by one column."""
+        name = self.normalize(name)
+        old_name = self._name_by_column.get(col, "")
+        if name == old_name:
+            return False
+        if old_name:
+            columns = self._columns_by_name[old_name]
+            columns.discard(col)
+            if not columns:
+                del self._columns_by_name[old_name]
+            del self._name_by_column[col]
+        if name:
+            self._name_by_column[col] = name
+            self._columns_by_name.setdefault(name, set()).add(col)
+        self._bump()
+        return True
+
+    def column_of(self, name):
+        """Returns the first column holding `name`, or -1."""
+        columns = self._columns_by_name.get(self.normalize(name))
+        return min(columns) if columns else -1
+
+    def is_duplicate(self, col, name):
+        """True if `name` is already used by a column other than `col`."""
+        columns = self._columns_by_name.get(self.normalize(name))
+        return bool(columns) and (len(columns) > 1 or col not in columns)
+
+    def name_at(self, col):
+        return self._name_by_column.get(col, "")
+
+    def __contains__(self, name):
+        return self.normalize(name) in self._columns_by_name
+
+    def __len__(self):
+        return len(self._columns_by_name)
+
+    @property
+    def sizes(self):
+        """Unique size names in column order (cached until the next change)."""
+        if self._ordered_dirty:
+            seen = set()
+            ordered = []
+            for col in sorted(self._name_by_column):
+                name = self._name_by_column[col]
+                if name not in seen:
+                    seen.add(name)
+                    ordered.append(name)
+            self._ordered = ordered
+            self._ordered_dirty = False
+        return list(self._ordered)
+
+    def _bump(self):
+        self._ordered_dirty = True
+        self.version += 1
@@ -0,0 +1,187 @@
+# down_allocation_app/core/telemetry.py
+"""
+Opt-in operation timing log.
+
+Timed operations are recorded as one JSON object per line, together with
+the table dimensions, in telemetry-<machine>.jsonl under the app data
+folder. Files from many PCs can be collected into one folder and summarized
+with tools/telemetry_report.py.
+
+Events are named after the instrumented method (without a leading
+underscore):
+
+    open_project_path                open a .dax (the load, not the dialog)
+    perform_save_operation           save a .dax (the write, not the dialog)
+    export_to_excel                  Excel report export
+    paste_to_selection               paste into the top table
+    set_row_col_counts               table resize
+    update_all_tables_and_dropdowns  recompute after an edit
+
+Recording only appends to a queue; a background thread batches the records
+to disk and rotates the file, so the UI thread never waits on I/O. Nothing
+is recorded until the user enables it in Settings.
+"""
+
+import functools
+import json
+import os
+import queue
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+MAX_FILE_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 4  # Rotated files kept: telemetry-<machine>.1.jsonl ... .4.jsonl
+FLUSH_INTERVAL = 2.0  # Seconds a record may wait in the buffer
+
+
+def _machine_name():
+    try:
+        return socket.gethostname() or "unknown"
+    except OSError:
+        return "unknown"
+
+
+class Telemetry:
+    """
+    Buffered JSONL event log. record() and the timed() helpers are cheap
+    no-ops while disabled; configure() sets the folder and the opt-in flag.
+    """
+
+    def __init__(self, directory=None, enabled=False, max_bytes=MAX_FILE_BYTES, backup_count=BACKUP_COUNT):
+        self.directory = directory
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.machine = _machine_name()
+        self.session = uuid.uuid4().hex[:12]  # Groups the records of one app run
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def configure(self, directory=None, enabled=None):
+        if directory is not None:
+            self.directory = directory
+        if enabled is not None:
+            self.enabled = enabled
+
+    @property
+    def path(self):
+        safe_machine = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.machine)
+        return os.path.join(self.directory, f"telemetry-{safe_machine}.jsonl")
+
+    # region Recording
+    def record(self, event, ms, ok=True, **fields):
+        """Queues one timing record; `fields` are extra JSON values (e.g. table dimensions)."""
+        if not self.enabled or not self.directory:
+            return
+        entry = {'ts': round(time.time(), 3), 'machine': self.machine, 'session': self.session,
+                 'event': event, 'ms': round(ms, 3), 'ok': ok}
+        entry.update(fields)
+        self._queue.put(entry)
+        self._ensure_writer()
+
+    @contextmanager
+    def timed(self, event, **fields):
+        """
+        Times the with-block and records it. Yields the fields dict, so the
+        block can add values known only at the end (e.g. the new table size).
+        """
+        if not self.enabled:
+            yield fields
+            return
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield fields
+            ok = True
+        finally:
+            self.record(event, (time.perf_counter() - start) * 1000, ok, **fields)
+
+    def timed_method(self, event, fields=None):
+        """Method decorator form of timed(); `fields(instance)` is read after the call."""
+        def decorator(method):
+            @functools.wraps(method)
+            def wrapper(instance, *args, **kwargs):
+                if not self.enabled:
+                    return method(instance, *args, **kwargs)
+                start = time.perf_counter()
+                ok = False
+                try:
+                    result = method(instance, *args, **kwargs)
+                    ok = True
+                    return result
+                finally:
+                    extra = {}
+                    if fields is not None:
+                        try:
+                            extra = fields(instance)
+                        except Exception:  # A half-built window must not break the call
+                            pass
+                    self.record(event, (time.perf_counter() - start) * 1000, ok, **extra)
+            return wrapper
+        return decorator
+    # endregion
+
+    # region Writer thread
+    def _ensure_writer(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, name="telemetry-writer", daemon=True)
+                self._thread.start()
+
+    def _write_loop(self):
+        while True:
+            entry = self._queue.get()
+            batch = [entry]
+            # Collect whatever else arrives within the flush interval, then write once
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while entry is not None:
+                try:
+                    entry = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                batch.append(entry)
+            records = [record for record in batch if record is not None]
+            if records:
+                self._write(records)
+            if batch[-1] is None:
+                return
+
+    def _write(self, records):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self.path
+            if os.path.exists(path) and os.path.getsize(path) >= self.max_bytes:
+                self._rotate(path)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write("".join(json.dumps(record, separators=(',', ':')) + "\n" for record in records))
+        except OSError:
+            pass  # Timing data is best effort; a full or read-only disk just drops it
+
+    def _rotate(self, path):
+        stem = path[:-len(".jsonl")]
+        oldest = f"{stem}.{self.backup_count}.jsonl"
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for index in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(f"{stem}.{index}.jsonl"):
+                os.replace(f"{stem}.{index}.jsonl", f"{stem}.{index + 1}.jsonl")
+        os.replace(path, f"{stem}.1.jsonl")
+
+    def close(self, timeout=2.0):
+        """Writes the remaining records and stops the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+    # endregion
+
+
+# The application's log; DownAllocationApp configures it from the settings at startup
+telemetry = Telemetry()
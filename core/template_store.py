@@ -0,0 +1,156 @@
+# down_allocation_app/core/template_store.py
+"""
+Library of reusable panel templates (e.g. "JACKET BODY", "HOOD 3 PIECE"):
+named panel lists with default quantities, sizes, sewing areas and grade
+rules, kept in SQLite with the panel names alongside so templates can be
+searched by name or by the panels they contain.
+"""
+
+import json
+import os
+import sqlite3
+
+import numpy as np
+
+from core.panel_names import normalize_panel_name
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS templates (
+    name TEXT PRIMARY KEY COLLATE NOCASE,
+    panels TEXT NOT NULL DEFAULT '',
+    sizes TEXT NOT NULL DEFAULT '',
+    panel_count INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS template_panels (
+    template TEXT NOT NULL COLLATE NOCASE,
+    panel TEXT NOT NULL,
+    PRIMARY KEY (template, panel)
+);
+CREATE INDEX IF NOT EXISTS template_panels_panel ON template_panels (panel);
+"""
+
+
+class PanelTemplate:
+    """
+    A named set of panels: `names`, default `qty` (int vector), `sizes`,
+    an areas matrix (panels x sizes, NaN where the template has no area)
+    and grade rules (GradingRules.to_dict() form, keyed by panel name).
+    """
+
+    def __init__(self, name, names, qty, sizes, areas, grading_rules=None):
+        self.name = name.strip()
+        self.names = [normalize_panel_name(n) for n in names]
+        self.qty = np.asarray(qty, dtype=np.int64).reshape(len(self.names))
+        self.sizes = [str(s).strip().upper() for s in sizes]
+        self.areas = np.asarray(areas, dtype=np.float64).reshape(len(self.names), len(self.sizes))
+        self.grading_rules = dict(grading_rules or {})
+
+    @classmethod
+    def from_grid(cls, name, grid, grading_rules=None, rows=None):
+        """
+        Template from a PanelGrid: the given data rows (all named rows by
+        default), named sizes only, blank areas as NaN.
+        """
+        if rows is None:
+            rows = [row for row, panel in enumerate(grid.names) if panel]
+        rows = [row for row in rows if grid.names[row]]
+        cols = [col for col, size in enumerate(grid.sizes) if size]
+        areas = grid.areas[np.ix_(rows, cols)].copy() if rows and cols else np.zeros((len(rows), len(cols)))
+        areas[areas == 0] = np.nan
+        names = [grid.names[row] for row in rows]
+        rules = {panel: rule for panel, rule in (grading_rules or {}).items() if panel in names}
+        return cls(name, names, grid.qty[rows], [grid.sizes[col] for col in cols], areas, rules)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'sizes': self.sizes,
+            'panels': [
+                {'name': panel, 'qty': int(qty),
+                 'areas': [None if np.isnan(value) else value for value in row]}
+                for panel, qty, row in zip(self.names, self.qty.tolist(), self.areas.tolist())
+            ],
+            'grading_rules': self.grading_rules,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        panels = data.get('panels', [])
+        sizes = data.get('sizes', [])
+        areas = np.array([[np.nan if value is None else value for value in panel.get('areas', [])]
+                          for panel in panels], dtype=np.float64).reshape(len(panels), len(sizes))
+        return cls(data.get('name', ''), [panel.get('name', '') for panel in panels],
+                   [panel.get('qty', 0) for panel in panels], sizes, areas,
+                   data.get('grading_rules', {}))
+
+
+class TemplateStore:
+    """
+    Template database at `db_path` (created on first use). Each save() or
+    delete() is one transaction.
+    """
+
+    def __init__(self, db_path):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM templates").fetchone()[0]
+
+    def save(self, template):
+        """Adds the template, replacing any template of the same name."""
+        if not template.name:
+            raise ValueError("a template needs a name")
+        panels = sorted({panel for panel in template.names if panel})
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO templates (name, panels, sizes, panel_count, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (template.name, ",".join(template.names), ",".join(template.sizes),
+                 len(template.names), json.dumps(template.to_dict())))
+            self.connection.execute("DELETE FROM template_panels WHERE template = ?", (template.name,))
+            self.connection.executemany("INSERT INTO template_panels (template, panel) VALUES (?, ?)",
+                                        [(template.name, panel) for panel in panels])
+
+    def delete(self, name):
+        with self.connection:
+            self.connection.execute("DELETE FROM templates WHERE name = ?", (name,))
+            self.connection.execute("DELETE FROM template_panels WHERE template = ?", (name,))
+
+    def get(self, name):
+        """The named template, or None."""
+        row = self.connection.execute("SELECT data FROM templates WHERE name = ?", (name,)).fetchone()
+        return PanelTemplate.from_dict(json.loads(row['data'])) if row else None
+
+    def search(self, text="", panel=""):
+        """
+        Template summaries (name, panels, sizes, panel_count) whose name or
+        panel list contains `text` and, if given, that include the panel named
+        exactly `panel`. Ordered by name; the template data is not loaded.
+        """
+        clauses, params = [], []
+        if text:
+            clauses.append("(name LIKE ? OR panels LIKE ?)")
+            params.extend([f"%{text}%"] * 2)
+        if panel:
+            clauses.append("name IN (SELECT template FROM template_panels WHERE panel = ?)")
+            params.append(normalize_panel_name(panel))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.connection.execute(
+            f"SELECT name, panels, sizes, panel_count FROM templates {where} ORDER BY name", params)
+        return [dict(row) for row in rows]
@@ -0,0 +1,150 @@
+# down_allocation_app/core/validation.py
+"""
+Whole-table validation over the PanelGrid mirror.
+
+The rules are array operations over the name list, quantity vector and area
+matrix, so checking every row of a large table costs a few milliseconds.
+The Validator keeps the resulting issue list and, after single-cell edits,
+re-checks only the edited rows (and the rows sharing their panel names)
+and reports what was added and removed.
+"""
+
+import numpy as np
+
+MISSING_BASE_SIZE = "missing_base_size"  # Table-level: no usable base size column
+ZERO_BASE_AREA = "zero_base_area"  # Allocated panel with no area in the base size column
+DUPLICATE_NAME = "duplicate_name"  # Panel name used on more than one row
+ORPHAN_QTY = "orphan_qty"  # Quantity on a row without a panel name
+MISSING_QTY = "missing_qty"  # Named panel without a quantity (left out of the allocation)
+
+
+class Issue:
+    """
+    One validation finding. `row` is a data row and `col` a table column
+    (0 name, 1 quantity, 2+ sizes); both are None for table-level issues.
+    """
+
+    def __init__(self, kind, message, row=None, col=None):
+        self.kind = kind
+        self.message = message
+        self.row = row
+        self.col = col
+
+    @property
+    def key(self):
+        return self.kind, self.row, self.col
+
+    def __eq__(self, other):
+        return isinstance(other, Issue) and (self.key, self.message) == (other.key, other.message)
+
+    def __hash__(self):
+        return hash((self.key, self.message))
+
+    def __repr__(self):
+        return f"Issue({self.kind!r}, {self.message!r}, row={self.row}, col={self.col})"
+
+
+def _base_column(grid, base_size):
+    base_size = (base_size or "").strip()
+    return grid.sizes.index(base_size) if base_size and base_size in grid.sizes else -1
+
+
+class Validator:
+    """
+    Current issue list of one table. run() checks the whole grid;
+    update_rows() re-checks the given data rows after cell edits that did
+    not change the table's shape, size headers or base size. Both return
+    (added, removed): the new or changed Issues and the keys of the issues
+    that no longer apply.
+    """
+
+    def __init__(self):
+        self.issues = {}  # Issue.key -> Issue
+        self._names = []  # Panel names as of the last check
+        self._rows_by_name = {}  # Name -> set of data rows using it
+        self._shape = None
+        self._base = None
+
+    def can_update(self, grid, base_size):
+        """Whether update_rows() applies, i.e. the last run() saw the same shape, sizes and base size."""
+        return self._shape == (grid.shape, tuple(grid.sizes)) and self._base == (base_size or "").strip()
+
+    def run(self, grid, base_size):
+        self._names = list(grid.names)
+        self._rows_by_name = {}
+        for row, name in enumerate(self._names):
+            if name:
+                self._rows_by_name.setdefault(name, set()).add(row)
+        self._shape = (grid.shape, tuple(grid.sizes))
+        self._base = (base_size or "").strip()
+
+        issues = self._row_issues(grid, np.arange(len(grid.names)))
+        issues.extend(self._table_issues(grid))
+        return self._replace(lambda key: True, issues)
+
+    def update_rows(self, grid, base_size, rows):
+        affected = set(rows)
+        for row in rows:
+            old, new = self._names[row], grid.names[row]
+            if old == new:
+                continue
+            if old:
+                self._rows_by_name[old].discard(row)
+                affected |= self._rows_by_name[old]
+                if not self._rows_by_name[old]:
+                    del self._rows_by_name[old]
+            if new:
+                self._rows_by_name.setdefault(new, set()).add(row)
+                affected |= self._rows_by_name[new]
+            self._names[row] = new
+
+        issues = self._row_issues(grid, np.array(sorted(affected), dtype=np.int64))
+        issues.extend(self._table_issues(grid))
+        return self._replace(lambda key: key[1] is None or key[1] in affected, issues)
+
+    def _replace(self, covers, issues):
+        """Swaps the issues whose key `covers` matches for `issues`; returns (added, removed keys)."""
+        new = {issue.key: issue for issue in issues}
+        removed = [key for key in self.issues if covers(key) and key not in new]
+        added = [issue for key, issue in new.items() if self.issues.get(key) != issue]
+        for key in removed:
+            del self.issues[key]
+        self.issues.update(new)
+        return added, removed
+
+    def _row_issues(self, grid, rows):
+        """Row-level issues of the given data rows, evaluated as array operations."""
+        if not len(rows):
+            return []
+        names = [grid.names[row] for row in rows]
+        named = np.fromiter((bool(name) for name in names), dtype=bool, count=len(rows))
+        qty = grid.qty[rows]
+        issues = []
+
+        for row in rows[~named & (qty > 0)]:
+            issues.append(Issue(ORPHAN_QTY, f"Row {row + 1}: quantity {grid.qty[row]} without a panel name",
+                                int(row), 1))
+        for row in rows[named & (qty <= 0)]:
+            issues.append(Issue(MISSING_QTY, f"Row {row + 1}: {grid.names[row]} has no quantity and is "
+                                             "left out of the allocation", int(row), 1))
+
+        base_col = _base_column(grid, self._base)
+        if base_col != -1:
+            zero = named & (qty > 0) & (grid.areas[rows, base_col] == 0)
+            for row in rows[zero]:
+                issues.append(Issue(ZERO_BASE_AREA, f"Row {row + 1}: {grid.names[row]} has no area in base "
+                                                    f"size {grid.sizes[base_col]}", int(row), base_col + 2))
+
+        counts = np.fromiter((len(self._rows_by_name[name]) if name else 0 for name in names),
+                             dtype=np.int64, count=len(rows))
+        for row, count in zip(rows[counts > 1], counts[counts > 1]):
+            issues.append(Issue(DUPLICATE_NAME, f"Row {row + 1}: panel name {grid.names[row]} is used on "
+                                                f"{count} rows", int(row), 0))
+        return issues
+
+    def _table_issues(self, grid):
+        if not grid.valid_mask().any() or _base_column(grid, self._base) != -1:
+            return []
+        if self._base:
+            return [Issue(MISSING_BASE_SIZE, f"Base size {self._base} is not one of the size columns")]
+        return [Issue(MISSING_BASE_SIZE, "No base size is selected")]
@@ -1,4 +1,5 @@
 # down_allocation_app/main.py
+import multiprocessing
 import os
 import sys
 from PyQt6.QtWidgets import QApplication, QSplashScreen
@@ -6,16 +7,33 @@ from PyQt6.QtGui import QPixmap, QFont
 # Ensure pyqtSignal is imported for clarity
 from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, pyqtSignal
 
+from single_instance import SingleInstance
+from core.telemetry import telemetry
 from splash_screen import SplashScreen
-from ui.main_window import DownAllocationApp
+from startup_pipeline import StartupPipeline
 
 import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 
 if __name__ == "__main__":
+    # Process pool workers (report import) re-launch the frozen executable; let them run their task
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
 
+    # .dax files passed on the command line (e.g. double-clicked in Explorer)
+    project_paths = [os.path.abspath(arg) for arg in sys.argv[1:] if not arg.startswith('-')]
+
+    # If the app is already running, hand the files to it instead of starting a second copy;
+    # a plain launch opens another window, leaving the running one as the forwarding target
+    instance = SingleInstance()
+    if project_paths:
+        if instance.forward(project_paths):
+            sys.exit(0)
+        instance.listen()
+    elif not instance.running():
+        instance.listen()
+
     splash_path = os.path.join(os.path.dirname( 
         __file__), 'assets', 'splash_image.png')
     if not os.path.exists(splash_path):
@@ -29,26 +47,39 @@ if __name__ == "__main__":
     splash = SplashScreen(pixmap, version="1.0.0")
     splash.show_centered()
 
-    global main_window  # Declare global to keep main_window alive
+    # Imported only once the splash is up, so the module import time is covered by it
+    from ui.main_window import DownAllocationApp
 
-    # This function will be called when the splash screen has completed its progress and faded out.
-    def _create_and_show_main_app():
-        global main_window
-        # Now that the splash screen is guaranteed to be hidden,
-        # we can safely instantiate the main application.
-        main_window = DownAllocationApp()
-        main_window.showMaximized()
+    # The main window is built in stages while the splash is visible; the splash
+    # progress follows the stages and the window is shown as soon as they finish.
+    main_window = DownAllocationApp(staged=True)
+    pipeline = StartupPipeline(main_window.startup_stages())
+    pipeline.progress.connect(lambda value, _label: splash.set_progress(value))
 
-        # Finally, delete the splash screen object now that the main window is visible.
-        splash.deleteLater()
+    # Paths forwarded while the window is still being built are opened once it is shown
+    pending_paths = list(project_paths)
+    instance.open_requested.connect(
+        lambda path: main_window.open_project_path(path) if main_window.isVisible()
+        else pending_paths.append(path))
+    instance.activate_requested.connect(
+        lambda: main_window.bring_to_front() if main_window.isVisible() else None)
+
+    def _show_main_app():
+        main_window.showMaximized()
+        splash.fade_out()
+        for path in pending_paths:
+            main_window.open_project_path(path)
+        pending_paths.clear()
 
-    # Connect the splash screen's signal to our main app creation function.
-    # The splash screen will emit this signal only after its progress bar is 100% and it has faded out.
-    splash.progress_complete_and_faded_out.connect(_create_and_show_main_app)
+    pipeline.finished.connect(_show_main_app)
+    # Write out buffered timing records before the process exits
+    app.aboutToQuit.connect(telemetry.close)
+    # Once the splash has faded out, delete it and ask for factory info (first run only)
+    splash.progress_complete_and_faded_out.connect(splash.deleteLater)
+    splash.progress_complete_and_faded_out.connect(
+        main_window.prompt_factory_info_if_missing)
 
-    # Start the splash screen's animation (progress bar fills and then fade-in occurs simultaneously).
-    # The fade-out will be triggered internally by the splash screen when progress is complete.
-    # Use a duration that allows progress bar to complete visually
-    splash.start_animation(duration=2500)
+    splash.start_animation()
+    pipeline.start()
 
     sys.exit(app.exec())
@@ -0,0 +1,93 @@
+# down_allocation_app/single_instance.py
+
+import getpass
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+
+
+def _server_name():
+    # One instance per user: another user's session has its own
+    try:
+        user = getpass.getuser()
+    except Exception:  # No usable user name in the environment
+        user = "user"
+    return f"DownAllocationApp-{user}"
+
+
+class SingleInstance(QObject):
+    """
+    Keeps one running app per user for opening files. A launch with files
+    first calls forward(): if an instance is already listening, the file
+    paths are handed to it over a local socket and the new process can exit
+    before building anything. Otherwise it calls listen() and becomes the
+    instance later launches forward to. A launch without files still opens
+    its own window (checking running() so it does not take over the name).
+
+    Wire format: UTF-8 file paths, one per line; the running window comes to
+    the front and opens them. A connection with no paths (running()) is ignored.
+    """
+    open_requested = pyqtSignal(str)
+    activate_requested = pyqtSignal()
+
+    def __init__(self, name=None, parent=None):
+        super().__init__(parent)
+        self.name = name or _server_name()
+        self.server = None
+        self._buffers = {}
+
+    def running(self, timeout_ms=500):
+        """Whether another instance is listening."""
+        socket = QLocalSocket()
+        socket.connectToServer(self.name)
+        if not socket.waitForConnected(timeout_ms):
+            return False
+        socket.abort()  # An empty connection; the server only sees a hang-up
+        return True
+
+    def forward(self, paths, timeout_ms=500):
+        """Sends `paths` to a running instance; returns False if there is none."""
+        socket = QLocalSocket()
+        socket.connectToServer(self.name)
+        if not socket.waitForConnected(timeout_ms):
+            return False
+        socket.write("".join(f"{path}\n" for path in paths).encode('utf-8'))
+        socket.flush()
+        socket.waitForBytesWritten(timeout_ms)
+        socket.disconnectFromServer()
+        if socket.state() != QLocalSocket.LocalSocketState.UnconnectedState:
+            socket.waitForDisconnected(timeout_ms)
+        return True
+
+    def listen(self):
+        """Starts accepting forwarded paths; returns False if the server could not start."""
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self._accept_connections)
+        if self.server.listen(self.name):
+            return True
+        # forward() found nobody listening, so the name is left over from a crashed instance
+        QLocalServer.removeServer(self.name)
+        return self.server.listen(self.name)
+
+    def _accept_connections(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self._buffers[socket] = bytearray()
+            socket.readyRead.connect(lambda s=socket: self._buffers[s].extend(s.readAll().data()))
+            socket.disconnected.connect(lambda s=socket: self._finish_connection(s))
+            if socket.state() != QLocalSocket.LocalSocketState.ConnectedState:
+                # The client can write and hang up before the signals are connected
+                self._finish_connection(socket)
+
+    def _finish_connection(self, socket):
+        buffer = self._buffers.pop(socket, None)
+        if buffer is None:
+            return
+        buffer.extend(socket.readAll().data())
+        socket.deleteLater()
+        paths = [line.strip() for line in buffer.decode('utf-8', errors='replace').splitlines() if line.strip()]
+        if not paths:
+            return
+        self.activate_requested.emit()
+        for path in paths:
+            self.open_requested.emit(path)
@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QPixmap, QColor, QFont, QPainter
 # Re-added pyqtSignal
-from PyQt6.QtCore import Qt, QTimer, QRect, QPropertyAnimation, QEasingCurve, pyqtSignal
+from PyQt6.QtCore import Qt, QRect, QPropertyAnimation, QEasingCurve, pyqtSignal
 
 
 class SplashScreen(QSplashScreen):
@@ -73,11 +73,7 @@ class SplashScreen(QSplashScreen):
         layout.addStretch()  # Push the progress bar to the bottom
         layout.addWidget(self.progress)
 
-        self.progress_value = 0  # Initial progress value
-
-        # Timer for progress bar animation
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_progress)
+        self.progress_value = 0  # Initial progress value; driven by the startup stages
 
         # Show version message using QSplashScreen's built-in functionality - Restored original
         self.setFont(QFont("Arial", 8, QFont.Weight.Bold))
@@ -108,27 +104,22 @@ class SplashScreen(QSplashScreen):
         self.fade_anim.start()
 
     def fade_out(self):
-        # Starts the fade-out animation.
-        self.fade_anim.setStartValue(1.0)
+        # Starts the fade-out animation (from wherever a running fade-in got to).
+        self.fade_anim.stop()
+        self.fade_anim.setStartValue(self.opacity_effect.opacity())
         self.fade_anim.setEndValue(0.0)
         self.fade_anim.start()
 
-    def start_animation(self, duration=2500):
-        """Starts the progress bar and fade-in animation."""
-        self.progress_value = 0
-        self.progress.setValue(0)
-        interval = duration // 100
-        self.timer.start(interval)
+    def start_animation(self):
+        """Resets the progress bar and starts the fade-in; progress is then set per startup stage."""
+        self.set_progress(0)
         self.fade_in()  # Starts fade-in when animation begins.
 
-    def update_progress(self):
-        """Updates the progress bar and triggers fade-out when complete."""
-        if self.progress_value < 100:
-            self.progress_value += 1
-            self.progress.setValue(self.progress_value)
-        else:
-            self.timer.stop()  # Stop progress timer
-            self.fade_out()  # Trigger the fade-out as progress completes.
+    def set_progress(self, value):
+        """Sets the progress bar to `value` (0-100) and repaints right away."""
+        self.progress_value = value
+        self.progress.setValue(value)
+        self.repaint()
 
     def _on_fade_finished(self):
         """Handler for when the fade animation finishes."""
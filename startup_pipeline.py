@@ -0,0 +1,33 @@
+# down_allocation_app/startup_pipeline.py
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class StartupPipeline(QObject):
+    """
+    Runs a list of (label, callable) startup stages one per event loop turn,
+    so the splash screen keeps painting while the main window is built.
+    """
+    # Percentage of stages completed (0-100) and the label of the stage just run
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal()
+
+    def __init__(self, stages, parent=None):
+        super().__init__(parent)
+        self.stages = list(stages)
+        self._next_stage = 0
+
+    def start(self):
+        self._next_stage = 0
+        QTimer.singleShot(0, self._run_next_stage)
+
+    def _run_next_stage(self):
+        label, stage = self.stages[self._next_stage]
+        stage()
+        self._next_stage += 1
+        self.progress.emit(100 * self._next_stage // len(self.stages), label)
+
+        if self._next_stage < len(self.stages):
+            QTimer.singleShot(0, self._run_next_stage)
+        else:
+            self.finished.emit()
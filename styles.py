@@ -22,6 +22,15 @@ class AppStyles:
 
     DEFAULT_DATA_ROWS = 10
     DEFAULT_COLS = 10
+
+    # Table limits (configurable in Settings; raise them for large BOM sheets)
+    MAX_PANEL_ROWS = 100
+    MAX_SIZE_COLS = 50
+    MAX_PANEL_QTY = 9
+    MAX_SEWING_AREA = 9999
+
+    # On-disk cache of computed allocations and exported reports
+    RESULT_CACHE_MAX_MB = 256
     INPUT_FIELD_HEIGHT = 10  # Increased to 30 to match button heights and prevent cropping
     HORIZONTAL_FORM_SPACING = 30  # This controls spacing within form elements
 
@@ -35,6 +44,8 @@ class AppStyles:
 
     # Colors
     TABLE_HINT_TEXT_COLOR = QColor(150, 150, 150)  # Light gray for hint text
+    BASE_SIZE_HIGHLIGHT_COLOR = QColor(220, 230, 241)  # Light blue base size column (top table)
+    BASE_SIZE_TEXT_COLOR = QColor(0, 0, 255)  # Blue base size text (bottom table)
 
     # New constant for Approximate Weight calculation
     APPROX_WEIGHT_FACTOR = 0.02094
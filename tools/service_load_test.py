@@ -0,0 +1,156 @@
+# down_allocation_app/tools/service_load_test.py
+"""
+Load test for the local allocation service (core/allocation_service.py).
+
+    python tools/service_load_test.py --spawn --clients 16 --requests 200
+
+--spawn starts the service in a subprocess on a free port; otherwise point
+--port at a running one. Reports throughput and latency percentiles.
+Standard library only.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+HOST = "127.0.0.1"
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def make_payload(rng, panels, sizes):
+    """Random .dax-shaped style payload."""
+    size_names = [f"S{i + 1}" for i in range(sizes)]
+    return {
+        'top_table_data': {
+            'size_names': size_names,
+            'panel_data': [
+                {'name': f"PANEL {p + 1}", 'qty': str(rng.randint(1, 4)),
+                 'areas': [f"{rng.uniform(5, 400):.2f}" for _ in range(sizes)]}
+                for p in range(panels)
+            ],
+        },
+        'input_data': {
+            'base_size': rng.choice(size_names),
+            'ecodown_weight': f"{rng.uniform(80, 400):.1f}",
+            'garment_weight': rng.choice(["", f"{rng.uniform(5, 40):.1f}"]),
+        },
+    }
+
+
+async def post_json(reader, writer, path, payload):
+    body = json.dumps(payload).encode('utf-8')
+    writer.write((f"POST {path} HTTP/1.1\r\nHost: {HOST}\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                  ).encode('latin-1') + body)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(port, payloads, batch, latencies, errors):
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        for start in range(0, len(payloads), batch):
+            chunk = payloads[start:start + batch]
+            body = chunk[0] if batch == 1 else {'batch': chunk}
+            began = time.perf_counter()
+            status, response = await post_json(reader, writer, '/allocate', body)
+            latencies.append(time.perf_counter() - began)
+            if status != 200:
+                errors.append(response)
+    finally:
+        writer.close()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((HOST, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"service did not start on port {port}")
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    # A pool of distinct styles; requests draw from it, so repeats exercise the cache
+    distinct = [make_payload(rng, args.panels, args.sizes) for _ in range(args.distinct)]
+    per_client = [[rng.choice(distinct) for _ in range(args.requests)] for _ in range(args.clients)]
+
+    latencies, errors = [], []
+    began = time.perf_counter()
+    await asyncio.gather(*(client(args.port, payloads, args.batch, latencies, errors)
+                           for payloads in per_client))
+    elapsed = time.perf_counter() - began
+
+    total_styles = args.clients * args.requests
+    latencies.sort()
+    print(f"{total_styles} styles in {len(latencies)} requests over {elapsed:.2f} s "
+          f"({total_styles / elapsed:.0f} styles/s), {len(errors)} errors")
+    print("latency ms: p50 {:.1f}  p95 {:.1f}  p99 {:.1f}  max {:.1f}".format(
+        *(1000 * percentile(latencies, f) for f in (0.5, 0.95, 0.99, 1.0))))
+    if errors:
+        print("first error:", errors[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--spawn', action='store_true', help="start the service for the test")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes when spawning")
+    parser.add_argument('--clients', type=int, default=8, help="concurrent connections")
+    parser.add_argument('--requests', type=int, default=100, help="styles per client")
+    parser.add_argument('--batch', type=int, default=1, help="styles per request")
+    parser.add_argument('--distinct', type=int, default=50, help="distinct styles in the pool")
+    parser.add_argument('--panels', type=int, default=40)
+    parser.add_argument('--sizes', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    process = None
+    if args.spawn:
+        args.port = free_port()
+        command = [sys.executable, '-m', 'core.allocation_service', '--port', str(args.port)]
+        if args.workers is not None:
+            command += ['--workers', str(args.workers)]
+        process = subprocess.Popen(command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL)
+    try:
+        wait_for_port(args.port)
+        asyncio.run(run(args))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
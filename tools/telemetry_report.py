@@ -0,0 +1,121 @@
+# down_allocation_app/tools/telemetry_report.py
+"""
+Summarizes operation timings collected from the app's telemetry logs.
+
+    python tools/telemetry_report.py collected/ --by machine
+
+Takes .jsonl files or folders of them (e.g. the telemetry folders copied from
+each PC, rotated files included) and prints count and latency percentiles
+per event; --by adds the machine or a table size bucket to the grouping.
+Standard library only.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+# Upper bounds of the panel count buckets for --by size
+SIZE_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+BUCKET_LABELS = [f"<={bound} panels" for bound in SIZE_BUCKETS] + [f">{SIZE_BUCKETS[-1]} panels", "unknown size"]
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def log_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _dirs, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith('.jsonl'):
+                        yield os.path.join(folder, name)
+        else:
+            yield path
+
+
+def read_records(paths, since=None):
+    """Timing records from the files; unreadable lines (e.g. cut off by a crash) are skipped."""
+    skipped = 0
+    records = []
+    for path in log_files(paths):
+        with open(path, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    float(record['ms'])
+                except (ValueError, KeyError, TypeError):
+                    skipped += 1
+                    continue
+                if since is None or record.get('ts', 0) >= since:
+                    records.append(record)
+    return records, skipped
+
+
+def size_bucket(panels):
+    """Index into BUCKET_LABELS, so buckets sort by size."""
+    if not isinstance(panels, int):
+        return len(SIZE_BUCKETS) + 1
+    for index, bound in enumerate(SIZE_BUCKETS):
+        if panels <= bound:
+            return index
+    return len(SIZE_BUCKETS)
+
+
+def summarize(records, by=None):
+    """Rows of (group label, count, machines, failures, p50, p90, p99, max) sorted by group."""
+    groups = defaultdict(list)
+    for record in records:
+        key = [record.get('event', '?')]
+        if by == 'machine':
+            key.append(record.get('machine', '?'))
+        elif by == 'size':
+            key.append(size_bucket(record.get('panels')))
+        groups[tuple(key)].append(record)
+
+    rows = []
+    for key in sorted(groups):
+        group = groups[key]
+        times = sorted(float(record['ms']) for record in group)
+        label = " / ".join([key[0], BUCKET_LABELS[key[1]]] if by == 'size' else key)
+        rows.append((label, len(group), len({record.get('machine') for record in group}),
+                     sum(1 for record in group if not record.get('ok', True)),
+                     *(percentile(times, f) for f in (0.5, 0.9, 0.99, 1.0))))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='+', help=".jsonl files or folders containing them")
+    parser.add_argument('--by', choices=['machine', 'size'], help="also group by machine or panel count")
+    parser.add_argument('--event', action='append', help="only these events (repeatable)")
+    parser.add_argument('--days', type=float, help="only records from the last N days")
+    args = parser.parse_args()
+
+    since = time.time() - args.days * 86400 if args.days else None
+    records, skipped = read_records(args.paths, since)
+    if args.event:
+        records = [record for record in records if record.get('event') in args.event]
+    if not records:
+        print("no timing records found", file=sys.stderr)
+        return 1
+
+    machines = len({record.get('machine') for record in records})
+    print(f"{len(records)} records from {machines} machines"
+          + (f" ({skipped} unreadable lines skipped)" if skipped else ""))
+    rows = summarize(records, args.by)
+    width = max(len(label) for label, *_ in rows)
+    print(f"{'event':<{width}}  {'count':>7}  {'PCs':>4}  {'fail':>4}  "
+          f"{'p50 ms':>9}  {'p90 ms':>9}  {'p99 ms':>9}  {'max ms':>9}")
+    for label, count, pcs, failures, p50, p90, p99, slowest in rows:
+        print(f"{label:<{width}}  {count:>7}  {pcs:>4}  {failures:>4}  "
+              f"{p50:>9.1f}  {p90:>9.1f}  {p99:>9.1f}  {slowest:>9.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,159 @@
+# down_allocation_app/ui/dialogs/cad_import_dialog.py
+
+import math
+import os
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QLineEdit,
+                             QComboBox, QPushButton, QTableWidget, QTableWidgetItem,
+                             QAbstractItemView, QDialogButtonBox, QFileDialog, QMessageBox)
+from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QSettings
+
+from core.cad_import import UNIT_TO_CM, AREA_UNIT_TO_CM2, import_pattern
+from styles import AppStyles
+
+
+class CadImportDialog(QDialog):
+    """
+    Reads a DXF / polygon CSV pattern export and previews the panel x size
+    areas; on accept, `result` holds the CadImport to load into the top table.
+    """
+
+    def __init__(self, initial_dir="", parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Import CAD Pattern Areas")
+        self.resize(900, 560)
+
+        self.settings = QSettings("DownAllocation", "AppSettings")
+        self.initial_dir = initial_dir
+        self.result = None
+        self.setup_ui()
+
+    def setup_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(12)
+
+        form_layout = QFormLayout()
+        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+        file_layout = QHBoxLayout()
+        self.file_input = QLineEdit()
+        self.file_input.setReadOnly(True)
+        self.file_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        browse_btn = QPushButton("Browse...")
+        browse_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        browse_btn.clicked.connect(self.browse)
+        file_layout.addWidget(self.file_input, 1)
+        file_layout.addWidget(browse_btn)
+        form_layout.addRow(QLabel("Pattern File:"), file_layout)
+
+        # "From file" uses the DXF $INSUNITS header (centimetres if absent)
+        self.drawing_unit_combo = QComboBox()
+        self.drawing_unit_combo.setStyleSheet(AppStyles.COMBO_BOX_STYLE)
+        self.drawing_unit_combo.addItem("From file", None)
+        for unit in UNIT_TO_CM:
+            self.drawing_unit_combo.addItem(unit, unit)
+        self.drawing_unit_combo.setCurrentIndex(max(0, self.drawing_unit_combo.findData(
+            self.settings.value("cad_import/drawing_unit", None))))
+        form_layout.addRow(QLabel("Drawing Unit:"), self.drawing_unit_combo)
+
+        self.area_unit_combo = QComboBox()
+        self.area_unit_combo.setStyleSheet(AppStyles.COMBO_BOX_STYLE)
+        self.area_unit_combo.addItems(list(AREA_UNIT_TO_CM2))
+        self.area_unit_combo.setCurrentText(self.settings.value("cad_import/area_unit", "cm²"))
+        form_layout.addRow(QLabel("Sewing Area Unit:"), self.area_unit_combo)
+
+        self.default_size_input = QLineEdit()
+        self.default_size_input.setPlaceholderText("Size for pieces without one, e.g. M")
+        self.default_size_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        form_layout.addRow(QLabel("Default Size:"), self.default_size_input)
+        main_layout.addLayout(form_layout)
+
+        for combo in (self.drawing_unit_combo, self.area_unit_combo):
+            combo.currentIndexChanged.connect(self.load_preview)
+        self.default_size_input.editingFinished.connect(self.load_preview)
+
+        self.status_label = QLabel("")
+        main_layout.addWidget(self.status_label)
+
+        self.preview_table = QTableWidget()
+        self.preview_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.preview_table.setFont(QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
+        main_layout.addWidget(self.preview_table, 1)
+
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.import_btn = button_box.button(QDialogButtonBox.StandardButton.Ok)
+        self.import_btn.setText("Import")
+        self.import_btn.setEnabled(False)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box)
+
+    def browse(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Open Pattern Export", self.initial_dir,
+            "Pattern Files (*.dxf *.csv);;DXF Files (*.dxf);;CSV Files (*.csv);;All Files (*)")
+        if file_path:
+            self.file_input.setText(file_path)
+            self.initial_dir = os.path.dirname(file_path)
+            self.load_preview()
+
+    def load_preview(self):
+        file_path = self.file_input.text()
+        if not file_path:
+            return
+        try:
+            self.result = import_pattern(
+                file_path, self.drawing_unit_combo.currentData(),
+                self.area_unit_combo.currentText(),
+                self.default_size_input.text().strip().upper(), AppStyles.MAX_SEWING_AREA)
+        except (OSError, ValueError, UnicodeDecodeError) as e:
+            self.result = None
+            self.import_btn.setEnabled(False)
+            self.status_label.setText("")
+            self.preview_table.clear()
+            QMessageBox.warning(self, "Import Error", f"Could not read the pattern file: {e}")
+            return
+
+        result = self.result
+        status = f"{result.piece_count} pieces, {len(result.names)} panels, {len(result.sizes)} sizes"
+        if result.rejected:
+            status += (f" - {len(result.rejected)} area(s) above {AppStyles.MAX_SEWING_AREA} are left blank; "
+                       "check the units")
+        self.status_label.setText(status)
+        self.import_btn.setEnabled(bool(result.names))
+
+        self.preview_table.setUpdatesEnabled(False)
+        self.preview_table.clear()
+        self.preview_table.setRowCount(len(result.names))
+        self.preview_table.setColumnCount(len(result.sizes) + 1)
+        self.preview_table.setHorizontalHeaderLabels(["QTY"] + [size or "(no size)" for size in result.sizes])
+        self.preview_table.setVerticalHeaderLabels(result.names)
+        for row, values in enumerate(result.areas):
+            self.preview_table.setItem(row, 0, QTableWidgetItem(str(int(result.qty[row]))))
+            for col, value in enumerate(values):
+                if not math.isnan(value):
+                    item = QTableWidgetItem(f"{value:.2f}")
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                    self.preview_table.setItem(row, col + 1, item)
+        for row, col, value in result.rejected:
+            item = QTableWidgetItem(f"{value:.2f}")
+            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            item.setForeground(QColor("#dc3545"))
+            item.setToolTip(f"Above the maximum sewing area ({AppStyles.MAX_SEWING_AREA}); not imported")
+            self.preview_table.setItem(row, col + 1, item)
+        self.preview_table.resizeColumnsToContents()
+        self.preview_table.setUpdatesEnabled(True)
+
+    def accept(self):
+        if self.result is None:
+            return
+        if "" in self.result.sizes:
+            QMessageBox.warning(self, "Import CAD Pattern Areas",
+                                "Some pieces have no size; enter a Default Size for them.")
+            return
+        self.settings.setValue("cad_import/drawing_unit", self.drawing_unit_combo.currentData())
+        self.settings.setValue("cad_import/area_unit", self.area_unit_combo.currentText())
+        super().accept()
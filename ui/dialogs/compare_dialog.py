@@ -0,0 +1,278 @@
+# down_allocation_app/ui/dialogs/compare_dialog.py
+
+import math
+import os
+
+import numpy as np
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QLineEdit,
+                             QComboBox, QCheckBox, QPushButton, QTableView, QTableWidget,
+                             QTableWidgetItem, QAbstractItemView, QSplitter, QFileDialog,
+                             QMessageBox)
+from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from core.project_diff import compare_files
+from styles import AppStyles
+
+_CHANGED_COLOR = QColor("#FFF3B0")
+_ADDED_COLOR = QColor("#D4EDDA")
+_REMOVED_COLOR = QColor("#F8D7DA")
+_ABSENT_COLOR = QColor("#A0A0A0")
+
+# View modes: (label, ProjectDiff attribute prefix, changed-mask attribute)
+_MODES = [("Sewing Area", 'areas', 'area_changed'), ("Down Weight", 'down', 'down_changed')]
+
+
+class _DiffSideModel(QAbstractTableModel):
+    """
+    One version of a ProjectDiff (old or new) as a read-only table: PANEL,
+    QTY, then one column per size. Cells are formatted on demand from the
+    diff arrays, so large tables cost no per-cell widgets.
+    """
+
+    def __init__(self, diff, side, parent=None):
+        super().__init__(parent)
+        self.diff = diff
+        self.side = side  # 'old' or 'new'
+        self.present = getattr(diff, f"{side}_present")
+        self.qty = getattr(diff, f"{side}_qty")
+        self.rows = np.arange(len(diff.names))
+        self.values = None
+        self.changed = None
+        self.set_mode(0)
+
+    def set_mode(self, mode):
+        _label, prefix, changed = _MODES[mode]
+        self.beginResetModel()
+        self.values = getattr(self.diff, f"{self.side}_{prefix}")
+        self.changed = getattr(self.diff, changed)
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.diff.sizes) + 2
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Vertical:
+            return str(section + 1)
+        return ["PANEL", "QTY"][section] if section < 2 else self.diff.sizes[section - 2]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = int(self.rows[index.row()])
+        col = index.column()
+        present = self.present[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return self.diff.names[row]
+            if not present:
+                return ""
+            if col == 1:
+                return str(int(self.qty[row])) if self.qty[row] else ""
+            value = self.values[row, col - 2]
+            return "" if math.isnan(value) or value == 0 else f"{value:.2f}"
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if self.side == 'old' and self.diff.removed_panels[row]:
+                return _REMOVED_COLOR
+            if self.side == 'new' and self.diff.added_panels[row]:
+                return _ADDED_COLOR
+            if not present:
+                return None
+            if col == 1 and self.diff.qty_changed[row]:
+                return _CHANGED_COLOR
+            if col >= 2 and self.changed[row, col - 2]:
+                return _CHANGED_COLOR
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole and not present:
+            return _ABSENT_COLOR
+        if role == Qt.ItemDataRole.TextAlignmentRole and col > 0:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+
+class CompareDialog(QDialog):
+    """
+    Side-by-side comparison of two .dax versions: panels and sizes aligned by
+    name, changed cells highlighted, and the per-size total down change.
+    """
+
+    def __init__(self, old_path="", new_path="", initial_dir="", parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Compare Projects")
+        self.resize(1200, 720)
+
+        self.initial_dir = initial_dir
+        self.diff = None
+        self.models = []
+        self.setup_ui(old_path, new_path)
+        if old_path and new_path:
+            self.run_compare()
+
+    def setup_ui(self, old_path, new_path):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(12)
+
+        form_layout = QFormLayout()
+        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self.old_input = self._add_file_row(form_layout, "Old Version:", old_path)
+        self.new_input = self._add_file_row(form_layout, "New Version:", new_path)
+        main_layout.addLayout(form_layout)
+
+        options_layout = QHBoxLayout()
+        compare_btn = QPushButton("Compare")
+        compare_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        compare_btn.clicked.connect(self.run_compare)
+        self.mode_combo = QComboBox()
+        self.mode_combo.setStyleSheet(AppStyles.COMBO_BOX_STYLE)
+        self.mode_combo.addItems([label for label, _prefix, _changed in _MODES])
+        self.mode_combo.currentIndexChanged.connect(self._set_mode)
+        self.changed_only_check = QCheckBox("Changed panels only")
+        self.changed_only_check.toggled.connect(self._apply_row_filter)
+        options_layout.addWidget(compare_btn)
+        options_layout.addWidget(QLabel("Show:"))
+        options_layout.addWidget(self.mode_combo)
+        options_layout.addWidget(self.changed_only_check)
+        options_layout.addStretch(1)
+        main_layout.addLayout(options_layout)
+
+        self.summary_label = QLabel("")
+        self.summary_label.setWordWrap(True)
+        main_layout.addWidget(self.summary_label)
+
+        # Old | New, scrolled together
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        self.old_view = self._make_view()
+        self.new_view = self._make_view()
+        splitter.addWidget(self.old_view)
+        splitter.addWidget(self.new_view)
+        for first, second in ((self.old_view, self.new_view), (self.new_view, self.old_view)):
+            first.verticalScrollBar().valueChanged.connect(second.verticalScrollBar().setValue)
+            first.horizontalScrollBar().valueChanged.connect(second.horizontalScrollBar().setValue)
+        main_layout.addWidget(splitter, 1)
+
+        main_layout.addWidget(QLabel("Total down weight per size (g):"))
+        self.totals_table = QTableWidget(3, 0)
+        self.totals_table.setVerticalHeaderLabels(["Old", "New", "Change"])
+        self.totals_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.totals_table.setFont(QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
+        self.totals_table.setMaximumHeight(130)
+        main_layout.addWidget(self.totals_table)
+
+        close_btn = QPushButton("Close")
+        close_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        close_btn.clicked.connect(self.accept)
+        close_layout = QHBoxLayout()
+        close_layout.addStretch(1)
+        close_layout.addWidget(close_btn)
+        main_layout.addLayout(close_layout)
+
+    def _add_file_row(self, form_layout, label, path):
+        row_layout = QHBoxLayout()
+        line_edit = QLineEdit(path)
+        line_edit.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        browse_btn = QPushButton("Browse...")
+        browse_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        browse_btn.clicked.connect(lambda: self._browse(line_edit))
+        row_layout.addWidget(line_edit, 1)
+        row_layout.addWidget(browse_btn)
+        form_layout.addRow(QLabel(label), row_layout)
+        return line_edit
+
+    def _make_view(self):
+        view = QTableView()
+        view.setFont(QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
+        view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        view.verticalHeader().setDefaultSectionSize(24)
+        return view
+
+    def _browse(self, line_edit):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Select Project", line_edit.text() or self.initial_dir,
+            "Down Allocation Files (*.dax);;All Files (*)")
+        if file_path:
+            line_edit.setText(file_path)
+            self.initial_dir = os.path.dirname(file_path)
+
+    def run_compare(self):
+        old_path, new_path = self.old_input.text().strip(), self.new_input.text().strip()
+        if not old_path or not new_path:
+            return
+        try:
+            self.diff = compare_files(old_path, new_path)
+        except (OSError, ValueError) as e:  # json.JSONDecodeError is a ValueError
+            QMessageBox.warning(self, "Compare Projects", f"Could not compare the projects: {e}")
+            return
+
+        diff = self.diff
+        self.models = [_DiffSideModel(diff, 'old', self), _DiffSideModel(diff, 'new', self)]
+        self.old_view.setModel(self.models[0])
+        self.new_view.setModel(self.models[1])
+        self._set_mode(self.mode_combo.currentIndex())
+        self._apply_row_filter()
+        self._show_summary()
+        self._show_totals()
+
+    def _set_mode(self, mode):
+        for model in self.models:
+            model.set_mode(mode)
+        for view in (self.old_view, self.new_view):
+            if view.model() is not None:
+                view.resizeColumnsToContents()
+
+    def _apply_row_filter(self):
+        diff = self.diff
+        if diff is None:
+            return
+        if self.changed_only_check.isChecked():
+            row_changed = (diff.added_panels | diff.removed_panels | diff.qty_changed
+                           | diff.area_changed.any(axis=1) | diff.down_changed.any(axis=1))
+            rows = np.flatnonzero(row_changed)
+        else:
+            rows = np.arange(len(diff.names))
+        for model in self.models:
+            model.set_rows(rows)
+
+    def _show_summary(self):
+        summary = self.diff.summary()
+        parts = []
+        for key, label in (('panels_added', "added"), ('panels_removed', "removed")):
+            if summary[key]:
+                parts.append(f"Panels {label}: {', '.join(summary[key])}")
+        for key, label in (('sizes_added', "added"), ('sizes_removed', "removed")):
+            if summary[key]:
+                parts.append(f"Sizes {label}: {', '.join(summary[key])}")
+        if summary['qty_changes']:
+            parts.append(f"{summary['qty_changes']} quantity change(s)")
+        if summary['area_changes']:
+            parts.append(f"{summary['area_changes']} area change(s)")
+        for key, (old_value, new_value) in summary['input_changes'].items():
+            parts.append(f"{key.replace('_', ' ').title()}: {old_value or '-'} → {new_value or '-'}")
+        self.summary_label.setText("; ".join(parts) if parts else "No differences.")
+
+    def _show_totals(self):
+        diff = self.diff
+        self.totals_table.setColumnCount(len(diff.sizes))
+        self.totals_table.setHorizontalHeaderLabels(diff.sizes)
+        for row, values in enumerate((diff.old_down_totals, diff.new_down_totals, diff.down_totals_delta)):
+            for col, value in enumerate(values.tolist()):
+                if math.isnan(value):
+                    text = ""
+                elif row == 2:
+                    text = f"{round(value):+d}" if round(value) else "0"
+                else:
+                    text = f"{value:.0f}"
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                if row == 2 and round(value) != 0:
+                    item.setBackground(_CHANGED_COLOR)
+                self.totals_table.setItem(row, col, item)
+        self.totals_table.resizeColumnsToContents()
@@ -0,0 +1,117 @@
+# down_allocation_app/ui/dialogs/grading_dialog.py
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox,
+                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QDialogButtonBox, QMessageBox)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+
+from core.grading import (GRADE_NONE, GRADE_LINEAR, GRADE_PERCENT, GRADE_TABLE, GradeRule,
+                          GradingRules)
+from styles import AppStyles
+
+# Combo box labels for each rule kind
+_RULE_LABELS = [
+    (GRADE_NONE, "None"),
+    (GRADE_LINEAR, "Linear (+area/size)"),
+    (GRADE_PERCENT, "Percent (%/size)"),
+    (GRADE_TABLE, "Table (SIZE:factor)"),
+]
+
+
+class GradingDialog(QDialog):
+    """
+    Edits per-panel grade rules. On accept, get_rules() returns the new
+    GradingRules; the main window regenerates the size columns from them.
+    """
+
+    def __init__(self, panel_names, rules, base_size="", parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Size Grading")
+        self.resize(720, 500)
+
+        self.panel_names = panel_names
+        self.rules = rules
+        self.setup_ui(base_size)
+
+    def setup_ui(self, base_size):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(12)
+
+        info_label = QLabel(
+            f"Areas are generated from the base size column ({base_size or 'none selected'}); "
+            "each column to the right is one size step up, each to the left one step down.")
+        info_label.setWordWrap(True)
+        main_layout.addWidget(info_label)
+
+        # Quick fill: one rule for every panel
+        fill_layout = QHBoxLayout()
+        self.fill_kind_combo = self._make_kind_combo(GRADE_LINEAR)
+        self.fill_value_input = QLineEdit()
+        self.fill_value_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        fill_btn = QPushButton("Set for All Panels")
+        fill_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        fill_btn.clicked.connect(self._fill_all)
+        fill_layout.addWidget(self.fill_kind_combo)
+        fill_layout.addWidget(self.fill_value_input, 1)
+        fill_layout.addWidget(fill_btn)
+        main_layout.addLayout(fill_layout)
+
+        self.table = QTableWidget(len(self.panel_names), 3)
+        self.table.setHorizontalHeaderLabels(["Panel", "Rule", "Value"])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setFont(QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        for row, name in enumerate(self.panel_names):
+            rule = self.rules.get(name) or GradeRule()
+            name_item = QTableWidgetItem(name)
+            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            self.table.setItem(row, 0, name_item)
+            self.table.setCellWidget(row, 1, self._make_kind_combo(rule.kind))
+            self.table.setItem(row, 2, QTableWidgetItem(rule.to_text()))
+        self.table.resizeColumnToContents(0)
+        self.table.resizeColumnToContents(1)
+        main_layout.addWidget(self.table, 1)
+
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.button(QDialogButtonBox.StandardButton.Ok).setText("Generate")
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box)
+
+    @staticmethod
+    def _make_kind_combo(kind):
+        combo = QComboBox()
+        combo.setStyleSheet(AppStyles.COMBO_BOX_STYLE)
+        for value, label in _RULE_LABELS:
+            combo.addItem(label, value)
+        combo.setCurrentIndex(combo.findData(kind))
+        return combo
+
+    def _fill_all(self):
+        kind = self.fill_kind_combo.currentData()
+        for row in range(self.table.rowCount()):
+            combo = self.table.cellWidget(row, 1)
+            combo.setCurrentIndex(combo.findData(kind))
+            self.table.item(row, 2).setText(self.fill_value_input.text())
+
+    def get_rules(self):
+        """Rules as edited; raises ValueError naming the first invalid row."""
+        rules = GradingRules(self.rules.rules)
+        for row, name in enumerate(self.panel_names):
+            kind = self.table.cellWidget(row, 1).currentData()
+            try:
+                rules.set(name, GradeRule.from_text(kind, self.table.item(row, 2).text()))
+            except ValueError as e:
+                raise ValueError(f"{name}: {e}") from e
+        return rules
+
+    def accept(self):
+        try:
+            self.get_rules()
+        except ValueError as e:
+            QMessageBox.warning(self, "Size Grading", f"Invalid rule for {e}")
+            return
+        super().accept()
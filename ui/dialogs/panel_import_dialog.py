@@ -0,0 +1,244 @@
+# down_allocation_app/ui/dialogs/panel_import_dialog.py
+
+import json
+import os
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QLineEdit,
+                             QComboBox, QSpinBox, QPushButton, QTableWidget, QTableWidgetItem,
+                             QListWidget, QHeaderView, QDialogButtonBox, QFileDialog,
+                             QInputDialog, QMessageBox)
+from PyQt6.QtCore import Qt, QSettings
+
+from core.panel_import import MappingProfile, read_headers, read_panel_sheet, sheet_names
+from styles import AppStyles
+
+_NO_COLUMN = "(none)"
+_MAX_LISTED_ISSUES = 500
+
+
+class PanelImportDialog(QDialog):
+    """
+    Maps the columns of an .xlsx/.csv panel sheet to panel name, quantity and
+    sizes, validates the whole sheet, and on accept leaves the PanelImport in
+    `result`. Mappings can be saved as named profiles for the next sheet.
+    """
+
+    def __init__(self, initial_dir="", parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Import Panel Sheet")
+        self.resize(820, 640)
+
+        self.settings = QSettings("DownAllocation", "AppSettings")
+        self.profiles = self._load_profiles()
+        self.initial_dir = initial_dir
+        self.headers = []
+        self.result = None
+        self.setup_ui()
+
+    # region Profiles
+    def _load_profiles(self):
+        try:
+            return json.loads(self.settings.value("panel_import/profiles", "{}"))
+        except (TypeError, ValueError):
+            return {}
+
+    def _save_profiles(self):
+        self.settings.setValue("panel_import/profiles", json.dumps(self.profiles))
+
+    def current_profile(self):
+        size_columns = {}
+        for row in range(self.size_table.rowCount()):
+            header_item = self.size_table.item(row, 0)
+            if header_item.checkState() == Qt.CheckState.Checked:
+                size_columns[header_item.text()] = self.size_table.item(row, 1).text().strip().upper()
+        qty_column = self.qty_combo.currentText()
+        return MappingProfile(self.header_row_spin.value(), self.name_combo.currentText(),
+                              "" if qty_column == _NO_COLUMN else qty_column, size_columns,
+                              self.sheet_combo.currentText())
+
+    def save_profile(self):
+        name, ok = QInputDialog.getText(self, "Save Mapping Profile", "Profile name:",
+                                        text=self.profile_combo.currentText())
+        name = name.strip()
+        if not ok or not name:
+            return
+        self.profiles[name] = self.current_profile().to_dict()
+        self._save_profiles()
+        if self.profile_combo.findText(name) == -1:
+            self.profile_combo.addItem(name)
+        self.profile_combo.setCurrentText(name)
+
+    def apply_profile(self, name):
+        data = self.profiles.get(name)
+        if not data:
+            return
+        profile = MappingProfile.from_dict(data)
+        if profile.sheet and self.sheet_combo.findText(profile.sheet) != -1:
+            self.sheet_combo.setCurrentText(profile.sheet)
+        self.header_row_spin.setValue(profile.header_row)
+        self.load_headers(profile)
+    # endregion
+
+    def setup_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(12)
+
+        form_layout = QFormLayout()
+        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+        file_layout = QHBoxLayout()
+        self.file_input = QLineEdit()
+        self.file_input.setReadOnly(True)
+        self.file_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        browse_btn = QPushButton("Browse...")
+        browse_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        browse_btn.clicked.connect(self.browse)
+        file_layout.addWidget(self.file_input, 1)
+        file_layout.addWidget(browse_btn)
+        form_layout.addRow(QLabel("Sheet File:"), file_layout)
+
+        profile_layout = QHBoxLayout()
+        self.profile_combo = QComboBox()
+        self.profile_combo.setStyleSheet(AppStyles.COMBO_BOX_STYLE)
+        self.profile_combo.addItem("")
+        self.profile_combo.addItems(sorted(self.profiles))
+        self.profile_combo.textActivated.connect(self.apply_profile)
+        save_profile_btn = QPushButton("Save Profile...")
+        save_profile_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        save_profile_btn.clicked.connect(self.save_profile)
+        profile_layout.addWidget(self.profile_combo, 1)
+        profile_layout.addWidget(save_profile_btn)
+        form_layout.addRow(QLabel("Mapping Profile:"), profile_layout)
+
+        self.sheet_combo = QComboBox()
+        self.sheet_combo.setStyleSheet(AppStyles.COMBO_BOX_STYLE)
+        self.sheet_combo.textActivated.connect(lambda _sheet: self.load_headers())
+        form_layout.addRow(QLabel("Worksheet:"), self.sheet_combo)
+
+        self.header_row_spin = QSpinBox()
+        self.header_row_spin.setRange(1, 1000)
+        self.header_row_spin.editingFinished.connect(self.load_headers)
+        form_layout.addRow(QLabel("Header Row:"), self.header_row_spin)
+
+        self.name_combo = QComboBox()
+        self.name_combo.setStyleSheet(AppStyles.COMBO_BOX_STYLE)
+        form_layout.addRow(QLabel("Panel Name Column:"), self.name_combo)
+        self.qty_combo = QComboBox()
+        self.qty_combo.setStyleSheet(AppStyles.COMBO_BOX_STYLE)
+        form_layout.addRow(QLabel("Quantity Column:"), self.qty_combo)
+        main_layout.addLayout(form_layout)
+
+        # One row per sheet column: checked columns become sizes, named in column 2
+        self.size_table = QTableWidget(0, 2)
+        self.size_table.setHorizontalHeaderLabels(["Sheet Column", "Size Name"])
+        self.size_table.verticalHeader().setVisible(False)
+        self.size_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        main_layout.addWidget(self.size_table, 1)
+
+        validate_layout = QHBoxLayout()
+        validate_btn = QPushButton("Validate")
+        validate_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        validate_btn.clicked.connect(self.validate)
+        self.status_label = QLabel("")
+        validate_layout.addWidget(validate_btn)
+        validate_layout.addWidget(self.status_label, 1)
+        main_layout.addLayout(validate_layout)
+
+        self.issue_list = QListWidget()
+        self.issue_list.setMaximumHeight(140)
+        main_layout.addWidget(self.issue_list)
+
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.button(QDialogButtonBox.StandardButton.Ok).setText("Import")
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box)
+
+    def browse(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Open Panel Sheet", self.initial_dir,
+            "Panel Sheets (*.xlsx *.csv);;Excel Files (*.xlsx);;CSV Files (*.csv);;All Files (*)")
+        if not file_path:
+            return
+        self.file_input.setText(file_path)
+        self.initial_dir = os.path.dirname(file_path)
+        try:
+            sheets = sheet_names(file_path)
+        except Exception as e:  # Unreadable or malformed file
+            QMessageBox.warning(self, "Import Error", f"Could not open the sheet: {e}")
+            return
+        self.sheet_combo.clear()
+        self.sheet_combo.addItems(sheets)
+        self.sheet_combo.setEnabled(bool(sheets))
+        profile_name = self.profile_combo.currentText()
+        if profile_name in self.profiles:
+            self.apply_profile(profile_name)
+        else:
+            self.load_headers()
+
+    def load_headers(self, profile=None):
+        """Reads the header row and fills the column pickers (from `profile` or a guess)."""
+        file_path = self.file_input.text()
+        if not file_path:
+            return
+        try:
+            self.headers = read_headers(file_path, self.header_row_spin.value(),
+                                        self.sheet_combo.currentText())
+        except Exception as e:  # Unreadable or malformed file
+            QMessageBox.warning(self, "Import Error", f"Could not read the header row: {e}")
+            return
+        self.result = None
+        if not isinstance(profile, MappingProfile):
+            profile = MappingProfile.guess(self.headers)
+
+        columns = [header for header in self.headers if header]
+        self.name_combo.clear()
+        self.name_combo.addItems(columns)
+        self.name_combo.setCurrentText(profile.name_column)
+        self.qty_combo.clear()
+        self.qty_combo.addItems([_NO_COLUMN] + columns)
+        self.qty_combo.setCurrentText(profile.qty_column or _NO_COLUMN)
+
+        self.size_table.setRowCount(len(columns))
+        for row, header in enumerate(columns):
+            header_item = QTableWidgetItem(header)
+            header_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+            header_item.setCheckState(Qt.CheckState.Checked if header in profile.size_columns
+                                      else Qt.CheckState.Unchecked)
+            self.size_table.setItem(row, 0, header_item)
+            self.size_table.setItem(row, 1, QTableWidgetItem(
+                profile.size_columns.get(header, header.upper())))
+
+    def validate(self):
+        """Streams the whole sheet through the mapping; returns True if there is something to import."""
+        self.result = None
+        self.issue_list.clear()
+        file_path = self.file_input.text()
+        if not file_path:
+            return False
+        try:
+            self.result = read_panel_sheet(file_path, self.current_profile(),
+                                           AppStyles.MAX_PANEL_QTY, AppStyles.MAX_SEWING_AREA)
+        except Exception as e:  # Unreadable or malformed file
+            self.status_label.setText("")
+            QMessageBox.warning(self, "Import Error", f"Could not import the sheet: {e}")
+            return False
+
+        issues = self.result.issues
+        self.status_label.setText(f"{len(self.result.names)} panels, {len(self.result.sizes)} sizes, "
+                                  f"{len(issues)} issue(s) - invalid cells are left blank")
+        self.issue_list.addItems([f"Row {row_no}: {message}"
+                                  for row_no, message in issues[:_MAX_LISTED_ISSUES]])
+        if len(issues) > _MAX_LISTED_ISSUES:
+            self.issue_list.addItem(f"... and {len(issues) - _MAX_LISTED_ISSUES} more")
+        return bool(self.result.names)
+
+    def accept(self):
+        # Re-validate so the import always matches the mapping on screen
+        if not self.validate():
+            if self.result is not None:
+                QMessageBox.warning(self, "Import Panel Sheet", "The sheet has no panel rows.")
+            return
+        super().accept()
@@ -0,0 +1,167 @@
+# down_allocation_app/ui/dialogs/scenario_sweep_dialog.py
+
+import os
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QLineEdit,
+                             QListWidget, QListWidgetItem, QPushButton, QTableWidget,
+                             QTableWidgetItem, QAbstractItemView, QFileDialog, QMessageBox)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+
+from core.scenario_sweep import parse_weight_list, sweep_allocation
+from styles import AppStyles
+
+
+class ScenarioSweepDialog(QDialog):
+    """
+    What-if comparison of the current panels over several ecodown/garment
+    weights and base sizes, without touching the main window's inputs.
+    """
+
+    def __init__(self, grid, base_size="", ecodown_weight="", garment_weight="",
+                 export_folder="", parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Scenario Sweep")
+        self.resize(1000, 600)
+
+        self.grid = grid
+        self.export_folder = export_folder
+        self.result = None
+
+        self.setup_ui(base_size, ecodown_weight, garment_weight)
+
+    def setup_ui(self, base_size, ecodown_weight, garment_weight):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(12)
+
+        inputs_layout = QHBoxLayout()
+        form_layout = QFormLayout()
+        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+        self.ecodown_input = QLineEdit(ecodown_weight)
+        self.ecodown_input.setPlaceholderText("e.g. 180, 200, 220 or 180:220:10")
+        self.ecodown_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        form_layout.addRow(QLabel("Ecodown Weights:"), self.ecodown_input)
+
+        self.garment_input = QLineEdit(garment_weight or "0")
+        self.garment_input.setPlaceholderText("e.g. 0, 15")
+        self.garment_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        form_layout.addRow(QLabel("Garments Weights:"), self.garment_input)
+        inputs_layout.addLayout(form_layout, 1)
+
+        # Candidate base sizes; the current one starts checked
+        self.base_size_list = QListWidget()
+        self.base_size_list.setMaximumHeight(120)
+        for size in self.grid.sizes:
+            if not size:
+                continue
+            item = QListWidgetItem(size)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked if size == base_size else Qt.CheckState.Unchecked)
+            self.base_size_list.addItem(item)
+        base_layout = QVBoxLayout()
+        base_layout.addWidget(QLabel("Base Sizes:"))
+        base_layout.addWidget(self.base_size_list)
+        inputs_layout.addLayout(base_layout, 1)
+        main_layout.addLayout(inputs_layout)
+
+        buttons_layout = QHBoxLayout()
+        self.run_btn = QPushButton("Run Sweep")
+        self.run_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        self.run_btn.clicked.connect(self.run_sweep)
+        self.export_btn = QPushButton("Export to Excel")
+        self.export_btn.setStyleSheet(AppStyles.EXPORT_EXCEL_BUTTON_STYLE)
+        self.export_btn.setEnabled(False)
+        self.export_btn.clicked.connect(self.export_to_excel)
+        self.status_label = QLabel("")
+        buttons_layout.addWidget(self.run_btn)
+        buttons_layout.addWidget(self.export_btn)
+        buttons_layout.addWidget(self.status_label, 1)
+        main_layout.addLayout(buttons_layout)
+
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setFont(QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
+        self.table.verticalHeader().setVisible(False)
+        main_layout.addWidget(self.table, 1)
+
+    def selected_base_sizes(self):
+        return [self.base_size_list.item(i).text() for i in range(self.base_size_list.count())
+                if self.base_size_list.item(i).checkState() == Qt.CheckState.Checked]
+
+    def run_sweep(self):
+        try:
+            ecodown_weights = parse_weight_list(self.ecodown_input.text())
+            garment_weights = parse_weight_list(self.garment_input.text()) or [0.0]
+        except ValueError as e:
+            QMessageBox.warning(self, "Scenario Sweep", f"Invalid weights: {e}")
+            return
+        base_sizes = self.selected_base_sizes()
+        if not ecodown_weights or not base_sizes:
+            QMessageBox.warning(self, "Scenario Sweep",
+                                "Enter at least one ecodown weight and check at least one base size.")
+            return
+
+        self.result = sweep_allocation(self.grid, base_sizes, ecodown_weights, garment_weights)
+        self._populate_table()
+        self.export_btn.setEnabled(len(self.result) > 0)
+        self.status_label.setText(f"{len(self.result)} scenarios")
+
+    def _populate_table(self):
+        headers = self.result.headers()
+        rows = list(self.result.rows())
+
+        self.table.setUpdatesEnabled(False)
+        self.table.clear()
+        self.table.setColumnCount(len(headers))
+        self.table.setRowCount(len(rows))
+        self.table.setHorizontalHeaderLabels(headers)
+
+        # Highlight each scenario's base size column like the bottom table does
+        size_columns = {f"DOWN {size}": size for size in self.result.sizes}
+        size_columns.update({f"GARMENT {size}": size for size in self.result.sizes})
+        bold_font = QFont("Courier New", AppStyles.TABLE_TEXT_SIZE, QFont.Weight.Bold)
+        for row, values in enumerate(rows):
+            base_size = values[0]
+            for col, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                if size_columns.get(headers[col]) == base_size:
+                    item.setFont(bold_font)
+                    item.setForeground(AppStyles.BASE_SIZE_TEXT_COLOR)
+                self.table.setItem(row, col, item)
+        self.table.resizeColumnsToContents()
+        self.table.setUpdatesEnabled(True)
+
+    def export_to_excel(self):
+        if self.result is None:
+            return
+        initial_dir = self.export_folder if os.path.isdir(self.export_folder) else ""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Scenario Sweep", os.path.join(initial_dir, "scenario_sweep.xlsx"),
+            "Excel Files (*.xlsx);;All Files (*)")
+        if not file_path:
+            return
+        if not file_path.endswith(".xlsx"):
+            file_path += ".xlsx"
+
+        try:
+            # pandas is only needed here; importing it lazily keeps it off the startup path
+            import pandas as pd
+
+            # Numbers, not the display strings, so the sheet can be summed and charted
+            headers = self.result.headers()
+            frame = pd.DataFrame(dict(enumerate(self.result.columns())))
+            frame.columns = headers
+            with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
+                frame.to_excel(writer, sheet_name='Scenarios', index=False)
+                worksheet = writer.sheets['Scenarios']
+                total_format = writer.book.add_format({'num_format': '0.00'})
+                worksheet.set_column(0, 0, max([len(headers[0])] + [len(v) for v in frame.iloc[:, 0]]) + 2)
+                worksheet.set_column(1, 2, max(len(headers[1]), len(headers[2])) + 2)  # Weights as entered
+                for col_idx in range(3, len(headers)):
+                    width = max(len(headers[col_idx]), len(f"{frame.iloc[:, col_idx].max():.2f}"))
+                    worksheet.set_column(col_idx, col_idx, width + 2, total_format)
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Failed to export scenarios: {e}")
@@ -0,0 +1,193 @@
+# down_allocation_app/ui/dialogs/season_analytics_dialog.py
+
+import os
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QLineEdit,
+                             QComboBox, QPushButton, QStackedWidget, QWidget, QTableWidget,
+                             QTableWidgetItem, QAbstractItemView, QFileDialog, QMessageBox,
+                             QApplication)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+
+from core.project_index import ProjectIndex
+from core.season_analytics import (GROUP_COLUMNS, aggregate, collect_totals, find_projects,
+                                   pivot_by_size)
+from styles import AppStyles
+
+_SOURCE_FOLDER = 0
+_SOURCE_INDEX = 1
+_VALUES = [("Down Weight", 'down_weight'), ("Garments Weight", 'garment_weight')]
+
+
+class SeasonAnalyticsDialog(QDialog):
+    """
+    Total down (or garment) weight per season, buyer, garments stage and size
+    over a folder of projects or a project index query.
+    """
+
+    def __init__(self, folder="", index_path="", cache=None, export_folder="", parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Season Analytics")
+        self.resize(1000, 640)
+
+        self.index_path = index_path
+        self.cache = cache
+        self.export_folder = export_folder
+        self.summary = None
+        self.setup_ui(folder)
+
+    def setup_ui(self, folder):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(12)
+
+        form_layout = QFormLayout()
+        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self.source_combo = QComboBox()
+        self.source_combo.setStyleSheet(AppStyles.COMBO_BOX_STYLE)
+        self.source_combo.addItems(["Project Folder", "Project Index"])
+        form_layout.addRow(QLabel("Projects From:"), self.source_combo)
+        main_layout.addLayout(form_layout)
+
+        # Folder source
+        self.source_stack = QStackedWidget()
+        folder_page = QWidget()
+        folder_layout = QHBoxLayout(folder_page)
+        folder_layout.setContentsMargins(0, 0, 0, 0)
+        self.folder_input = QLineEdit(folder)
+        self.folder_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        browse_btn = QPushButton("Browse...")
+        browse_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        browse_btn.clicked.connect(self.browse_folder)
+        folder_layout.addWidget(self.folder_input, 1)
+        folder_layout.addWidget(browse_btn)
+        self.source_stack.addWidget(folder_page)
+
+        # Index query source
+        index_page = QWidget()
+        index_layout = QHBoxLayout(index_page)
+        index_layout.setContentsMargins(0, 0, 0, 0)
+        self.filter_inputs = {}
+        for key, label in (('season', "Season"), ('buyer', "Buyer"),
+                           ('garments_stage', "Stage"), ('text', "Search")):
+            line_edit = QLineEdit()
+            line_edit.setPlaceholderText(label)
+            line_edit.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+            index_layout.addWidget(line_edit)
+            self.filter_inputs[key] = line_edit
+        self.source_stack.addWidget(index_page)
+        self.source_combo.currentIndexChanged.connect(self.source_stack.setCurrentIndex)
+        main_layout.addWidget(self.source_stack)
+
+        buttons_layout = QHBoxLayout()
+        self.run_btn = QPushButton("Calculate")
+        self.run_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        self.run_btn.clicked.connect(self.run_analytics)
+        self.value_combo = QComboBox()
+        self.value_combo.setStyleSheet(AppStyles.COMBO_BOX_STYLE)
+        for label, column in _VALUES:
+            self.value_combo.addItem(label, column)
+        self.value_combo.currentIndexChanged.connect(self._populate_table)
+        self.export_btn = QPushButton("Export to Excel")
+        self.export_btn.setStyleSheet(AppStyles.EXPORT_EXCEL_BUTTON_STYLE)
+        self.export_btn.setEnabled(False)
+        self.export_btn.clicked.connect(self.export_to_excel)
+        self.status_label = QLabel("")
+        buttons_layout.addWidget(self.run_btn)
+        buttons_layout.addWidget(self.value_combo)
+        buttons_layout.addWidget(self.export_btn)
+        buttons_layout.addWidget(self.status_label, 1)
+        main_layout.addLayout(buttons_layout)
+
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setFont(QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
+        self.table.verticalHeader().setVisible(False)
+        main_layout.addWidget(self.table, 1)
+
+    def browse_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Project Folder", self.folder_input.text())
+        if folder:
+            self.folder_input.setText(folder)
+
+    def project_paths(self):
+        if self.source_combo.currentIndex() == _SOURCE_FOLDER:
+            folder = self.folder_input.text().strip()
+            return find_projects(folder) if os.path.isdir(folder) else []
+        filters = {key: line_edit.text().strip() for key, line_edit in self.filter_inputs.items()}
+        with ProjectIndex(self.index_path) as index:
+            return index.paths(filters.pop('text'), **filters)
+
+    def run_analytics(self):
+        try:
+            paths = self.project_paths()
+        except Exception as e:  # Unreadable index database
+            QMessageBox.warning(self, "Season Analytics", f"Could not query the project index: {e}")
+            return
+        if not paths:
+            QMessageBox.information(self, "Season Analytics", "No projects found.")
+            return
+
+        def report_progress(done, total):
+            self.status_label.setText(f"{done} / {total} projects")
+            QApplication.processEvents()
+
+        self.run_btn.setEnabled(False)
+        try:
+            totals, failed, computed = collect_totals(paths, self.cache, progress=report_progress)
+        finally:
+            self.run_btn.setEnabled(True)
+
+        self.summary = aggregate(totals) if totals else None
+        self.export_btn.setEnabled(self.summary is not None)
+        status = f"{len(totals)} projects ({computed} calculated, {len(totals) - computed} cached)"
+        if failed:
+            status += f", {len(failed)} skipped"
+        self.status_label.setText(status)
+        self._populate_table()
+
+    def _populate_table(self):
+        self.table.clear()
+        if self.summary is None:
+            self.table.setRowCount(0)
+            self.table.setColumnCount(0)
+            return
+        pivot = pivot_by_size(self.summary, self.value_combo.currentData())
+        headers = [column.replace('_', ' ').upper() for column in pivot.columns]
+        group_count = len(GROUP_COLUMNS) + 1  # Group columns and the style count
+
+        self.table.setUpdatesEnabled(False)
+        self.table.setColumnCount(len(headers))
+        self.table.setRowCount(len(pivot))
+        self.table.setHorizontalHeaderLabels(headers)
+        for row, values in enumerate(pivot.itertuples(index=False)):
+            for col, value in enumerate(values):
+                text = str(value) if col < group_count else f"{value:.0f}"
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.table.setItem(row, col, item)
+        self.table.resizeColumnsToContents()
+        self.table.setUpdatesEnabled(True)
+
+    def export_to_excel(self):
+        if self.summary is None:
+            return
+        initial_dir = self.export_folder if os.path.isdir(self.export_folder) else ""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Season Analytics", os.path.join(initial_dir, "season_analytics.xlsx"),
+            "Excel Files (*.xlsx);;All Files (*)")
+        if not file_path:
+            return
+        if not file_path.endswith(".xlsx"):
+            file_path += ".xlsx"
+
+        try:
+            # pandas is only needed here; importing it lazily keeps it off the startup path
+            import pandas as pd
+
+            with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
+                for label, column in _VALUES:
+                    pivot_by_size(self.summary, column).to_excel(writer, sheet_name=label, index=False)
+                self.summary.to_excel(writer, sheet_name='Detail', index=False)
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Failed to export analytics: {e}")
@@ -2,10 +2,11 @@
 
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
                              QDialogButtonBox, QFrame, QApplication, QMessageBox,
-                             QFormLayout)  # Import QFormLayout
+                             QFormLayout, QCheckBox)  # Import QFormLayout
 from PyQt6.QtGui import QFont, QDoubleValidator, QIntValidator
 from PyQt6.QtCore import Qt, QSettings, pyqtSignal
 from styles import AppStyles  # Import AppStyles to get default values
+from core.telemetry import telemetry
 
 
 class SettingsDialog(QDialog):
@@ -42,6 +43,10 @@ class SettingsDialog(QDialog):
             'row_column_count_size': AppStyles.ROW_COLUMN_COUNT_SIZE,
             'factory_font_size': AppStyles.FACTORY_FONT_SIZE,  # Added for persistence
             'input_fields_label_size': AppStyles.INPUT_FIELDS_LABEL_SIZE,  # Added for persistence
+            'max_panel_rows': AppStyles.MAX_PANEL_ROWS,
+            'max_size_cols': AppStyles.MAX_SIZE_COLS,
+            'max_panel_qty': AppStyles.MAX_PANEL_QTY,
+            'max_sewing_area': AppStyles.MAX_SEWING_AREA,
         }
         for key, default_value in defaults.items():
             # Only set if the setting doesn't already exist in QSettings
@@ -66,6 +71,10 @@ class SettingsDialog(QDialog):
             'factory_font_size': s.value('settings/factory_font_size', type=int),
             # Loaded
             'input_fields_label_size': s.value('settings/input_fields_label_size', type=int),
+            'max_panel_rows': s.value('settings/max_panel_rows', type=int),
+            'max_size_cols': s.value('settings/max_size_cols', type=int),
+            'max_panel_qty': s.value('settings/max_panel_qty', type=int),
+            'max_sewing_area': s.value('settings/max_sewing_area', type=int),
         }
 
     def setup_ui(self):
@@ -109,6 +118,11 @@ class SettingsDialog(QDialog):
              'factory_font_size', QIntValidator(8, 30)),  # Added
             ("Input Labels Font Size (px):",
              'input_fields_label_size', QIntValidator(8, 30)),  # Added
+            # Table limits; large BOM sheets need more panels/sizes than the defaults
+            ("Max Panels (rows):", 'max_panel_rows', QIntValidator(1, 10000)),
+            ("Max Sizes (columns):", 'max_size_cols', QIntValidator(1, 500)),
+            ("Max Panel Quantity:", 'max_panel_qty', QIntValidator(1, 999)),
+            ("Max Sewing Area:", 'max_sewing_area', QIntValidator(1, 999999)),
         ]
 
         for label_text, key, validator in settings_to_add:
@@ -131,6 +145,12 @@ class SettingsDialog(QDialog):
             self.fields[key] = line_edit
 
         main_layout.addWidget(general_settings_frame)
+
+        # Opt-in timing log (open/save/export/paste/resize/recompute durations, no project data)
+        self.telemetry_check = QCheckBox("Record operation timings for performance analysis")
+        self.telemetry_check.setToolTip(
+            f"Durations and table sizes are written to {telemetry.directory or 'the app data folder'}")
+        main_layout.addWidget(self.telemetry_check)
         main_layout.addStretch(1)  # Push content to top
 
         button_box = QDialogButtonBox(
@@ -158,6 +178,7 @@ class SettingsDialog(QDialog):
             value = self.current_settings.get(key)
             if value is not None:
                 line_edit.setText(str(value))
+        self.telemetry_check.setChecked(self.settings.value('settings/telemetry_enabled', False, type=bool))
 
     def accept(self):
         """Handles 'Apply' button click: saves settings and emits signal."""
@@ -177,6 +198,8 @@ class SettingsDialog(QDialog):
             # Save settings to QSettings for persistence
             for key, value in new_settings.items():
                 self.settings.setValue(f'settings/{key}', value)
+            self.settings.setValue('settings/telemetry_enabled', self.telemetry_check.isChecked())
+            telemetry.configure(enabled=self.telemetry_check.isChecked())
 
             # Update AppStyles class attributes immediately so main window can re-read them
             AppStyles.INPUT_FIELD_WIDTH = new_settings['input_field_width']
@@ -191,6 +214,10 @@ class SettingsDialog(QDialog):
             AppStyles.ROW_COLUMN_COUNT_SIZE = new_settings['row_column_count_size']
             AppStyles.FACTORY_FONT_SIZE = new_settings['factory_font_size']
             AppStyles.INPUT_FIELDS_LABEL_SIZE = new_settings['input_fields_label_size']
+            AppStyles.MAX_PANEL_ROWS = new_settings['max_panel_rows']
+            AppStyles.MAX_SIZE_COLS = new_settings['max_size_cols']
+            AppStyles.MAX_PANEL_QTY = new_settings['max_panel_qty']
+            AppStyles.MAX_SEWING_AREA = new_settings['max_sewing_area']
 
             # Re-create BASE_FONT as it depends on ROW_COLUMN_COUNT_SIZE
             AppStyles.BASE_FONT = QFont(
@@ -0,0 +1,146 @@
+# down_allocation_app/ui/dialogs/template_dialog.py
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QListWidget,
+                             QListWidgetItem, QPushButton, QInputDialog, QMessageBox)
+from PyQt6.QtCore import Qt
+
+from core.template_store import TemplateStore
+from styles import AppStyles
+
+
+class TemplateDialog(QDialog):
+    """
+    Browses the panel template library. "Insert" accepts the dialog with
+    `template` set to the chosen PanelTemplate; "Save Current Panels..."
+    stores the template made by `make_template(name)` (the current table).
+    """
+
+    def __init__(self, store_path, make_template=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Panel Templates")
+        self.resize(640, 480)
+
+        self.store_path = store_path
+        self.make_template = make_template
+        self.template = None
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(12)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search template or panel names")
+        self.search_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        self.search_input.textChanged.connect(self.refresh)
+        main_layout.addWidget(self.search_input)
+
+        self.template_list = QListWidget()
+        self.template_list.currentItemChanged.connect(self._show_details)
+        self.template_list.itemDoubleClicked.connect(lambda _item: self.insert_selected())
+        main_layout.addWidget(self.template_list, 1)
+
+        self.details_label = QLabel("")
+        self.details_label.setWordWrap(True)
+        main_layout.addWidget(self.details_label)
+
+        buttons_layout = QHBoxLayout()
+        self.insert_btn = QPushButton("Insert")
+        self.insert_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        self.insert_btn.clicked.connect(self.insert_selected)
+        save_btn = QPushButton("Save Current Panels...")
+        save_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        save_btn.setEnabled(self.make_template is not None)
+        save_btn.clicked.connect(self.save_current)
+        self.delete_btn = QPushButton("Delete")
+        self.delete_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        self.delete_btn.clicked.connect(self.delete_selected)
+        close_btn = QPushButton("Close")
+        close_btn.setStyleSheet(AppStyles.BUTTON_STYLE)
+        close_btn.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.insert_btn)
+        buttons_layout.addWidget(save_btn)
+        buttons_layout.addWidget(self.delete_btn)
+        buttons_layout.addStretch(1)
+        buttons_layout.addWidget(close_btn)
+        main_layout.addLayout(buttons_layout)
+
+    def refresh(self):
+        """Re-runs the search; only the summaries are read, not the template data."""
+        current = self.template_list.currentItem()
+        current_name = current.data(Qt.ItemDataRole.UserRole)['name'] if current else None
+        try:
+            with TemplateStore(self.store_path) as store:
+                summaries = store.search(self.search_input.text().strip())
+        except Exception as e:  # Unreadable template database
+            QMessageBox.warning(self, "Panel Templates", f"Could not read the template library: {e}")
+            summaries = []
+
+        self.template_list.clear()
+        for summary in summaries:
+            item = QListWidgetItem(f"{summary['name']}  ({summary['panel_count']} panels)")
+            item.setData(Qt.ItemDataRole.UserRole, summary)
+            self.template_list.addItem(item)
+            if summary['name'] == current_name:
+                self.template_list.setCurrentItem(item)
+        if self.template_list.currentItem() is None and self.template_list.count():
+            self.template_list.setCurrentRow(0)
+        self._show_details()
+
+    def _selected_name(self):
+        item = self.template_list.currentItem()
+        return item.data(Qt.ItemDataRole.UserRole)['name'] if item else None
+
+    def _show_details(self, *_args):
+        item = self.template_list.currentItem()
+        self.insert_btn.setEnabled(item is not None)
+        self.delete_btn.setEnabled(item is not None)
+        if item is None:
+            self.details_label.setText("")
+            return
+        summary = item.data(Qt.ItemDataRole.UserRole)
+        self.details_label.setText(
+            f"Panels: {summary['panels'].replace(',', ', ') or '-'}\n"
+            f"Sizes: {summary['sizes'].replace(',', ', ') or '-'}")
+
+    def insert_selected(self):
+        name = self._selected_name()
+        if name is None:
+            return
+        with TemplateStore(self.store_path) as store:
+            self.template = store.get(name)
+        if self.template is not None:
+            self.accept()
+
+    def save_current(self):
+        name, ok = QInputDialog.getText(self, "Save Template", "Template name:",
+                                        text=self.search_input.text().strip().upper())
+        name = name.strip().upper()
+        if not ok or not name:
+            return
+        template = self.make_template(name)
+        if not template.names:
+            QMessageBox.information(self, "Save Template", "The table has no named panels to save.")
+            return
+        with TemplateStore(self.store_path) as store:
+            if store.get(name) is not None:
+                answer = QMessageBox.question(self, "Save Template",
+                                              f"Replace the existing template '{name}'?")
+                if answer != QMessageBox.StandardButton.Yes:
+                    return
+            store.save(template)
+        self.search_input.clear()
+        self.refresh()
+
+    def delete_selected(self):
+        name = self._selected_name()
+        if name is None:
+            return
+        answer = QMessageBox.question(self, "Delete Template", f"Delete the template '{name}'?")
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+        with TemplateStore(self.store_path) as store:
+            store.delete(name)
+        self.refresh()
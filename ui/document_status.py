@@ -0,0 +1,26 @@
+# down_allocation_app/ui/document_status.py
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class DocumentStatus(QObject):
+    """
+    Derived state of the open document, refreshed once per recalculation.
+    Menus and toolbars bind to `changed` and read the flags, so updating
+    action states never touches the tables.
+    """
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.has_area = False  # Some size has a total sewing area > 0
+        self.valid_for_export = False  # Required inputs filled and has_area
+        self.dirty = False  # Differs from the last saved/loaded/reset state
+
+    def update(self, has_area, valid_for_export, dirty):
+        """Sets the flags; emits `changed` only if one of them actually changed."""
+        state = (has_area, valid_for_export, dirty)
+        if state == (self.has_area, self.valid_for_export, self.dirty):
+            return
+        self.has_area, self.valid_for_export, self.dirty = state
+        self.changed.emit()
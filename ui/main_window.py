@@ -1,6 +1,6 @@
 # down_allocation_app/ui/main_window.py
 
-from ui.sections.bottom_table import BottomTableSection
+from ui.sections.bottom_table import BottomTableSection, allocation_table_rows
 from ui.sections.top_table import TopTableSection
 from ui.sections.adjust_table import AdjustTableSection
 from ui.sections.top_input import TopInputSection
@@ -11,26 +11,54 @@ from ui.dialogs.confirmation_dialog import ConfirmationDialog
 from ui.dialogs.factory_edit_dialog import FactoryEditDialog
 from ui.dialogs.about_dialog import AboutDialog
 from ui.dialogs.help_dialog import HelpDialog
+from ui.dialogs.scenario_sweep_dialog import ScenarioSweepDialog
+from ui.dialogs.grading_dialog import GradingDialog
+from ui.dialogs.cad_import_dialog import CadImportDialog
+from ui.dialogs.panel_import_dialog import PanelImportDialog
+from ui.dialogs.compare_dialog import CompareDialog
+from ui.dialogs.season_analytics_dialog import SeasonAnalyticsDialog
+from ui.dialogs.template_dialog import TemplateDialog
 from ui.menu_bar.app_menu_bar import AppMenuBar
 from ui.tool_bar.app_tool_bar import AppToolBar
+from ui.document_status import DocumentStatus
+from ui.widgets.validation_dock import ValidationDock
 from styles import AppStyles
+from core.allocation_engine import compute_allocation, allocate_saved, parse_weight
+from core.hashing import payload_hash
+from core.result_cache import ResultCache, allocation_payload
+from core.project_index import ProjectIndex, panel_names
+from core.panel_names import PanelNameIndex
+from core.template_store import PanelTemplate
+from core.report_import import find_reports, rebuild_projects
+from core.grading import GradingRules
+from core.document import Document, UNTITLED
+from core.validation import Validator
+from core.telemetry import telemetry
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QLineEdit, QComboBox, QDateEdit, QPushButton,
                              QDialog, QListWidget, QDialogButtonBox, QFormLayout,
                              QFrame, QSizePolicy, QStyleFactory, QTableWidget,
-                             QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox)
+                             QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox, QTabBar)
 from PyQt6.QtGui import QFont, QDoubleValidator, QPalette, QColor, QIntValidator, QKeyEvent, QIcon, QPixmap, QAction
-from PyQt6.QtCore import Qt, QDate, QSettings, QEvent, QTimer, QCoreApplication, QPoint, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import Qt, QDate, QSettings, QEvent, QTimer, QCoreApplication, QPoint, QPropertyAnimation, QEasingCurve, QStandardPaths, pyqtSignal
 import sys
 import os
-import pandas as pd
+import threading
 import warnings
 import json
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 
 class DownAllocationApp(QMainWindow):
-    def __init__(self):
+    # (generation, PanelNameIndex) from the background load, delivered on the UI thread
+    panel_names_loaded = pyqtSignal(int, object)
+
+    def __init__(self, staged=False):
+        """
+        Builds the main window. With staged=True only the cheap state is set up;
+        the caller runs startup_stages() one by one (e.g. between splash screen
+        repaints) and then calls prompt_factory_info_if_missing() once shown.
+        """
         super().__init__()
 
         # Configuration variables - now mostly from AppStyles
@@ -55,21 +83,77 @@ class DownAllocationApp(QMainWindow):
         self.settings = QSettings("DownAllocation", "AppSettings")
         self.factory_settings = QSettings(
             "DownAllocation", "FactoryInfo")  # Dedicated for factory info
+        # Factory of the active document; starts as the saved default, a project
+        # brings its own (kept in memory, persisted only by Edit Factory Info)
+        self.factory_info = self._default_factory_info()
 
         # Initialize current project path to None
         self.current_project_path = None
+        # Open documents in tab order; only the active one is loaded into the section widgets
+        self.documents = [Document()]
+        self.active_document = self.documents[0]
+        self._switching_documents = False
         # Initialize last used folder paths for QFileDialog
         self.last_opened_folder = self.settings.value("last_opened_folder", self._get_desktop_path())
         self.last_saved_folder = self.settings.value("last_saved_folder", self._get_desktop_path())
 
+        # Latest AllocationResult, set by update_all_tables_and_dropdowns()
+        self.allocation_result = None
+        # Content-addressed cache of allocations and exported files, so repeat exports are file copies
+        self.result_cache = ResultCache(
+            os.path.join(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation), "results"),
+            AppStyles.RESULT_CACHE_MAX_MB * 1024 * 1024)
+        # Searchable index of known .dax projects (filled by report import and by saving)
+        self.project_index_path = os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation),
+            "project_index.sqlite")
+        # Reusable panel sets (Tools > Panel Templates)
+        self.template_store_path = os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation),
+            "panel_templates.sqlite")
+        # Opt-in operation timings (Settings), written to AppData/telemetry
+        telemetry.configure(
+            os.path.join(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation),
+                         "telemetry"),
+            self.settings.value('settings/telemetry_enabled', False, type=bool))
+        # Panel name completions, built from the project index on first use
+        self._panel_names = None
+        self._panel_names_loading = False
+        self._panel_names_generation = 0  # Bumped to discard a load that is already running
+        self.panel_names_loaded.connect(self._install_panel_names)
+
         # Initialize initial states to None for safe access during early __init__ calls
         self.initial_input_data = None
-        self.initial_table_data = None
+        self.initial_table_revision = None
         self.initial_row_count = None
         self.initial_col_count = None
 
-
-        self.init_ui()
+        # Valid-for-export / has-area / dirty flags the menus and toolbar bind to
+        self.document_status = DocumentStatus(self)
+        # Set by calculate_top_table_totals() on every recompute
+        self._has_calculated_area = False
+        # Issue list of the top table, re-checked on every recompute (per edited row where possible)
+        self.validator = Validator()
+
+
+        if not staged:
+            for _label, stage in self.startup_stages():
+                stage()
+            self.prompt_factory_info_if_missing()
+
+    def startup_stages(self):
+        """Ordered (label, callable) startup steps, each short enough to run between event loop turns."""
+        return [
+            ("Building interface", self.init_ui),
+            ("Creating menus", self._init_menus_and_toolbar),
+            ("Connecting signals", self.connect_signals),
+            ("Loading settings", self._load_startup_settings),
+            ("Preparing tables", self._prepare_initial_state),
+            # Apply styles after UI setup and initial data load
+            ("Applying styles", lambda: self.reapply_app_styles(on_startup=True)),
+        ]
+
+    def _init_menus_and_toolbar(self):
         # Instantiate and set the AppMenuBar
         self.app_menu_bar = AppMenuBar(self)
         self.setMenuBar(self.app_menu_bar)
@@ -78,17 +162,11 @@ class DownAllocationApp(QMainWindow):
         self.app_tool_bar = AppToolBar("File Toolbar", self)
         self.addToolBar(Qt.ToolBarArea.TopToolBarArea, self.app_tool_bar) # Add to top area
 
-        self.connect_signals()
-
-        # Load initial factory info
-        factory_name = self.factory_settings.value("factory_name", "")
-        factory_location = self.factory_settings.value("factory_location", "")
-
-        if not factory_name or not factory_location:
-            self.show_factory_edit()
-        else:
+    def _load_startup_settings(self):
+        # Load initial factory info; a missing one is prompted for once the window is shown
+        if self.factory_info['name'] and self.factory_info['location']:
             self.factory_info_section.update_factory_display(
-                factory_name, factory_location)
+                self.factory_info['name'], self.factory_info['location'])
 
         # Load and apply view settings from QSettings at startup
         show_factory_info = self.settings.value(
@@ -101,19 +179,25 @@ class DownAllocationApp(QMainWindow):
         self.factory_info_section.setVisible(show_factory_info)
         self.bottom_table_section.setVisible(show_bottom_table)
 
+        show_validation_dock = self.settings.value(
+            'view_settings/show_validation_dock', True, type=bool)
+        self.app_menu_bar.set_validation_dock_checked(show_validation_dock)
+        self.validation_dock.setVisible(show_validation_dock)
 
+    def _prepare_initial_state(self):
         self.update_all_tables_and_dropdowns()
-        
+
         # Now that all UI elements are set up and populated with defaults, capture the initial state.
-        self.initial_input_data = self.top_input_section.get_input_data()
-        self.initial_table_data = self.top_table_section.save_table_content()
-        self.initial_row_count = self.adjust_table_section.row_input.text()
-        self.initial_col_count = self.adjust_table_section.col_input.text()
+        self._mark_document_clean()
 
         self.check_input_changes() # This will correctly set the save button state after initial load
 
-        # Apply styles after UI setup and initial data load
-        self.reapply_app_styles(on_startup=True)
+    def prompt_factory_info_if_missing(self):
+        """Opens the factory edit dialog if no factory info has been saved yet."""
+        factory_name = self.factory_settings.value("factory_name", "")
+        factory_location = self.factory_settings.value("factory_location", "")
+        if not factory_name or not factory_location:
+            self.show_factory_edit()
 
 
     def init_ui(self):
@@ -127,8 +211,6 @@ class DownAllocationApp(QMainWindow):
         icon_path = os.path.abspath(icon_path)
         self.setWindowIcon(QIcon(icon_path))
 
-        self.showMaximized()
-
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
 
@@ -136,6 +218,16 @@ class DownAllocationApp(QMainWindow):
         main_layout.setContentsMargins(20, 20, 20, 20)
         main_layout.setSpacing(self.vertical_spacing)
 
+        # One tab per open document; hidden while only one is open
+        self.document_tabs = QTabBar()
+        self.document_tabs.setTabsClosable(True)
+        self.document_tabs.setMovable(True)
+        self.document_tabs.setDocumentMode(True)
+        self.document_tabs.setExpanding(False)
+        self.document_tabs.setAutoHide(True)
+        self.document_tabs.addTab(UNTITLED)
+        main_layout.addWidget(self.document_tabs)
+
         self.factory_info_section = FactoryInfoSection(self)
         main_layout.addWidget(self.factory_info_section)
 
@@ -146,11 +238,15 @@ class DownAllocationApp(QMainWindow):
         main_layout.addWidget(self.adjust_table_section)
 
         self.top_table_section = TopTableSection(self)
+        self.top_table_section.name_delegate.completion_source = self.panel_name_index
         main_layout.addWidget(self.top_table_section)
 
         self.bottom_table_section = BottomTableSection(self)
         main_layout.addWidget(self.bottom_table_section)
 
+        self.validation_dock = ValidationDock(self)
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.validation_dock)
+
         fusion_style = QStyleFactory.create("Fusion")
         if fusion_style:
             self.setStyle(fusion_style)
@@ -173,8 +269,15 @@ class DownAllocationApp(QMainWindow):
         self.setPalette(palette)
 
     def connect_signals(self):
+        # Action states follow the document status; apply its initial (all False) state once
+        self.document_status.changed.connect(self._update_export_save_buttons_state)
+        self._update_export_save_buttons_state()
+
         # Connect AppMenuBar signals to main_window methods
         self.app_menu_bar.new_requested.connect(self.reset_all_fields)
+        self.app_menu_bar.new_tab_requested.connect(self.new_document_tab)
+        self.app_menu_bar.close_tab_requested.connect(
+            lambda: self.close_document_tab(self.document_tabs.currentIndex()))
         self.app_menu_bar.open_requested.connect(self.open_project)
         self.app_menu_bar.save_requested.connect(self.save_project)
         self.app_menu_bar.save_as_requested.connect(self.save_as_project)
@@ -182,11 +285,24 @@ class DownAllocationApp(QMainWindow):
         self.app_menu_bar.export_pdf_requested.connect(self.export_to_pdf)
         self.app_menu_bar.exit_requested.connect(self.close)
         self.app_menu_bar.factory_edit_requested.connect(self.show_factory_edit)
+        self.app_menu_bar.find_panels_requested.connect(self.top_table_section.filter_bar.focus_search)
         self.app_menu_bar.toggle_factory_info_requested.connect(self.toggle_factory_info_panel)
         self.app_menu_bar.toggle_bottom_table_requested.connect(self.toggle_bottom_table_panel)
+        self.app_menu_bar.toggle_validation_dock_requested.connect(self.toggle_validation_dock)
+        self.validation_dock.closed.connect(lambda: self.toggle_validation_dock(False))
+        self.validation_dock.issue_activated.connect(
+            lambda row, col: self.top_table_section.reveal_cell(row + 2, col))
         self.app_menu_bar.settings_requested.connect(self.show_settings_dialog)
         self.app_menu_bar.help_requested.connect(self.show_help_dialog)
         self.app_menu_bar.about_requested.connect(self.show_about_dialog)
+        self.app_menu_bar.scenario_sweep_requested.connect(self.show_scenario_sweep_dialog)
+        self.app_menu_bar.grading_requested.connect(self.show_grading_dialog)
+        self.app_menu_bar.cad_import_requested.connect(self.show_cad_import_dialog)
+        self.app_menu_bar.panel_import_requested.connect(self.show_panel_import_dialog)
+        self.app_menu_bar.report_import_requested.connect(self.rebuild_projects_from_reports)
+        self.app_menu_bar.compare_requested.connect(self.show_compare_dialog)
+        self.app_menu_bar.season_analytics_requested.connect(self.show_season_analytics_dialog)
+        self.app_menu_bar.templates_requested.connect(self.show_template_dialog)
 
         # Connect AppToolBar signals to main_window methods (removed new_requested)
         # self.app_tool_bar.new_requested.connect(self.reset_all_fields) # REMOVED
@@ -229,26 +345,32 @@ class DownAllocationApp(QMainWindow):
             self.update_all_tables_and_dropdowns)
         
         self.top_table_section.size_headers_changed.connect(
-            self.top_input_section.update_base_size_dropdown)
+            lambda _sizes: self.top_input_section.sync_size_registry(
+                self.top_table_section.size_registry))
         self.top_table_section.table.request_resize.connect(
             lambda r, c: self._handle_table_resize_request(r, c))
 
+        self.document_tabs.currentChanged.connect(self._switch_document)
+        self.document_tabs.tabCloseRequested.connect(self.close_document_tab)
+        self.document_tabs.tabMoved.connect(
+            lambda old, new: self.documents.insert(new, self.documents.pop(old)))
+
     # region Factory Information Methods
-    def show_factory_edit(self):
-        current_name = self.factory_settings.value(
-            "factory_name", "")  # Use factory_settings
-        current_location = self.factory_settings.value(
-            "factory_location", "")  # Use factory_settings
+    def _default_factory_info(self):
+        """The saved factory info, used for new documents."""
+        return {'name': self.factory_settings.value("factory_name", ""),
+                'location': self.factory_settings.value("factory_location", "")}
 
-        dialog = FactoryEditDialog(current_name, current_location, self)
+    def show_factory_edit(self):
+        dialog = FactoryEditDialog(self.factory_info['name'], self.factory_info['location'], self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             factory_name, factory_location = dialog.get_factory_info()
+            # An explicit edit becomes the default as well as the active document's factory
             self.factory_settings.setValue(
                 "factory_name", factory_name)  # Use factory_settings
             self.factory_settings.setValue(
                 "factory_location", factory_location)  # Use factory_settings
-            self.factory_info_section.update_factory_display(
-                factory_name, factory_location)
+            self._restore_factory_info({'name': factory_name, 'location': factory_location})
             
             # Only update title with factory name if no project is loaded
             if self.current_project_path is None:
@@ -272,29 +394,35 @@ class DownAllocationApp(QMainWindow):
             pass
 
         try:
-            self.calculate_top_table_totals()
-
-            top_table_calc_data = self.top_table_section.get_table_data_for_calculation()
-            input_data = self.top_input_section.get_input_data()
-
-            self.bottom_table_section.update_table_data(
-                top_table_calc_data, input_data)
-
-            self.highlight_base_size_in_tables(input_data['base_size'])
-
-            self.top_input_section.update_base_size_dropdown(
-                self.top_table_section.get_available_sizes())
-
-            # Calculate and update Approx Weight
-            selected_base_size = self.top_input_section.base_size_combo.currentText()
-            approx_weight_value = 0.0
-            if selected_base_size:
-                total_base_size_area = self.top_table_section.get_total_area_for_size(selected_base_size)
-                # Use the new constant from AppStyles
-                approx_weight_value = total_base_size_area * AppStyles.APPROX_WEIGHT_FACTOR
-            self.top_input_section.set_approx_weight(approx_weight_value)
-
-            self.check_input_changes()
+            with telemetry.timed("update_all_tables_and_dropdowns", **self._telemetry_fields()):
+                self.calculate_top_table_totals()
+
+                input_data = self.top_input_section.get_input_data()
+                result = compute_allocation(
+                    self.top_table_section.get_grid(), input_data['base_size'],
+                    parse_weight(input_data['ecodown_weight']),
+                    parse_weight(input_data['garment_weight']))
+
+                # Kept for exports, which are written from the engine rather than the widget
+                self.allocation_result = result
+                self.bottom_table_section.update_table_data(result)
+
+                self.highlight_base_size_in_tables(input_data['base_size'])
+                self._update_validation(input_data['base_size'])
+
+                self.top_input_section.sync_size_registry(
+                    self.top_table_section.size_registry)
+
+                # Calculate and update Approx Weight
+                selected_base_size = self.top_input_section.base_size_combo.currentText()
+                approx_weight_value = 0.0
+                if selected_base_size:
+                    total_base_size_area = self.top_table_section.get_total_area_for_size(selected_base_size)
+                    # Use the new constant from AppStyles
+                    approx_weight_value = total_base_size_area * AppStyles.APPROX_WEIGHT_FACTOR
+                self.top_input_section.set_approx_weight(approx_weight_value)
+
+                self.check_input_changes()
         finally:
             # Reconnect signals
             self.top_table_section.data_changed.connect(self.update_all_tables_and_dropdowns)
@@ -303,66 +431,47 @@ class DownAllocationApp(QMainWindow):
             self.top_input_section.base_size_combo.currentTextChanged.connect(self.update_all_tables_and_dropdowns)
 
 
+    def _update_validation(self, base_size):
+        """Re-checks the rows edited since the last recompute, or the whole table after bulk changes."""
+        grid = self.top_table_section.get_grid()
+        rows = self.top_table_section.take_edited_rows()
+        if rows is None or not self.validator.can_update(grid, base_size):
+            changes = self.validator.run(grid, base_size)
+        else:
+            changes = self.validator.update_rows(grid, base_size, rows)
+        self.validation_dock.apply_changes(*changes)
+
     def calculate_top_table_totals(self):
         """
         Calculates and updates the total row in the top table.
         This method uses programmatic_change flag to prevent itemChanged signal recursion.
         """
         top_table_widget = self.top_table_section.table
+        grid = self.top_table_section.get_grid()
+        total_row = top_table_widget.rowCount() - 1
 
         top_table_widget.programmatic_change = True
         try:
-            total_qty = 0
-            for r in range(2, top_table_widget.rowCount() - 1):
-                qty_item = top_table_widget.item(r, 1)
-                try:
-                    qty = int(
-                        qty_item.text()) if qty_item and qty_item.text().isdigit() else 0
-                    total_qty += qty
-                except ValueError:
-                    pass
-
-            total_qty_item = top_table_widget.item(
-                top_table_widget.rowCount() - 1, 1)
-            if not total_qty_item:
-                total_qty_item = QTableWidgetItem()
-                top_table_widget.setItem(
-                    top_table_widget.rowCount() - 1, 1, total_qty_item)
-
-            total_qty_item.setText(str(total_qty))
-            total_qty_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            total_qty_item.setFont(
-                QFont("Courier New", AppStyles.TABLE_HEADERS_FONT_SIZE, QFont.Weight.Bold))
-            total_qty_item.setBackground(QColor(220, 220, 220))
-
-            for col_idx in range(2, top_table_widget.columnCount()):
-                total_area = 0.0
-                for row in range(2, top_table_widget.rowCount() - 1):
-                    qty_item = top_table_widget.item(row, 1)
-                    area_item = top_table_widget.item(row, col_idx)
-                    try:
-                        qty = int(
-                            qty_item.text()) if qty_item and qty_item.text().isdigit() else 0
-                        area = float(area_item.text()) if area_item and area_item.text().replace(
-                            ".", "", 1).isdigit() else 0.0
-                        total_area += qty * area
-                    except ValueError:
-                        pass
-
-                total_area_item = top_table_widget.item(
-                    top_table_widget.rowCount() - 1, col_idx)
-                if not total_area_item:
-                    total_area_item = QTableWidgetItem()
-                    top_table_widget.setItem(
-                        top_table_widget.rowCount() - 1, col_idx, total_area_item)
-                total_area_item.setText(f"{total_area:.2f}")
-                total_area_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                total_area_item.setFont(
-                    QFont("Courier New", AppStyles.TABLE_HEADERS_FONT_SIZE, QFont.Weight.Bold))
-                total_area_item.setBackground(QColor(220, 220, 220))
+            area_totals = grid.area_totals().tolist()
+            # Export/save need some area > 0; cached here for the document status
+            self._has_calculated_area = any(area > 0 for area in area_totals)
+            totals = [str(grid.total_qty())]
+            totals.extend(f"{area:.2f}" for area in area_totals)
+            total_font = QFont("Courier New", AppStyles.TABLE_HEADERS_FONT_SIZE, QFont.Weight.Bold)
+
+            for col_idx, text in enumerate(totals, start=1):
+                total_item = top_table_widget.item(total_row, col_idx)
+                if not total_item:
+                    total_item = QTableWidgetItem()
+                    total_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                    total_item.setFont(total_font)
+                    total_item.setBackground(QColor(220, 220, 220))
+                    top_table_widget.setItem(total_row, col_idx, total_item)
+                # Only touch cells whose total actually changed; each setText repaints
+                if total_item.text() != text:
+                    total_item.setText(text)
         finally:
             top_table_widget.programmatic_change = False
-            top_table_widget.viewport().update()
 
     def set_row_col_counts(self, new_data_rows, new_size_cols, show_confirmation=True):
         current_data_rows = self.top_table_section.table.rowCount() - 3
@@ -392,26 +501,30 @@ class DownAllocationApp(QMainWindow):
                 proceed = False
 
         if proceed:
-            self.top_table_section.table.push_undo_state()
-
-            saved_data = self.top_table_section.save_table_content()
+            with telemetry.timed("set_row_col_counts", **self._telemetry_fields()) as fields:
+                self.top_table_section.table.push_undo_state()
 
-            self.default_data_rows = new_data_rows
-            self.default_cols = new_size_cols + 2
+                self.default_data_rows = new_data_rows
+                self.default_cols = new_size_cols + 2
 
-            self.top_table_section.setup_table_content(
-                self.default_data_rows, self.default_cols)
+                # Resize in place: rows/columns are added or dropped at the end only
+                self.top_table_section.resize_data(
+                    self.default_data_rows, new_size_cols)
 
-            self.top_table_section.restore_table_content(saved_data)
-
-            self.adjust_table_section.update_row_col_inputs(
-                self.default_data_rows, self.default_cols - 2)
-            self.update_all_tables_and_dropdowns()
+                self.adjust_table_section.update_row_col_inputs(
+                    self.default_data_rows, self.default_cols - 2)
+                self.update_all_tables_and_dropdowns()
+                fields.update(new_panels=new_data_rows, new_sizes=new_size_cols)
             if show_confirmation:
                 QMessageBox.information(
                     self, "Table Size", "Table dimensions updated successfully.")
             self.check_input_changes()
 
+    def _telemetry_fields(self):
+        """Table dimensions recorded with every timing event."""
+        table = self.top_table_section.table
+        return {'panels': table.rowCount() - 3, 'sizes': table.columnCount() - 2}
+
     def _handle_table_resize_request(self, new_data_rows, new_size_cols):
         self.set_row_col_counts(
             new_data_rows, new_size_cols, show_confirmation=False)
@@ -427,36 +540,50 @@ class DownAllocationApp(QMainWindow):
         """Returns the path to the user's desktop."""
         return os.path.join(os.path.expanduser('~'), 'Desktop')
 
-    def _has_unsaved_changes(self):
-        """Checks if there are any unsaved changes in the application state."""
+    def _mark_document_clean(self):
+        """Records the current state as the saved/loaded/reset baseline for dirty tracking."""
+        self.initial_input_data = self.top_input_section.get_input_data()
+        self.initial_table_revision = self.top_table_section.revision
+        self.initial_row_count = self.adjust_table_section.row_input.text()
+        self.initial_col_count = self.adjust_table_section.col_input.text()
+
+    def _has_unsaved_changes(self, input_data=None):
+        """
+        Checks if there are any unsaved changes in the application state.
+        `input_data` is the current get_input_data() when the caller already has it.
+        """
         # If initial states haven't been set yet (during very early startup), consider no changes.
         if self.initial_input_data is None or \
-           self.initial_table_data is None or \
+           self.initial_table_revision is None or \
            self.initial_row_count is None or \
            self.initial_col_count is None:
             return False
 
-        current_input_data = self.top_input_section.get_input_data()
-        current_table_data = self.top_table_section.save_table_content()
-        current_row_count = self.adjust_table_section.row_input.text()
-        current_col_count = self.adjust_table_section.col_input.text()
-
-        # Compare current state with the initial state
-        input_data_changed = (current_input_data != self.initial_input_data)
-        table_data_changed = (current_table_data != self.initial_table_data)
-        row_col_count_changed = (current_row_count != self.initial_row_count or
-                                 current_col_count != self.initial_col_count)
+        # Any table edit bumps the revision, so the table check is O(1)
+        table_data_changed = (self.top_table_section.revision != self.initial_table_revision)
+        if input_data is None:
+            input_data = self.top_input_section.get_input_data()
+        input_data_changed = (input_data != self.initial_input_data)
+        row_col_count_changed = (self.adjust_table_section.row_input.text() != self.initial_row_count or
+                                 self.adjust_table_section.col_input.text() != self.initial_col_count)
 
-        return input_data_changed or table_data_changed or row_col_count_changed
+        return table_data_changed or input_data_changed or row_col_count_changed
 
     def check_input_changes(self):
         """
-        Updates the enabled/disabled state of the reset button based on changes.
-        Now also triggers an update for save/export buttons.
+        Refreshes the document status (dirty, has-area, valid-for-export).
+        The reset button and the save/export actions follow it via DocumentStatus.changed.
         """
-        has_changes = self._has_unsaved_changes()
-        self.adjust_table_section.reset_all_btn.setEnabled(has_changes)
-        self._update_export_save_buttons_state() # Call this to update save buttons as well
+        input_data = self.top_input_section.get_input_data()
+        weight_filled = (parse_weight(input_data['ecodown_weight']) > 0 or
+                         parse_weight(input_data['garment_weight']) > 0)
+        valid_for_export = (bool(input_data['style'].strip()) and
+                            bool(input_data['garments_stage'].strip()) and
+                            weight_filled and self._has_calculated_area)
+
+        dirty = self._has_unsaved_changes(input_data)
+        self.document_status.update(self._has_calculated_area, valid_for_export, dirty)
+        self._refresh_document_tab(dirty)
 
     def _get_base_filename_suggestion(self):
         """Constructs a dynamic base filename (without extension) for export/save."""
@@ -486,59 +613,32 @@ class DownAllocationApp(QMainWindow):
 
     def _update_export_save_buttons_state(self):
         """
-        Enables/disables Export and Save buttons based on required input fields
-        and if any calculated total in the top table is greater than 0,
-        and if there are unsaved changes for the 'Save' button.
+        Enables/disables Export and Save buttons from the document status:
+        required input fields and a calculated total > 0 for export, plus
+        unsaved changes for the 'Save' button.
         """
-        input_data = self.top_input_section.get_input_data()
-        style_filled = bool(input_data['style'].strip())
-        garments_stage_selected = bool(input_data['garments_stage'].strip())
-        ecodown_weight_filled = False
-        try:
-            if float(input_data['ecodown_weight']) > 0:
-                ecodown_weight_filled = True
-        except ValueError:
-            pass # Keep as False if conversion fails
-        
-        garment_weight_filled = False
-        try:
-            if float(input_data['garment_weight']) > 0:
-                garment_weight_filled = True
-        except ValueError:
-            pass
+        status = self.document_status
+        # Condition for export, save as, pdf export
+        can_perform_major_operation = status.valid_for_export
+        can_save = status.dirty and can_perform_major_operation
 
-        has_calculated_area = False
-        top_table_widget = self.top_table_section.table
-        # Iterate through total row (last row) for area columns (from col 2 onwards)
-        for col_idx in range(2, top_table_widget.columnCount()):
-            total_item = top_table_widget.item(top_table_widget.rowCount() - 1, col_idx)
-            if total_item:
-                try:
-                    if float(total_item.text()) > 0:
-                        has_calculated_area = True
-                        break
-                except ValueError:
-                    pass
+        self.adjust_table_section.reset_all_btn.setEnabled(status.dirty)
 
-        # Condition for export, save as, pdf export
-        can_perform_major_operation = (style_filled and garments_stage_selected and
-                                       (ecodown_weight_filled or garment_weight_filled) and
-                                       has_calculated_area)
-        
         # Use AppMenuBar methods to control action states
         self.app_menu_bar.set_export_excel_action_enabled(can_perform_major_operation)
         self.app_menu_bar.set_save_as_action_enabled(can_perform_major_operation)
         self.app_menu_bar.set_export_pdf_action_enabled(can_perform_major_operation)
+        self.app_menu_bar.set_scenario_sweep_action_enabled(status.has_area)
         self.app_menu_bar.set_open_action_enabled(True) # Open is always enabled
         self.app_menu_bar.set_new_action_enabled(True) # New is always enabled (in menu)
 
         # 'Save' menu button is enabled only if there are unsaved changes AND it's valid to save
-        self.app_menu_bar.set_save_action_enabled(self._has_unsaved_changes() and can_perform_major_operation)
+        self.app_menu_bar.set_save_action_enabled(can_save)
 
         # Control toolbar button states (removed set_new_action_enabled)
         # self.app_tool_bar.set_new_action_enabled(True) # Removed
         self.app_tool_bar.set_open_action_enabled(True) # Open is always enabled on toolbar
-        self.app_tool_bar.set_save_action_enabled(self._has_unsaved_changes() and can_perform_major_operation)
+        self.app_tool_bar.set_save_action_enabled(can_save)
         self.app_tool_bar.set_print_preview_action_enabled(can_perform_major_operation)
         self.app_tool_bar.set_print_action_enabled(can_perform_major_operation)
 
@@ -550,10 +650,7 @@ class DownAllocationApp(QMainWindow):
         QApplication.processEvents()
         progress.update_progress(10)
 
-        factory_name = self.factory_settings.value(
-            "factory_name", "")  # Use factory_settings
-        factory_location = self.factory_settings.value(
-            "factory_location", "")  # Use factory_settings
+        factory_info = self._default_factory_info()
         progress.update_progress(20)
 
         self.top_input_section.clear_inputs()
@@ -570,6 +667,7 @@ class DownAllocationApp(QMainWindow):
         self.top_table_section.clear_data()
         self.top_table_section.setup_table_content(
             self.default_data_rows, self.default_cols)
+        self.top_table_section.set_grading_rules(GradingRules())
         
         progress.update_progress(70)
 
@@ -578,14 +676,10 @@ class DownAllocationApp(QMainWindow):
         self.setWindowTitle("Automatic Down Allocation System")
 
         # Update initial states to reflect the reset state
-        self.initial_input_data = self.top_input_section.get_input_data()
-        self.initial_table_data = self.top_table_section.save_table_content()
-        self.initial_row_count = self.adjust_table_section.row_input.text()
-        self.initial_col_count = self.adjust_table_section.col_input.text()
+        self._mark_document_clean()
 
 
-        self.factory_info_section.update_factory_display(
-            factory_name, factory_location)
+        self._restore_factory_info(factory_info)
         progress.update_progress(90)
 
         self.update_all_tables_and_dropdowns()
@@ -594,6 +688,117 @@ class DownAllocationApp(QMainWindow):
         self.check_input_changes() # This will now disable the save button if no changes from loaded state
         progress.close()
 
+    # region Document Tabs
+    def _window_title(self):
+        if self.current_project_path:
+            return f"Automatic Down Allocation System - {os.path.basename(self.current_project_path)}"
+        return "Automatic Down Allocation System"
+
+    def _refresh_document_tab(self, dirty):
+        """Shows the active document's name and unsaved-changes mark (`dirty`) on its tab."""
+        if self._switching_documents:
+            return
+        index = self.documents.index(self.active_document)
+        if self.current_project_path:
+            title = os.path.splitext(os.path.basename(self.current_project_path))[0]
+        else:
+            title = self.top_input_section.style_input.text().strip() or UNTITLED
+        if dirty:
+            title += " *"
+        if self.document_tabs.tabText(index) != title:
+            self.document_tabs.setTabText(index, title)
+        self.document_tabs.setTabToolTip(index, self.current_project_path or "")
+
+    def _park_active_document(self):
+        """Moves the active document out of the section widgets into its Document."""
+        self.active_document.park(
+            self.current_project_path,
+            self.top_input_section.get_input_data(),
+            self.top_table_section.get_grid(),
+            self.top_table_section.grading_rules.to_dict(),
+            self.factory_info,
+            (self.adjust_table_section.row_input.text(), self.adjust_table_section.col_input.text()),
+            self.initial_input_data,
+            (self.initial_row_count, self.initial_col_count),
+            self.top_table_section.revision != self.initial_table_revision)
+
+    def _switch_document(self, index):
+        if self._switching_documents or not 0 <= index < len(self.documents):
+            return
+        document = self.documents[index]
+        if document is self.active_document:
+            return
+
+        self._switching_documents = True
+        try:
+            self._park_active_document()
+            self.active_document = document
+            self.current_project_path = document.path
+            clean_input_data, clean_counts = document.clean_input_data, document.clean_counts
+            table_dirty = document.table_dirty
+            project_data = document.unpark()
+            self._restore_factory_info(project_data['factory_info'])
+            self._apply_project_data(project_data)
+
+            # Restore the document's own unsaved-changes baseline
+            self._mark_document_clean()
+            if clean_input_data is not None:
+                self.initial_input_data = clean_input_data
+                self.initial_row_count, self.initial_col_count = clean_counts
+            if table_dirty:
+                self.initial_table_revision = -1  # Revisions never go negative
+            # Undo snapshots belong to the tab they were taken in
+            self.top_table_section.table.undo_stack.clear()
+            self.top_table_section.table.redo_stack.clear()
+            self.setWindowTitle(self._window_title())
+        finally:
+            self._switching_documents = False
+        self.check_input_changes()
+
+    def new_document_tab(self):
+        """Opens an empty Untitled document in a new tab."""
+        self._park_active_document()
+        document = Document()
+        self.documents.append(document)
+        self.active_document = document
+        self._switching_documents = True
+        try:
+            index = self.document_tabs.addTab(UNTITLED)
+            self.document_tabs.setCurrentIndex(index)
+        finally:
+            self._switching_documents = False
+        self.reset_all_fields()
+        self.top_table_section.table.undo_stack.clear()
+        self.top_table_section.table.redo_stack.clear()
+
+    def close_document_tab(self, index):
+        if not 0 <= index < len(self.documents):
+            return
+        document = self.documents[index]
+        dirty = self._has_unsaved_changes() if document is self.active_document else document.dirty
+        if dirty:
+            confirm_dialog = ConfirmationDialog(
+                "Close Tab",
+                f"'{self.document_tabs.tabText(index).rstrip(' *')}' has unsaved changes. Close it anyway?",
+                self
+            )
+            if confirm_dialog.exec() != QDialog.DialogCode.Accepted:
+                return
+
+        if len(self.documents) == 1:
+            # The last tab is never closed, only emptied
+            self.reset_all_fields()
+            return
+        if document is self.active_document:
+            self._switch_document(index + 1 if index + 1 < len(self.documents) else index - 1)
+        self.documents.pop(index)
+        self._switching_documents = True
+        try:
+            self.document_tabs.removeTab(index)
+        finally:
+            self._switching_documents = False
+    # endregion
+
     def export_to_excel(self):
         # Get suggested filename without extension
         suggested_base_filename = self._get_base_filename_suggestion()
@@ -619,184 +824,21 @@ class DownAllocationApp(QMainWindow):
             self.settings.setValue("last_saved_folder", self.last_saved_folder)
 
 
-            progress_dialog = ProgressDialog(
-                "Exporting to Excel", "Preparing data...", self)
-            progress_dialog.show()
-            QApplication.processEvents()
-            progress_dialog.update_progress(10)
-
-            input_data = self.top_input_section.get_input_data()
-            bottom_table_widget = self.bottom_table_section.table
-
-            with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
-                workbook = writer.book
-                worksheet = workbook.add_worksheet('Report')
-
-                # Define formats for xlsxwriter
-                # Keep font_size dynamic based on AppStyles
-                header_format = workbook.add_format({
-                    'bold': True, 'align': 'center', 'valign': 'vcenter',
-                    'bg_color': '#DCDCDC', 'border': 1, 'font_name': 'Courier New',
-                    'font_size': AppStyles.TABLE_HEADERS_FONT_SIZE
-                })
-                cell_format = workbook.add_format({
-                    'align': 'center', 'valign': 'vcenter', 'border': 1,
-                    'font_name': 'Courier New', 'font_size': AppStyles.TABLE_TEXT_SIZE
-                })
-                bold_cell_format = workbook.add_format({
-                    'bold': True, 'align': 'center', 'valign': 'vcenter', 'border': 1,
-                    'font_name': 'Courier New', 'font_size': AppStyles.TABLE_TEXT_SIZE
-                })
-                blue_bold_cell_format = workbook.add_format({
-                    'bold': True, 'align': 'center', 'valign': 'vcenter', 'border': 1,
-                    'font_color': '#0000FF', 'font_name': 'Courier New', 'font_size': AppStyles.TABLE_TEXT_SIZE
-                })
-                highlight_bg_format = workbook.add_format({
-                    'bg_color': '#DCE6F1', 'align': 'center', 'valign': 'vcenter', 'border': 1,
-                    'font_name': 'Courier New', 'font_size': AppStyles.TABLE_TEXT_SIZE
-                })
-                bold_highlight_bg_format = workbook.add_format({
-                    'bold': True, 'bg_color': '#DCE6F1', 'align': 'center', 'valign': 'vcenter', 'border': 1,
-                    'font_name': 'Courier New', 'font_size': AppStyles.TABLE_TEXT_SIZE
-                })
-                blue_bold_highlight_bg_format = workbook.add_format({
-                    'bold': True, 'bg_color': '#DCE6F1', 'align': 'center', 'valign': 'vcenter', 'border': 1,
-                    'font_color': '#0000FF', 'font_name': 'Courier New', 'font_size': AppStyles.TABLE_TEXT_SIZE
-                })
-                
-                # --- Write Factory Info and Input Data ---
-                current_excel_row = 0 # Starting row for Excel output
-
-                # Factory Info
-                factory_name = self.factory_settings.value("factory_name", "N/A")
-                factory_location = self.factory_settings.value("factory_location", "N/A")
-                worksheet.write(current_excel_row, 0, 'Factory Name:', header_format)
-                worksheet.write(current_excel_row, 1, factory_name, cell_format)
-                current_excel_row += 1
-                worksheet.write(current_excel_row, 0, 'Location:', header_format)
-                worksheet.write(current_excel_row, 1, factory_location, cell_format)
-                current_excel_row += 2 # Add spacing
-
-                # Input Data
-                worksheet.write(current_excel_row, 0, 'Input Field', header_format)
-                worksheet.write(current_excel_row, 1, 'Value', header_format)
-                current_excel_row += 1
-                input_fields_order = [
-                    ("Date", input_data['date']),
-                    ("Buyer", input_data['buyer']),
-                    ("Style", input_data['style']),
-                    ("Season", input_data['season']),
-                    ("Garments Stage", input_data['garments_stage']),
-                    ("Base Size", input_data['base_size']),
-                    ("Ecodown Weight", input_data['ecodown_weight']),
-                    ("Garments Weight", input_data['garment_weight']),
-                    ("Approx Weight", input_data['approx_weight'])
-                ]
-                for label, value in input_fields_order:
-                    worksheet.write(current_excel_row, 0, label, cell_format)
-                    worksheet.write(current_excel_row, 1, value, cell_format)
-                    current_excel_row += 1
-                current_excel_row += 2 # Add spacing
-
-                progress_dialog.update_progress(30)
+            with telemetry.timed("export_to_excel", **self._telemetry_fields()) as fields:
+                progress_dialog = ProgressDialog(
+                    "Exporting to Excel", "Preparing data...", self)
+                progress_dialog.show()
+                QApplication.processEvents()
+                progress_dialog.update_progress(10)
 
-                # --- Write Bottom Table Data to match UI ---
-                # Set dynamic column widths based on the visible data in the bottom table
-                max_col_widths = [0] * bottom_table_widget.columnCount()
-                for r_pyqt in range(bottom_table_widget.rowCount()):
-                    if bottom_table_widget.isRowHidden(r_pyqt):
-                        continue # Skip hidden rows
-                    for c_pyqt in range(bottom_table_widget.columnCount()):
-                        item = bottom_table_widget.item(r_pyqt, c_pyqt)
-                        if item and item.text():
-                            text_len = len(item.text())
-                            if text_len > max_col_widths[c_pyqt]:
-                                max_col_widths[c_pyqt] = text_len
-
-                for col_idx, width in enumerate(max_col_widths):
-                    worksheet.set_column(col_idx, col_idx, width + 2) # Add some padding
-
-
-                # Keep track of which cells have already been written due to merges
-                # This set will store (excel_row, excel_col) for cells that are *covered* by a merge
-                # This helps prevent writing data to a cell that is already part of a merge.
-                written_cells = set()
-
-                # Iterate through each row of the PyQt table
-                for r_pyqt in range(bottom_table_widget.rowCount()):
-                    # If the PyQt row is hidden, skip writing it to Excel
-                    if bottom_table_widget.isRowHidden(r_pyqt):
-                        # Use xlsxwriter to hide the corresponding row in Excel
-                        worksheet.set_row(current_excel_row, options={'hidden': True})
-                        # IMPORTANT: Even if hidden, we must still increment the Excel row counter
-                        # to maintain correct row mapping for subsequent visible rows.
-                        current_excel_row += 1
-                        continue
-
-                    for c_pyqt in range(bottom_table_widget.columnCount()):
-                        # Check if this cell is already covered by a previous merge in this row
-                        if (current_excel_row, c_pyqt) in written_cells:
-                            continue
-
-                        item = bottom_table_widget.item(r_pyqt, c_pyqt)
-                        text = item.text() if item else ""
-                        
-                        # Get span information from the PyQt table using QTableWidget's methods
-                        row_span_pyqt = bottom_table_widget.rowSpan(r_pyqt, c_pyqt)
-                        col_span_pyqt = bottom_table_widget.columnSpan(r_pyqt, c_pyqt)
-
-
-                        # Determine cell format based on PyQt's item properties
-                        current_cell_format = cell_format # Default
-                        if item: # Only apply styles if item exists
-                            if item.font().bold():
-                                current_cell_format = bold_cell_format
-                            if item.foreground().color() == QColor(0, 0, 255): # Blue color
-                                current_cell_format = blue_bold_cell_format
-                            # Note: The background logic for light grey/light blue is more complex with Qt roles
-                            # For simplicity, let's try to infer from background color directly.
-                            # QColor(220, 220, 220) for light gray header-like cells
-                            # QColor(220, 230, 241) for light blue highlighted cells
-                            if item.background().color() == QColor(220, 220, 220): 
-                                # Use header_format for fixed grey cells, ensuring bold
-                                # This handles "PANEL NAME", "PANEL QTY", "WEIGHT" labels, and TOTAL rows
-                                header_like_format = workbook.add_format(header_format.get_properties())
-                                header_like_format.set_font_size(AppStyles.TABLE_HEADERS_FONT_SIZE)
-                                header_like_format.set_bg_color('#DCDCDC')
-                                current_cell_format = header_like_format
-                            elif item.background().color() == QColor(220, 230, 241): # Light blue highlight
-                                # Create a format for the light blue background
-                                highlight_format = workbook.add_format(cell_format.get_properties())
-                                highlight_format.set_bg_color('#DCE6F1')
-                                if item.font().bold() and item.foreground().color() == QColor(0,0,255):
-                                    highlight_format.set_bold()
-                                    highlight_format.set_font_color('#0000FF')
-                                elif item.font().bold():
-                                    highlight_format.set_bold()
-                                current_cell_format = highlight_format
-                            else: # Default white background
-                                current_cell_format = cell_format # Ensure non-highlighted cells use base cell format
-                                if item.font().bold():
-                                    current_cell_format = bold_cell_format
-                                if item.foreground().color() == QColor(0,0,255):
-                                    current_cell_format = blue_bold_cell_format
-                        
-                        # Apply merges if necessary
-                        if row_span_pyqt > 1 or col_span_pyqt > 1:
-                            worksheet.merge_range(
-                                current_excel_row, c_pyqt,
-                                current_excel_row + row_span_pyqt - 1, c_pyqt + col_span_pyqt - 1,
-                                text, current_cell_format
-                            )
-                            # Mark all cells covered by this merge as written
-                            for r_merge in range(current_excel_row, current_excel_row + row_span_pyqt):
-                                for c_merge in range(c_pyqt, c_pyqt + col_span_pyqt):
-                                    written_cells.add((r_merge, c_merge))
-                        else:
-                            worksheet.write(current_excel_row, c_pyqt, text, current_cell_format)
-                            written_cells.add((current_excel_row, c_pyqt)) # Mark 1x1 cell as written
-
-                    current_excel_row += 1 # Move to the next row in Excel after processing a PyQt row.
+                input_data = self.top_input_section.get_input_data()
+                top_table_data = self.top_table_section.save_table_content()
+                export_key = self._export_cache_key('xlsx', input_data, top_table_data)
+                fields['cached'] = self.result_cache.copy_to(export_key, 'xlsx', file_path)
+                if not fields['cached']:
+                    result = self._cached_allocation(input_data, top_table_data)
+                    self._write_excel_report(file_path, input_data, result, progress_dialog)
+                    self.result_cache.put_file(export_key, 'xlsx', file_path)
 
             progress_dialog.update_progress(100)
             progress_dialog.close()
@@ -807,6 +849,139 @@ class DownAllocationApp(QMainWindow):
             if 'progress_dialog' in locals():
                 progress_dialog.close()
 
+    def _cached_allocation(self, input_data, top_table_data):
+        """AllocationResult for the given inputs, read from or stored in the result cache."""
+        payload = allocation_payload(top_table_data, input_data)
+        key = payload_hash(payload)
+        result = self.result_cache.get_allocation(key)
+        if result is None:
+            result = allocate_saved(payload['top_table_data'], payload['input_data'])
+            self.result_cache.put_allocation(key, result)
+        return result
+
+    def _export_cache_key(self, kind, input_data, top_table_data):
+        """Hash of everything a rendered report depends on: inputs, table, factory info and export styles."""
+        return payload_hash({
+            'kind': kind,
+            'input_data': input_data,
+            'top_table_data': top_table_data,
+            'factory_info': {
+                'factory_name': self.factory_info['name'] or "N/A",
+                'factory_location': self.factory_info['location'] or "N/A",
+            },
+            'styles': {
+                'TABLE_HEADERS_FONT_SIZE': AppStyles.TABLE_HEADERS_FONT_SIZE,
+                'TABLE_TEXT_SIZE': AppStyles.TABLE_TEXT_SIZE,
+            },
+        })
+
+    def _write_excel_report(self, file_path, input_data, result, progress_dialog):
+        report_rows = allocation_table_rows(result)
+        base_col = result.base_col + 3 if result.base_col != -1 else -1
+
+        # pandas is only needed here; importing it lazily keeps it off the startup path
+        import pandas as pd
+
+        with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
+            workbook = writer.book
+            worksheet = workbook.add_worksheet('Report')
+
+            # Define formats for xlsxwriter
+            # Keep font_size dynamic based on AppStyles
+            header_format = workbook.add_format({
+                'bold': True, 'align': 'center', 'valign': 'vcenter',
+                'bg_color': '#DCDCDC', 'border': 1, 'font_name': 'Courier New',
+                'font_size': AppStyles.TABLE_HEADERS_FONT_SIZE
+            })
+            cell_format = workbook.add_format({
+                'align': 'center', 'valign': 'vcenter', 'border': 1,
+                'font_name': 'Courier New', 'font_size': AppStyles.TABLE_TEXT_SIZE
+            })
+            bold_cell_format = workbook.add_format({
+                'bold': True, 'align': 'center', 'valign': 'vcenter', 'border': 1,
+                'font_name': 'Courier New', 'font_size': AppStyles.TABLE_TEXT_SIZE
+            })
+            blue_bold_cell_format = workbook.add_format({
+                'bold': True, 'align': 'center', 'valign': 'vcenter', 'border': 1,
+                'font_color': '#0000FF', 'font_name': 'Courier New', 'font_size': AppStyles.TABLE_TEXT_SIZE
+            })
+
+            # --- Write Factory Info and Input Data ---
+            current_excel_row = 0 # Starting row for Excel output
+
+            # Factory Info
+            factory_name = self.factory_info['name'] or "N/A"
+            factory_location = self.factory_info['location'] or "N/A"
+            worksheet.write(current_excel_row, 0, 'Factory Name:', header_format)
+            worksheet.write(current_excel_row, 1, factory_name, cell_format)
+            current_excel_row += 1
+            worksheet.write(current_excel_row, 0, 'Location:', header_format)
+            worksheet.write(current_excel_row, 1, factory_location, cell_format)
+            current_excel_row += 2 # Add spacing
+
+            # Input Data
+            worksheet.write(current_excel_row, 0, 'Input Field', header_format)
+            worksheet.write(current_excel_row, 1, 'Value', header_format)
+            current_excel_row += 1
+            input_fields_order = [
+                ("Date", input_data['date']),
+                ("Buyer", input_data['buyer']),
+                ("Style", input_data['style']),
+                ("Season", input_data['season']),
+                ("Garments Stage", input_data['garments_stage']),
+                ("Base Size", input_data['base_size']),
+                ("Ecodown Weight", input_data['ecodown_weight']),
+                ("Garments Weight", input_data['garment_weight']),
+                ("Approx Weight", input_data['approx_weight'])
+            ]
+            for label, value in input_fields_order:
+                worksheet.write(current_excel_row, 0, label, cell_format)
+                worksheet.write(current_excel_row, 1, value, cell_format)
+                current_excel_row += 1
+            current_excel_row += 2 # Add spacing
+
+            progress_dialog.update_progress(30)
+
+            # --- Write the allocation table, laid out exactly like the bottom table ---
+            # Column widths follow the longest text in each column of the visible rows
+            max_col_widths = [0] * (len(result.sizes) + 3)
+            for hidden, cells in report_rows:
+                if hidden:
+                    continue # Skip hidden rows
+                for col, text, _row_span, _col_span, _bold in cells:
+                    if len(text) > max_col_widths[col]:
+                        max_col_widths[col] = len(text)
+
+            for col_idx, width in enumerate(max_col_widths):
+                worksheet.set_column(col_idx, col_idx, width + 2) # Add some padding
+
+            for table_row, (hidden, cells) in enumerate(report_rows):
+                if hidden:
+                    # Hidden rows stay in the sheet (hidden) so two-row panel merges line up
+                    worksheet.set_row(current_excel_row, options={'hidden': True})
+                    current_excel_row += 1
+                    continue
+
+                for col, text, row_span, col_span, bold in cells:
+                    # The base size column is bold blue below the headers, as in the UI
+                    if table_row >= 2 and col == base_col:
+                        current_cell_format = blue_bold_cell_format
+                    elif bold:
+                        current_cell_format = bold_cell_format
+                    else:
+                        current_cell_format = cell_format
+
+                    if row_span > 1 or col_span > 1:
+                        worksheet.merge_range(
+                            current_excel_row, col,
+                            current_excel_row + row_span - 1, col + col_span - 1,
+                            text, current_cell_format
+                        )
+                    else:
+                        worksheet.write(current_excel_row, col, text, current_cell_format)
+
+                current_excel_row += 1 # Move to the next row in Excel
+
     def open_project(self):
         # Get the file path from the user
         # Use last_opened_folder as the default directory
@@ -820,10 +995,26 @@ class DownAllocationApp(QMainWindow):
         if not file_path:
             return # User cancelled
 
+        self.open_project_path(file_path)
+
+    def open_project_path(self, file_path):
+        """Opens the .dax at `file_path` (from the Open dialog or forwarded by another launch)."""
         # Update last_opened_folder
         self.last_opened_folder = os.path.dirname(file_path)
         self.settings.setValue("last_opened_folder", self.last_opened_folder)
 
+        # A project that is already open is just brought to the front
+        for index, document in enumerate(self.documents):
+            path = self.current_project_path if document is self.active_document else document.path
+            if path and os.path.normcase(os.path.abspath(path)) == os.path.normcase(os.path.abspath(file_path)):
+                self.document_tabs.setCurrentIndex(index)
+                return
+
+        # Open into a new tab unless the current one is an untouched Untitled document
+        opened_tab = False
+        if self.current_project_path is not None or self._has_unsaved_changes():
+            self.new_document_tab()
+            opened_tab = True
 
         progress_dialog = ProgressDialog(
             "Opening Project", "Loading data...", self)
@@ -832,65 +1023,28 @@ class DownAllocationApp(QMainWindow):
         progress_dialog.update_progress(10)
 
         try:
-            with open(file_path, 'r') as f:
-                project_data = json.load(f)
-
-            progress_dialog.update_progress(30)
-
-            # Restore Factory Info
-            factory_name = project_data.get('factory_info', {}).get('name', '')
-            factory_location = project_data.get('factory_info', {}).get('location', '')
-            self.factory_settings.setValue("factory_name", factory_name)
-            self.factory_settings.setValue("factory_location", factory_location)
-            self.factory_info_section.update_factory_display(factory_name, factory_location)
-            # Update current project path and window title after successful open
-            self.current_project_path = file_path
-            self.setWindowTitle(f"Automatic Down Allocation System - {os.path.basename(file_path)}") # Display filename in title
+            # Only the load is timed: a failure leaves the block (recorded with ok=False)
+            # before the error box below is shown
+            with telemetry.timed("open_project_path", **self._telemetry_fields()) as fields:
+                with open(file_path, 'r') as f:
+                    project_data = json.load(f)
 
+                progress_dialog.update_progress(30)
 
-            progress_dialog.update_progress(50)
+                self._restore_factory_info(project_data.get('factory_info', {}))
+                # Update current project path and window title after successful open
+                self.current_project_path = file_path
+                self.setWindowTitle(f"Automatic Down Allocation System - {os.path.basename(file_path)}") # Display filename in title
 
-            # Restore Adjust Table counts (and indirectly, top_table's dimensions)
-            adjust_counts = project_data.get('adjust_table_counts', {})
-            new_data_rows = adjust_counts.get('rows', AppStyles.DEFAULT_DATA_ROWS)
-            new_size_cols = adjust_counts.get('cols', AppStyles.DEFAULT_COLS - 2) # Convert back from total cols
-            self.adjust_table_section.update_row_col_inputs(new_data_rows, new_size_cols)
-            # This implicitly calls set_row_col_counts which will setup top table content
-            # We don't need a confirmation for programmatic load, so passing False
-            self.set_row_col_counts(new_data_rows, new_size_cols, show_confirmation=False)
-            
-            # Restore Top Table data AFTER dimensions are set
-            top_table_data = project_data.get('top_table_data', {})
-            self.top_table_section.restore_table_content(top_table_data)
-            
-            progress_dialog.update_progress(70) # Progress for loading top table data
+                progress_dialog.update_progress(50)
 
-            # Restore Top Input Section data - temporarily hold base_size
-            input_data = project_data.get('input_data', {})
-            temp_base_size = input_data.get('base_size', '') # Use .get() to avoid KeyError if not present
-            # Remove base_size from input_data before setting, so it's not set twice.
-            # Pop it if it exists, otherwise keep input_data as is.
-            if 'base_size' in input_data:
-                input_data.pop('base_size')
+                self._apply_project_data(project_data, progress_dialog)
 
-            self.top_input_section.set_input_data(input_data) # This sets all other input fields
+                # Update initial states to reflect the newly loaded project's state
+                self._mark_document_clean()
 
-            progress_dialog.update_progress(80) # Progress after setting most input data
-            
-            # Update all derived tables and dropdowns (this will correctly populate base_size_combo)
-            self.update_all_tables_and_dropdowns()
-
-            # Now, explicitly set base size after the dropdown has been fully populated by update_all_tables_and_dropdowns
-            if temp_base_size:
-                self.top_input_section.base_size_combo.setCurrentText(temp_base_size)
-            
-            # Update initial states to reflect the newly loaded project's state
-            self.initial_input_data = self.top_input_section.get_input_data()
-            self.initial_table_data = self.top_table_section.save_table_content()
-            self.initial_row_count = self.adjust_table_section.row_input.text()
-            self.initial_col_count = self.adjust_table_section.col_input.text()
-
-            self.check_input_changes() # This will now disable the save button if no changes from loaded state
+                self.check_input_changes() # This will now disable the save button if no changes from loaded state
+                fields.update(self._telemetry_fields())
 
             progress_dialog.update_progress(100)
             progress_dialog.close()
@@ -904,6 +1058,66 @@ class DownAllocationApp(QMainWindow):
         except Exception as e:
             progress_dialog.close()
             QMessageBox.critical(self, "Error", f"Failed to open project: {e}")
+        else:
+            return
+        if opened_tab:  # Drop the empty tab the failed open was going into
+            self.current_project_path = None
+            self._mark_document_clean()
+            self.close_document_tab(self.document_tabs.currentIndex())
+
+    def _restore_factory_info(self, factory_info):
+        """
+        Makes a project's factory name and location the active ones (in memory
+        and on display); the saved default in factory_settings is left alone.
+        """
+        self.factory_info = {'name': factory_info.get('name', ''),
+                             'location': factory_info.get('location', '')}
+        self.factory_info_section.update_factory_display(
+            self.factory_info['name'], self.factory_info['location'])
+
+    def bring_to_front(self):
+        """Raises the window when another launch hands over to this instance."""
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    def _apply_project_data(self, project_data, progress_dialog=None):
+        """Loads .dax-shaped project data (inputs, table, grading) into the sections."""
+        # Restore Adjust Table counts (and indirectly, top_table's dimensions)
+        adjust_counts = project_data.get('adjust_table_counts', {})
+        new_data_rows = adjust_counts.get('rows', AppStyles.DEFAULT_DATA_ROWS)
+        new_size_cols = adjust_counts.get('cols', AppStyles.DEFAULT_COLS - 2) # Convert back from total cols
+        self.adjust_table_section.update_row_col_inputs(new_data_rows, new_size_cols)
+        # This implicitly calls set_row_col_counts which will setup top table content
+        # We don't need a confirmation for programmatic load, so passing False
+        self.set_row_col_counts(new_data_rows, new_size_cols, show_confirmation=False)
+
+        # Restore Top Table data AFTER dimensions are set
+        top_table_data = project_data.get('top_table_data', {})
+        self.top_table_section.restore_table_content(top_table_data)
+        self.top_table_section.set_grading_rules(
+            GradingRules.from_dict(project_data.get('grading_rules', {})))
+
+        if progress_dialog:
+            progress_dialog.update_progress(70) # Progress for loading top table data
+
+        # Restore Top Input Section data - temporarily hold base_size
+        input_data = dict(project_data.get('input_data', {}))
+        # Remove base_size from input_data before setting, so it's not set twice.
+        temp_base_size = input_data.pop('base_size', '')
+
+        self.top_input_section.set_input_data(input_data) # This sets all other input fields
+
+        if progress_dialog:
+            progress_dialog.update_progress(80) # Progress after setting most input data
+
+        # Update all derived tables and dropdowns (this will correctly populate base_size_combo)
+        self.update_all_tables_and_dropdowns()
+
+        # Now, explicitly set base size after the dropdown has been fully populated by update_all_tables_and_dropdowns
+        if temp_base_size:
+            self.top_input_section.base_size_combo.setCurrentText(temp_base_size)
 
 
     def _perform_save_operation(self, file_path):
@@ -915,24 +1129,28 @@ class DownAllocationApp(QMainWindow):
         progress_dialog.update_progress(10)
 
         try:
-            # Gather all data to save
-            project_data = {
-                'factory_info': {
-                    'name': self.factory_settings.value("factory_name", ""),
-                    'location': self.factory_settings.value("factory_location", "")
-                },
-                'input_data': self.top_input_section.get_input_data(),
-                'top_table_data': self.top_table_section.save_table_content(),
-                'adjust_table_counts': {
-                    'rows': int(self.adjust_table_section.row_input.text()),
-                    'cols': int(self.adjust_table_section.col_input.text())
+            # Only the write is timed: a failure leaves the block (recorded with ok=False)
+            # before the error box below is shown
+            with telemetry.timed("perform_save_operation", **self._telemetry_fields()):
+                # Gather all data to save
+                project_data = {
+                    'factory_info': {
+                        'name': self.factory_info['name'],
+                        'location': self.factory_info['location']
+                    },
+                    'input_data': self.top_input_section.get_input_data(),
+                    'top_table_data': self.top_table_section.save_table_content(),
+                    'grading_rules': self.top_table_section.grading_rules.to_dict(),
+                    'adjust_table_counts': {
+                        'rows': int(self.adjust_table_section.row_input.text()),
+                        'cols': int(self.adjust_table_section.col_input.text())
+                    }
                 }
-            }
-            progress_dialog.update_progress(50)
+                progress_dialog.update_progress(50)
 
-            # Save data to JSON file
-            with open(file_path, 'w') as f:
-                json.dump(project_data, f, indent=4) # Use indent for human-readable output
+                # Save data to JSON file
+                with open(file_path, 'w') as f:
+                    json.dump(project_data, f, indent=4) # Use indent for human-readable output
 
             progress_dialog.update_progress(100)
             progress_dialog.close()
@@ -941,11 +1159,10 @@ class DownAllocationApp(QMainWindow):
             self.current_project_path = file_path
             self.setWindowTitle(f"Automatic Down Allocation System - {os.path.basename(file_path)}") # Display filename in title
 
+            self._index_saved_project(file_path, project_data)
+
             # Update initial state after saving to reflect current state
-            self.initial_input_data = self.top_input_section.get_input_data()
-            self.initial_table_data = self.top_table_section.save_table_content()
-            self.initial_row_count = self.adjust_table_section.row_input.text()
-            self.initial_col_count = self.adjust_table_section.col_input.text()
+            self._mark_document_clean()
             self.check_input_changes() # Re-check to disable save button if no further changes
 
             # Update last_saved_folder
@@ -992,6 +1209,176 @@ class DownAllocationApp(QMainWindow):
         QMessageBox.information(
             self, "Export to PDF", "PDF export functionality is not yet fully implemented. It will generate a print-ready PDF of current data.")
     
+    def show_scenario_sweep_dialog(self):
+        input_data = self.top_input_section.get_input_data()
+        dialog = ScenarioSweepDialog(
+            self.top_table_section.get_grid(), input_data['base_size'],
+            input_data['ecodown_weight'], input_data['garment_weight'],
+            self.last_saved_folder, self)
+        dialog.exec()
+
+    def show_grading_dialog(self):
+        base_size = self.top_input_section.base_size_combo.currentText()
+        if self.top_table_section.size_registry.column_of(base_size) == -1:
+            QMessageBox.warning(self, "Size Grading",
+                                "Select a base size first; the other sizes are graded from it.")
+            return
+        grid = self.top_table_section.get_grid()
+        panel_names = list(dict.fromkeys(name for name in grid.names if name))
+        if not panel_names:
+            QMessageBox.warning(self, "Size Grading", "Enter panel names before grading.")
+            return
+
+        dialog = GradingDialog(panel_names, self.top_table_section.grading_rules, base_size, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.top_table_section.set_grading_rules(dialog.get_rules())
+            self.top_table_section.apply_grading()
+            self.update_all_tables_and_dropdowns()
+
+    def show_compare_dialog(self):
+        # The open project is the new version; the older one is picked in the dialog
+        initial_dir = self.last_opened_folder
+        if not os.path.isdir(initial_dir):
+            initial_dir = self._get_desktop_path()
+        dialog = CompareDialog("", self.current_project_path or "", initial_dir, self)
+        dialog.exec()
+
+    def show_season_analytics_dialog(self):
+        folder = self.last_opened_folder
+        if not os.path.isdir(folder):
+            folder = self._get_desktop_path()
+        dialog = SeasonAnalyticsDialog(folder, self.project_index_path, self.result_cache,
+                                       self.last_saved_folder, self)
+        dialog.exec()
+
+    def show_cad_import_dialog(self):
+        initial_dir = self.last_opened_folder
+        if not os.path.isdir(initial_dir):
+            initial_dir = self._get_desktop_path()
+        dialog = CadImportDialog(initial_dir, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        result = dialog.result
+        try:
+            self.top_table_section.load_area_matrix(result.names, result.sizes, result.areas, result.qty)
+        except ValueError as e:
+            QMessageBox.warning(self, "Import CAD Pattern Areas", f"Could not import the pattern: {e}")
+
+    def show_panel_import_dialog(self):
+        initial_dir = self.last_opened_folder
+        if not os.path.isdir(initial_dir):
+            initial_dir = self._get_desktop_path()
+        dialog = PanelImportDialog(initial_dir, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        try:
+            self.top_table_section.replace_table_content(dialog.result.to_saved())
+        except ValueError as e:
+            QMessageBox.warning(self, "Import Panel Sheet", f"Could not import the sheet: {e}")
+
+    def show_template_dialog(self):
+        section = self.top_table_section
+        dialog = TemplateDialog(
+            self.template_store_path,
+            lambda name: PanelTemplate.from_grid(name, section.get_grid(), section.grading_rules.to_dict()),
+            self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        try:
+            section.insert_template(dialog.template)
+        except ValueError as e:
+            QMessageBox.warning(self, "Panel Templates", f"Could not insert the template: {e}")
+
+    def rebuild_projects_from_reports(self):
+        initial_dir = self.last_opened_folder
+        if not os.path.isdir(initial_dir):
+            initial_dir = self._get_desktop_path()
+        reports_dir = QFileDialog.getExistingDirectory(self, "Folder with Excel Reports", initial_dir)
+        if not reports_dir:
+            return
+        output_dir = QFileDialog.getExistingDirectory(self, "Folder for Rebuilt Projects", reports_dir)
+        if not output_dir:
+            return
+
+        report_paths = find_reports(reports_dir)
+        if not report_paths:
+            QMessageBox.information(self, "Rebuild Projects", "No .xlsx reports found in that folder.")
+            return
+
+        progress_dialog = ProgressDialog(
+            "Rebuilding Projects", f"Reading {len(report_paths)} reports...", self)
+        progress_dialog.show()
+        QApplication.processEvents()
+
+        def report_progress(done, total):
+            progress_dialog.update_progress(int(done * 100 / total))
+            QApplication.processEvents()
+
+        try:
+            with ProjectIndex(self.project_index_path) as index:
+                written, failed = rebuild_projects(report_paths, output_dir, index,
+                                                   progress=report_progress)
+        except Exception as e:
+            progress_dialog.close()
+            QMessageBox.critical(self, "Rebuild Projects", f"Failed to rebuild projects: {e}")
+            return
+        progress_dialog.close()
+        if written:
+            self._invalidate_panel_names()  # Reloaded with the new projects' panels on next use
+
+        message = f"{len(written)} projects rebuilt in {output_dir}."
+        if failed:
+            skipped = "\n".join(f"{os.path.basename(path)}: {error}" for path, error in failed[:20])
+            more = f"\n... and {len(failed) - 20} more" if len(failed) > 20 else ""
+            message += f"\n\n{len(failed)} files skipped:\n{skipped}{more}"
+        QMessageBox.information(self, "Rebuild Projects", message)
+
+    def panel_name_index(self):
+        """
+        PanelNameIndex of every indexed project's panel names, or None while it
+        is loading. The first call starts the load on a background thread, so
+        the first panel name edit never waits for it.
+        """
+        if self._panel_names is None and not self._panel_names_loading:
+            self._panel_names_loading = True
+            threading.Thread(target=self._load_panel_names, args=(self._panel_names_generation,),
+                             daemon=True).start()
+        return self._panel_names
+
+    def _load_panel_names(self, generation):
+        """Runs on the worker thread; the result is handed to the UI thread by signal."""
+        try:
+            with ProjectIndex(self.project_index_path) as index:
+                counts = index.panel_name_counts()
+        except Exception:  # Unreadable index: complete nothing rather than fail the editor
+            counts = {}
+        self.panel_names_loaded.emit(generation, PanelNameIndex(counts))
+
+    def _install_panel_names(self, generation, names):
+        if generation != self._panel_names_generation:
+            return  # Invalidated while loading; a newer load reads the current index
+        self._panel_names = names
+        self._panel_names_loading = False
+
+    def _invalidate_panel_names(self):
+        """Drops the completions (and any load in progress) so the next use reloads the index."""
+        self._panel_names_generation += 1
+        self._panel_names = None
+        self._panel_names_loading = False
+
+    def _index_saved_project(self, file_path, project_data):
+        """Adds a saved project to the project index and its new panel names to the completions."""
+        try:
+            with ProjectIndex(self.project_index_path) as index:
+                new_names = set(panel_names(project_data)) - index.panel_names_for(file_path)
+                index.add(file_path, project_data)
+        except Exception:  # The project is saved; a stale index only costs completions
+            return
+        if self._panel_names is not None:
+            self._panel_names.add_many(sorted(new_names))
+        elif self._panel_names_loading:
+            self._invalidate_panel_names()  # The running load may have read the index before this save
+
     def print_preview(self):
         """Placeholder for print preview functionality."""
         QMessageBox.information(
@@ -1012,6 +1399,11 @@ class DownAllocationApp(QMainWindow):
         self.settings.setValue(
             'view_settings/show_bottom_table', is_checked)  # Save state
 
+    def toggle_validation_dock(self, is_checked: bool):
+        self.validation_dock.setVisible(is_checked)
+        self.app_menu_bar.set_validation_dock_checked(is_checked)
+        self.settings.setValue('view_settings/show_validation_dock', is_checked)
+
     def show_settings_dialog(self):
         settings_dialog = SettingsDialog(self)
         settings_dialog.settings_changed.connect(self.reapply_app_styles)
@@ -1050,6 +1442,14 @@ class DownAllocationApp(QMainWindow):
             'settings/factory_font_size', AppStyles.FACTORY_FONT_SIZE, type=int)
         AppStyles.INPUT_FIELDS_LABEL_SIZE = app_settings.value(
             'settings/input_fields_label_size', AppStyles.INPUT_FIELDS_LABEL_SIZE, type=int)
+        AppStyles.MAX_PANEL_ROWS = app_settings.value(
+            'settings/max_panel_rows', AppStyles.MAX_PANEL_ROWS, type=int)
+        AppStyles.MAX_SIZE_COLS = app_settings.value(
+            'settings/max_size_cols', AppStyles.MAX_SIZE_COLS, type=int)
+        AppStyles.MAX_PANEL_QTY = app_settings.value(
+            'settings/max_panel_qty', AppStyles.MAX_PANEL_QTY, type=int)
+        AppStyles.MAX_SEWING_AREA = app_settings.value(
+            'settings/max_sewing_area', AppStyles.MAX_SEWING_AREA, type=int)
 
         # Re-create BASE_FONT as it depends on ROW_COLUMN_COUNT_SIZE
         AppStyles.BASE_FONT = QFont(
@@ -1108,6 +1508,9 @@ class DownAllocationApp(QMainWindow):
             QFont("Courier New", AppStyles.INPUT_FIELDS_FONT_SIZE))
         self.adjust_table_section.col_input.setStyleSheet(
             AppStyles.LINE_EDIT_STYLE)
+        self.adjust_table_section.row_input.validator().setTop(AppStyles.MAX_PANEL_ROWS)
+        self.adjust_table_section.col_input.validator().setTop(AppStyles.MAX_SIZE_COLS)
+        self.top_table_section.filter_bar.set_max_qty(AppStyles.MAX_PANEL_QTY)
 
         # Tables (Top and Bottom)
         self.top_table_section.setStyleSheet(f"""
@@ -1141,14 +1544,11 @@ class DownAllocationApp(QMainWindow):
             }}
         """)
 
-        # To force tables to re-render with new column widths and row heights:
-        # Save current table data, re-setup structure, then restore data.
-        top_table_data = self.top_table_section.save_table_content()
-        current_data_rows = self.top_table_section.table.rowCount() - 3
-        current_total_cols = self.top_table_section.table.columnCount()
-        self.top_table_section.setup_table_content(
-            current_data_rows, current_total_cols)
-        self.top_table_section.restore_table_content(top_table_data)
+        # Re-apply widths and header fonts in place; data cell fonts and hint
+        # text are painted by the delegates on the next repaint
+        self.top_table_section.apply_column_widths()
+        self.top_table_section.apply_header_fonts()
+        self.top_table_section.table.viewport().update()
 
         # TopInputSection elements
         self.top_input_section.date_input.setFixedHeight(
@@ -3,4 +3,4 @@
 
 # You can optionally list submodules to be imported when 'from ui.menu_bar import *' is used
 # For explicit imports, this is not strictly necessary.
-# __all__ = ['file_menu', 'edit_menu', 'view_menu', 'help_menu', 'app_menu_bar']
\ No newline at end of file
+# __all__ = ['file_menu', 'edit_menu', 'view_menu', 'tools_menu', 'help_menu', 'app_menu_bar']
\ No newline at end of file
@@ -6,11 +6,14 @@ from PyQt6.QtCore import pyqtSignal
 from ui.menu_bar.file_menu import FileMenu
 from ui.menu_bar.edit_menu import EditMenu
 from ui.menu_bar.view_menu import ViewMenu # Assuming you want a View menu
+from ui.menu_bar.tools_menu import ToolsMenu
 from ui.menu_bar.help_menu import HelpMenu
 
 class AppMenuBar(QMenuBar):
     # Consolidate all signals from individual menus here
     new_requested = pyqtSignal()
+    new_tab_requested = pyqtSignal()
+    close_tab_requested = pyqtSignal()
     open_requested = pyqtSignal()
     save_requested = pyqtSignal()
     save_as_requested = pyqtSignal()
@@ -18,11 +21,21 @@ class AppMenuBar(QMenuBar):
     export_pdf_requested = pyqtSignal()
     exit_requested = pyqtSignal()
     factory_edit_requested = pyqtSignal()
+    find_panels_requested = pyqtSignal()
     toggle_factory_info_requested = pyqtSignal(bool)
     toggle_bottom_table_requested = pyqtSignal(bool)
+    toggle_validation_dock_requested = pyqtSignal(bool)
     help_requested = pyqtSignal()
     about_requested = pyqtSignal()
     settings_requested = pyqtSignal() # Re-adding this signal as it was in main_window.py's menu bar
+    scenario_sweep_requested = pyqtSignal()
+    grading_requested = pyqtSignal()
+    cad_import_requested = pyqtSignal()
+    panel_import_requested = pyqtSignal()
+    report_import_requested = pyqtSignal()
+    compare_requested = pyqtSignal()
+    season_analytics_requested = pyqtSignal()
+    templates_requested = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -36,11 +49,13 @@ class AppMenuBar(QMenuBar):
         self.file_menu = FileMenu(self)
         self.edit_menu = EditMenu(self)
         self.view_menu = ViewMenu(self)
+        self.tools_menu = ToolsMenu(self)
         self.help_menu = HelpMenu(self)
 
         self.addMenu(self.file_menu)
         self.addMenu(self.edit_menu)
         self.addMenu(self.view_menu)
+        self.addMenu(self.tools_menu)
         # Re-introducing a placeholder for System Setup/Settings menu
         # This can be made a separate class if it becomes complex
         self.settings_menu = self.addMenu("&System Setup")
@@ -54,6 +69,8 @@ class AppMenuBar(QMenuBar):
     def _connect_menu_signals(self):
         """Connects signals from individual menu classes to AppMenuBar's own signals."""
         self.file_menu.new_requested.connect(self.new_requested.emit)
+        self.file_menu.new_tab_requested.connect(self.new_tab_requested.emit)
+        self.file_menu.close_tab_requested.connect(self.close_tab_requested.emit)
         self.file_menu.open_requested.connect(self.open_requested.emit)
         self.file_menu.save_requested.connect(self.save_requested.emit)
         self.file_menu.save_as_requested.connect(self.save_as_requested.emit)
@@ -62,9 +79,20 @@ class AppMenuBar(QMenuBar):
         self.file_menu.exit_requested.connect(self.exit_requested.emit)
 
         self.edit_menu.factory_edit_requested.connect(self.factory_edit_requested.emit)
+        self.edit_menu.find_panels_requested.connect(self.find_panels_requested.emit)
 
         self.view_menu.toggle_factory_info_requested.connect(self.toggle_factory_info_requested.emit)
         self.view_menu.toggle_bottom_table_requested.connect(self.toggle_bottom_table_requested.emit)
+        self.view_menu.toggle_validation_dock_requested.connect(self.toggle_validation_dock_requested.emit)
+
+        self.tools_menu.scenario_sweep_requested.connect(self.scenario_sweep_requested.emit)
+        self.tools_menu.grading_requested.connect(self.grading_requested.emit)
+        self.tools_menu.cad_import_requested.connect(self.cad_import_requested.emit)
+        self.tools_menu.panel_import_requested.connect(self.panel_import_requested.emit)
+        self.tools_menu.report_import_requested.connect(self.report_import_requested.emit)
+        self.tools_menu.compare_requested.connect(self.compare_requested.emit)
+        self.tools_menu.season_analytics_requested.connect(self.season_analytics_requested.emit)
+        self.tools_menu.templates_requested.connect(self.templates_requested.emit)
 
         self.help_menu.help_requested.connect(self.help_requested.emit)
         self.help_menu.about_requested.connect(self.about_requested.emit)
@@ -74,6 +102,9 @@ class AppMenuBar(QMenuBar):
         self.view_menu.toggle_factory_info_action.setChecked(factory_info_checked)
         self.view_menu.toggle_bottom_table_action.setChecked(bottom_table_checked)
 
+    def set_validation_dock_checked(self, checked: bool):
+        self.view_menu.toggle_validation_dock_action.setChecked(checked)
+
     # Methods to enable/disable specific actions, to be called from main_window
     def set_new_action_enabled(self, enabled: bool):
         """Enables or disables the 'New' action in the File menu."""
@@ -98,3 +129,7 @@ class AppMenuBar(QMenuBar):
     def set_open_action_enabled(self, enabled: bool):
         """Enables or disables the 'Open' action in the File menu."""
         self.file_menu.set_open_action_enabled(enabled)
+
+    def set_scenario_sweep_action_enabled(self, enabled: bool):
+        """Enables or disables the 'Scenario Sweep' action in the Tools menu."""
+        self.tools_menu.set_scenario_sweep_action_enabled(enabled)
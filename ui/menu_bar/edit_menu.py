@@ -7,6 +7,7 @@ from PyQt6.QtCore import Qt, pyqtSignal
 class EditMenu(QMenu):
     # Define signals for each menu action that the main window will connect to
     factory_edit_requested = pyqtSignal()
+    find_panels_requested = pyqtSignal()
     # Add signals for undo/redo/cut/copy/paste if those actions are handled here
     # For now, based on main_window.py, only factory_edit is an explicit menu action.
 
@@ -25,6 +26,13 @@ class EditMenu(QMenu):
         self.edit_factory_action.triggered.connect(self.factory_edit_requested.emit)
         self.addAction(self.edit_factory_action)
 
+        # Find Panels Action: focuses the filter bar above the panel table
+        self.find_panels_action = QAction("Find Panels...", self)
+        self.find_panels_action.setShortcut("Ctrl+F")
+        self.find_panels_action.setStatusTip("Filters the panel table by name, missing areas or quantity")
+        self.find_panels_action.triggered.connect(self.find_panels_requested.emit)
+        self.addAction(self.find_panels_action)
+
         # In main_window.py, there are also mentions of Ctrl+Z/Y for undo/redo
         # and Ctrl+C/V for copy/paste, which are typically handled at the TableWidget level.
         # If specific menu actions are desired for these, they would be added here.
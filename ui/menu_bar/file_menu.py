@@ -8,6 +8,8 @@ from PyQt6.QtCore import Qt, pyqtSignal
 class FileMenu(QMenu):
     # Define signals for each menu action that the main window will connect to
     new_requested = pyqtSignal()
+    new_tab_requested = pyqtSignal()
+    close_tab_requested = pyqtSignal()
     open_requested = pyqtSignal()
     save_requested = pyqtSignal()
     save_as_requested = pyqtSignal()
@@ -37,6 +39,20 @@ class FileMenu(QMenu):
         self.new_action.triggered.connect(self.new_requested.emit)
         self.addAction(self.new_action)
 
+        # New Tab Action
+        self.new_tab_action = QAction("New Tab", self)
+        self.new_tab_action.setShortcut("Ctrl+T")
+        self.new_tab_action.setStatusTip("Open an empty project in a new tab")
+        self.new_tab_action.triggered.connect(self.new_tab_requested.emit)
+        self.addAction(self.new_tab_action)
+
+        # Close Tab Action
+        self.close_tab_action = QAction("Close Tab", self)
+        self.close_tab_action.setShortcut("Ctrl+W")
+        self.close_tab_action.setStatusTip("Close the current project tab")
+        self.close_tab_action.triggered.connect(self.close_tab_requested.emit)
+        self.addAction(self.close_tab_action)
+
         # Open Action
         self.open_action = QAction("Open...", self)
         self.open_action.setShortcut("Ctrl+O")
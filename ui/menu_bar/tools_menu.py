@@ -0,0 +1,82 @@
+# down_allocation_app/ui/menu_bar/tools_menu.py
+
+from PyQt6.QtWidgets import QMenu
+from PyQt6.QtGui import QAction
+from PyQt6.QtCore import Qt, pyqtSignal
+
+class ToolsMenu(QMenu):
+    # Signals for analysis tools working on the current document
+    scenario_sweep_requested = pyqtSignal()
+    grading_requested = pyqtSignal()
+    cad_import_requested = pyqtSignal()
+    panel_import_requested = pyqtSignal()
+    templates_requested = pyqtSignal()
+    report_import_requested = pyqtSignal()
+    compare_requested = pyqtSignal()
+    season_analytics_requested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__("&Tools", parent)
+        self._create_actions()
+
+    def _create_actions(self):
+        """Creates the QActions for the Tools menu."""
+
+        # Scenario Sweep Action
+        self.scenario_sweep_action = QAction("Scenario Sweep...", self)
+        self.scenario_sweep_action.setShortcut("Ctrl+Shift+W")
+        self.scenario_sweep_action.setStatusTip("Compares allocations over several ecodown weights and base sizes")
+        self.scenario_sweep_action.triggered.connect(self.scenario_sweep_requested.emit)
+        self.addAction(self.scenario_sweep_action)
+
+        # Size Grading Action
+        self.grading_action = QAction("Size Grading...", self)
+        self.grading_action.setShortcut("Ctrl+Shift+G")
+        self.grading_action.setStatusTip("Generates size areas from the base size using per-panel grade rules")
+        self.grading_action.triggered.connect(self.grading_requested.emit)
+        self.addAction(self.grading_action)
+
+        # Compare Projects Action
+        self.compare_action = QAction("Compare Projects...", self)
+        self.compare_action.setStatusTip("Shows what changed between two versions of a project")
+        self.compare_action.triggered.connect(self.compare_requested.emit)
+        self.addAction(self.compare_action)
+
+        # Season Analytics Action
+        self.season_analytics_action = QAction("Season Analytics...", self)
+        self.season_analytics_action.setStatusTip("Totals the down required per season, buyer, stage and size over many projects")
+        self.season_analytics_action.triggered.connect(self.season_analytics_requested.emit)
+        self.addAction(self.season_analytics_action)
+
+        self.addSeparator()
+
+        # CAD Import Action
+        self.cad_import_action = QAction("Import CAD Pattern Areas...", self)
+        self.cad_import_action.setStatusTip("Computes panel sewing areas from a DXF or polygon CSV pattern export")
+        self.cad_import_action.triggered.connect(self.cad_import_requested.emit)
+        self.addAction(self.cad_import_action)
+
+        # Panel Sheet Import Action
+        self.panel_import_action = QAction("Import Panel Sheet...", self)
+        self.panel_import_action.setShortcut("Ctrl+Shift+I")
+        self.panel_import_action.setStatusTip("Loads panel names, quantities and sewing areas from an Excel or CSV sheet")
+        self.panel_import_action.triggered.connect(self.panel_import_requested.emit)
+        self.addAction(self.panel_import_action)
+
+        # Panel Templates Action
+        self.templates_action = QAction("Panel Templates...", self)
+        self.templates_action.setShortcut("Ctrl+Shift+T")
+        self.templates_action.setStatusTip("Inserts a saved panel set (e.g. jacket body, hood) or saves the current panels as one")
+        self.templates_action.triggered.connect(self.templates_requested.emit)
+        self.addAction(self.templates_action)
+
+        self.addSeparator()
+
+        # Report Import Action
+        self.report_import_action = QAction("Rebuild Projects from Reports...", self)
+        self.report_import_action.setStatusTip("Rebuilds .dax projects from a folder of exported Excel reports")
+        self.report_import_action.triggered.connect(self.report_import_requested.emit)
+        self.addAction(self.report_import_action)
+
+    def set_scenario_sweep_action_enabled(self, enabled: bool):
+        self.scenario_sweep_action.setEnabled(enabled)
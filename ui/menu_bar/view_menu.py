@@ -8,6 +8,7 @@ class ViewMenu(QMenu):
     # Signals for toggling visibility of UI sections
     toggle_factory_info_requested = pyqtSignal(bool)
     toggle_bottom_table_requested = pyqtSignal(bool)
+    toggle_validation_dock_requested = pyqtSignal(bool)
 
     def __init__(self, parent=None):
         super().__init__("&View", parent)
@@ -29,3 +30,10 @@ class ViewMenu(QMenu):
         self.toggle_bottom_table_action.setChecked(True) # Default state from main_window.py
         self.toggle_bottom_table_action.triggered.connect(self.toggle_bottom_table_requested.emit)
         self.addAction(self.toggle_bottom_table_action)
+
+        # Validation Issues Dock Toggle Action
+        self.toggle_validation_dock_action = QAction("Validation Issues", self, checkable=True)
+        self.toggle_validation_dock_action.setStatusTip("Toggles the list of problems found in the panel table")
+        self.toggle_validation_dock_action.setChecked(True)
+        self.toggle_validation_dock_action.triggered.connect(self.toggle_validation_dock_requested.emit)
+        self.addAction(self.toggle_validation_dock_action)
@@ -42,7 +42,7 @@ class AdjustTableSection(QFrame):
         panel_group_layout.addWidget(panel_label)
 
         self.row_input = QLineEdit(str(AppStyles.DEFAULT_DATA_ROWS))
-        self.row_input.setValidator(QIntValidator(1, 100))
+        self.row_input.setValidator(QIntValidator(1, AppStyles.MAX_PANEL_ROWS))
         self.row_input.setFixedWidth(100) # Increased width to prevent cropping
         self.row_input.setFixedHeight(30) # Set fixed height to match buttons
         self.row_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -66,7 +66,7 @@ class AdjustTableSection(QFrame):
         size_group_layout.addWidget(col_label)
 
         self.col_input = QLineEdit(str(AppStyles.DEFAULT_COLS - 2)) # -2 for fixed cols
-        self.col_input.setValidator(QIntValidator(1, 50))
+        self.col_input.setValidator(QIntValidator(1, AppStyles.MAX_SIZE_COLS))
         self.col_input.setFixedWidth(100) # Increased width to prevent cropping
         self.col_input.setFixedHeight(30) # Set fixed height to match buttons
         self.col_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
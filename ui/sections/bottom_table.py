@@ -6,14 +6,66 @@ from PyQt6.QtGui import QFont, QColor
 from PyQt6.QtCore import Qt
 import sys  # For getattr(sys, 'frozen', False)
 from ui.widgets.table_widget import TableWidget  # Assuming this path
+from ui.sections.table_delegate import BaseSizeColumnDelegate
 # Assuming styles.py is in the parent directory or accessible
 from styles import AppStyles
 
 
+def allocation_table_rows(result):
+    """
+    Bottom table layout for an AllocationResult, independent of any widget.
+    Returns a list of (hidden, cells) per table row; each cell is
+    (col, text, row_span, col_span, bold). Used by the Excel export so it can
+    be written straight from the engine, whether or not the table is shown.
+    """
+    num_size_cols = len(result.sizes)
+    rows = [
+        (False, [(0, "PANEL NAME", 2, 1, True), (1, "PANEL QTY", 2, 1, True),
+                 (2, "WEIGHT", 2, 1, True),
+                 (3, "SIZE || WEIGHT DISTRIBUTION", 1, max(num_size_cols, 1), True)]),
+        (False, [(col + 3, size_name, 1, 1, False) for col, size_name in enumerate(result.sizes)]),
+    ]
+
+    down_rows = result.down.tolist()
+    garment_rows = result.garment.tolist()
+    for panel_idx, panel_name in enumerate(result.names):
+        panel_qty = int(result.qty[panel_idx])
+        down_cells = [(0, panel_name, 2, 1, False),
+                      (1, f"1X{panel_qty}" if panel_qty > 0 else "", 2, 1, False),
+                      (2, "DOWN WEIGHT", 1, 1, True)]
+        down_cells.extend((col + 3, f"{value:.2f}" if value != 0 else "", 1, 1, False)
+                          for col, value in enumerate(down_rows[panel_idx]))
+        garment_cells = [(2, "GARMENTS WEIGHT", 1, 1, True)]
+        if result.show_garment:
+            garment_cells.extend((col + 3, f"{value:.2f}" if value != 0 else "", 1, 1, False)
+                                 for col, value in enumerate(garment_rows[panel_idx]))
+        rows.append((False, down_cells))
+        rows.append((not result.show_garment, garment_cells))
+
+    # Totals: displayed (rounded) per-panel weight x quantity, rounded to whole grams
+    down_totals = [(0, "TOTAL DOWN WEIGHT", 1, 3, True)]
+    down_totals.extend((col + 3, f"{round(value):.0f}", 1, 1, True)
+                       for col, value in enumerate(result.down_totals.tolist()))
+    rows.append((False, down_totals))
+    if result.show_garment:
+        garment_totals = [(0, "TOTAL GARMENT WEIGHT", 1, 3, True)]
+        garment_totals.extend((col + 3, f"{round(value):.0f}", 1, 1, True)
+                              for col, value in enumerate(result.garment_totals.tolist()))
+        rows.append((False, garment_totals))
+    else:
+        rows.append((True, []))
+    return rows
+
+
 class BottomTableSection(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_window = parent
+        # Size name (upper case) -> bottom table column index, refreshed by update_table_data
+        self.size_columns = {}
+        # Latest allocation; the widget cells are only written while the table is on screen
+        self.result = None
+        self._stale = False
         self.setSizePolicy(QSizePolicy.Policy.Expanding,
                            QSizePolicy.Policy.Expanding)  # Corrected usage
         self.setup_ui()
@@ -30,6 +82,8 @@ class BottomTableSection(QFrame):
         self.table.horizontalHeader().setVisible(False)
         self.table.setEditTriggers(
             TableWidget.EditTrigger.NoEditTriggers)  # Make non-editable
+        # Base size column is rendered bold/blue by the delegate
+        self.table.setItemDelegate(BaseSizeColumnDelegate(self.table))
 
         self.table.setStyleSheet(f"""
             QTableWidget {{
@@ -49,6 +103,9 @@ class BottomTableSection(QFrame):
 
         layout.addWidget(self.table)
 
+        # Hide in production (PyInstaller); the table is then never populated
+        self.table.setVisible(not getattr(sys, 'frozen', False))
+
     def setup_table_content(self, data_rows, top_table_cols):
         """
         Sets up the structure of the bottom table based on top table dimensions.
@@ -138,38 +195,45 @@ class BottomTableSection(QFrame):
                     item.setForeground(QColor(Qt.GlobalColor.black))
                     self.table.setItem(r, c, item)
 
-        # Hide in production (PyInstaller)
-        if getattr(sys, 'frozen', False):
-            self.table.setVisible(False)
-        else:
-            self.table.setVisible(True)
-
-    def update_table_data(self, top_table_data, input_data):
+    def update_table_data(self, result):
         """
-        Updates the bottom table based on top table data and input fields.
-        :param top_table_data: Dictionary from TopTableSection.get_table_data_for_calculation()
-        :param input_data: Dictionary from TopInputSection.get_input_data()
+        Takes a new computed allocation. The widget cells are only rewritten when
+        the table is actually on screen; otherwise that is deferred to showEvent.
+        :param result: AllocationResult from core.allocation_engine.compute_allocation()
         """
+        self.result = result
+        self.size_columns = {}
+        for col_idx, size_name in enumerate(result.sizes):
+            if size_name.strip():
+                # +3 for first three fixed columns
+                self.size_columns.setdefault(size_name.strip().upper(), col_idx + 3)
+
+        if self.table.isVisible():
+            self._populate_table(result)
+        else:
+            self._stale = True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Children are shown before the parent's showEvent, so table visibility is final here
+        if self._stale and self.table.isVisible():
+            self._populate_table(self.result)
+
+    def _populate_table(self, result):
+        self._stale = False
         self.table.blockSignals(True)
         try:
-            num_data_rows = len(top_table_data['panels'])
-            num_size_cols = len(top_table_data['sizes'])
-
-            # Recalculate row/column count needed for bottom table
-            # 2 headers + 2 rows per panel + 2 total rows
-            new_total_rows = 2 + (2 * num_data_rows) + 2
-            # Convert back to top_table style for setup_table_content
-            new_top_table_cols_for_bottom = num_size_cols + 2
+            num_data_rows = len(result.names)
+            num_size_cols = len(result.sizes)
 
             # Always call setup_table_content to ensure structure matches
-            self.setup_table_content(
-                num_data_rows, new_top_table_cols_for_bottom)
+            # (top table style column count: sizes + Panel Name + Qty)
+            self.setup_table_content(num_data_rows, num_size_cols + 2)
 
             # Update size headers in row 1
-            for col_idx, size_name in enumerate(top_table_data['sizes']):
+            for col_idx, size_name in enumerate(result.sizes):
                 # +3 for first three fixed columns
-                header_item = self.table.item(1, col_idx + 3)
-                header_item.setText(size_name)
+                self.table.item(1, col_idx + 3).setText(size_name)
 
             # Clear any extra size headers if columns reduced
             for col_idx in range(num_size_cols + 3, self.table.columnCount()):
@@ -177,151 +241,67 @@ class BottomTableSection(QFrame):
                 if header_item:
                     header_item.setText("")
 
-            ecodown_weight = float(input_data.get(
-                'ecodown_weight', '0') or '0')
-            garment_weight = float(input_data.get(
-                'garment_weight', '0') or '0')
-            base_size = input_data.get('base_size', '').strip()
-
-            # Find base size column in top table data structure
-            base_col_idx = -1
-            if base_size:
-                try:
-                    base_col_idx = top_table_data['sizes'].index(base_size)
-                except ValueError:
-                    pass  # Base size not found in current sizes
-
-            # Calculate total_base_area
-            total_base_area = 0.0
-            if base_col_idx != -1:  # Only calculate if base size is found
-                for panel_entry in top_table_data['panels']:
-                    panel_qty = panel_entry['qty']
-                    # Ensure index is valid
-                    if base_col_idx < len(panel_entry['areas']):
-                        base_area_for_panel_qty_total = panel_qty * \
-                            panel_entry['areas'][base_col_idx]
-                        total_base_area += base_area_for_panel_qty_total
-
-            # Clear previous highlights and content from data rows and totals
+            # Clear previous content from data rows and totals
             self.clear_data_rows()
             self.clear_totals()
 
+            data_font = QFont("Courier New", AppStyles.TABLE_TEXT_SIZE)
+            label_font = QFont(
+                "Courier New", AppStyles.TABLE_TEXT_SIZE, QFont.Weight.Bold)
+            # Weights are already rounded by the engine; format them in one pass
+            down_rows = result.down.tolist()
+            garment_rows = result.garment.tolist()
+
             # Update each panel's data
             current_bottom_data_row = 2
-            for panel_entry in top_table_data['panels']:
-                panel_name = panel_entry['name']
-                panel_qty = panel_entry['qty']
-                panel_areas = panel_entry['areas']
+            for panel_idx, panel_name in enumerate(result.names):
+                panel_qty = int(result.qty[panel_idx])
 
                 # Set panel name (merged across 2 rows)
                 name_cell = self.table.item(current_bottom_data_row, 0)
                 name_cell.setText(panel_name)
                 self.table.setSpan(current_bottom_data_row, 0, 2, 1)
-                # Removed bold for data cells in first 3 columns, consistent with top table data - Issue 2 fix
-                # Consistent font
-                name_cell.setFont(
-                    QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
-                name_cell.setForeground(
-                    QColor(Qt.GlobalColor.black))  # Ensure black text
+                name_cell.setFont(data_font)
 
                 # Set panel quantity with "1X" prefix
                 qty_cell = self.table.item(current_bottom_data_row, 1)
                 qty_cell.setText(f"1X{panel_qty}" if panel_qty > 0 else "")
                 self.table.setSpan(current_bottom_data_row, 1, 2, 1)
-                # Removed bold for data cells in first 3 columns - Issue 2 fix
-                # Consistent font
-                qty_cell.setFont(
-                    QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
-                qty_cell.setForeground(
-                    QColor(Qt.GlobalColor.black))  # Ensure black text
+                qty_cell.setFont(data_font)
 
                 # Set weight labels explicitly - these should remain bold
                 down_label_cell = self.table.item(current_bottom_data_row, 2)
                 down_label_cell.setText("DOWN WEIGHT")
-                down_label_cell.setFont(QFont(
-                    "Courier New", AppStyles.TABLE_TEXT_SIZE, QFont.Weight.Bold))  # Apply font and bold
-                down_label_cell.setForeground(
-                    QColor(Qt.GlobalColor.black))  # Ensure black text
+                down_label_cell.setFont(label_font)
 
                 garment_label_cell = self.table.item(
                     current_bottom_data_row + 1, 2)
                 garment_label_cell.setText("GARMENTS WEIGHT")
-                garment_label_cell.setFont(QFont(
-                    "Courier New", AppStyles.TABLE_TEXT_SIZE, QFont.Weight.Bold))  # Apply font and bold
-                garment_label_cell.setForeground(
-                    QColor(Qt.GlobalColor.black))  # Ensure black text
+                garment_label_cell.setFont(label_font)
 
                 self.table.setRowHidden(current_bottom_data_row, False)
                 self.table.setRowHidden(
-                    current_bottom_data_row + 1, garment_weight <= 0)
+                    current_bottom_data_row + 1, not result.show_garment)
 
-                # Calculate and set weights for each size
-                for col_offset, size_area in enumerate(panel_areas):
+                # Set weights for each size
+                for col_offset, down_weight_val in enumerate(down_rows[panel_idx]):
                     current_col = col_offset + 3  # Adjust for first 3 fixed columns
 
-                    sewing_area_total_for_size = panel_qty * size_area
-
-                    down_weight_val = 0.0
-                    garment_weight_val = 0.0
-
-                    if total_base_area > 0 and base_col_idx != -1:
-                        # Calculation logic for down_weight_val and garment_weight_val
-                        # based on total_base_area
-                        down_weight_val = (
-                            ecodown_weight / total_base_area) * sewing_area_total_for_size
-                        garment_weight_val = (
-                            garment_weight / total_base_area) * sewing_area_total_for_size
-
-                        if panel_qty > 0:  # Ensure no division by zero for per panel values
-                            down_weight_val /= panel_qty
-                            garment_weight_val /= panel_qty
-                        else:
-                            down_weight_val = 0.0
-                            garment_weight_val = 0.0
-
                     # Down weight row
                     down_cell = self.table.item(
                         current_bottom_data_row, current_col)
                     down_cell.setText(
                         f"{down_weight_val:.2f}" if down_weight_val != 0 else "")
-                    # Apply font size
-                    down_cell.setFont(
-                        QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
 
                     # Garment weight row
                     garment_cell = self.table.item(
                         current_bottom_data_row + 1, current_col)
-                    if garment_weight > 0:
+                    garment_weight_val = garment_rows[panel_idx][col_offset]
+                    if result.show_garment:
                         garment_cell.setText(
                             f"{garment_weight_val:.2f}" if garment_weight_val != 0 else "")
                     else:
                         garment_cell.setText("")
-                    garment_cell.setFont(
-                        QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))  # Apply font size
-
-                    # Apply bold and blue highlight to this column in bottom_table only
-                    if base_col_idx != -1 and col_offset == base_col_idx:
-                        font = down_cell.font()
-                        font.setBold(True)
-                        down_cell.setFont(font)
-                        down_cell.setForeground(QColor(0, 0, 255))  # Blue
-                        if garment_cell:
-                            g_font = garment_cell.font()
-                            g_font.setBold(True)
-                            garment_cell.setFont(g_font)
-                            garment_cell.setForeground(QColor(0, 0, 255))
-                    else:  # Ensure other columns are not bold/blue and are black
-                        font = down_cell.font()
-                        font.setBold(False)
-                        down_cell.setFont(font)
-                        down_cell.setForeground(
-                            QColor(0, 0, 0))  # Ensure black text
-                        if garment_cell:
-                            g_font = garment_cell.font()
-                            g_font.setBold(False)
-                            garment_cell.setFont(g_font)
-                            garment_cell.setForeground(
-                                QColor(0, 0, 0))  # Ensure black text
 
                 current_bottom_data_row += 2  # Move to the next pair of rows for the next panel
 
@@ -341,51 +321,20 @@ class BottomTableSection(QFrame):
                 self.table.setColumnWidth(2, min_width)
 
             # Update totals
-            self.update_bottom_totals(
-                top_table_data['panels'], garment_weight > 0)
+            self.update_bottom_totals(result)
+            self.table.set_base_size_column(
+                result.base_col + 3 if result.base_col != -1 else -1)
         finally:
             self.table.blockSignals(False)
             self.table.viewport().update()
 
-    def update_bottom_totals(self, panels_data, show_garments_total):
+    def update_bottom_totals(self, result):
         total_cols = self.table.columnCount()
+        show_garments_total = result.show_garment
 
-        down_totals = [0.0] * (total_cols - 3)
-        garment_totals = [0.0] * (total_cols - 3)
-
-        # Sum from the actual cells in the bottom table to ensure consistency with what's displayed
-        for row in range(2, self.table.rowCount() - 2, 2):  # Iterate over 'DOWN WEIGHT' rows
-            if self.table.isRowHidden(row):  # Skip hidden panel rows
-                continue
-
-            qty_text = self.table.item(row, 1).text(
-            ) if self.table.item(row, 1) else ""
-            try:
-                # Extract quantity (e.g., from "1X5" extract 5)
-                qty = int(qty_text.replace("1X", "")) if qty_text.startswith(
-                    "1X") and qty_text[2:].isdigit() else 1
-            except ValueError:
-                qty = 1  # Default to 1 if parsing fails
-
-            for i, col in enumerate(range(3, total_cols)):
-                down_cell = self.table.item(row, col)
-                if down_cell and down_cell.text():
-                    try:
-                        # Sum the displayed per-panel down weight, then multiply by actual panel quantity
-                        down_totals[i] += float(down_cell.text()) * qty
-                    except ValueError:
-                        pass
-
-                garment_row = row + 1
-                # Only sum if garment row is visible
-                if not self.table.isRowHidden(garment_row):
-                    garment_cell = self.table.item(garment_row, col)
-                    if garment_cell and garment_cell.text():
-                        try:
-                            garment_totals[i] += float(
-                                garment_cell.text()) * qty
-                        except ValueError:
-                            pass
+        # Totals come from the engine: displayed (rounded) per-panel weight x quantity
+        down_totals = result.down_totals.tolist()
+        garment_totals = result.garment_totals.tolist()
 
         # TOTAL DOWN WEIGHT row
         total_down_row_idx = self.table.rowCount() - 2
@@ -455,40 +404,9 @@ class BottomTableSection(QFrame):
                         QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
 
     def highlight_base_size(self, base_size):
-        # Block signals during highlight operations
-        self.table.blockSignals(True)
-        try:
-            # Clear previous highlights in bottom_table only
-            for row in range(self.table.rowCount()):
-                for col in range(3, self.table.columnCount()):  # Skip first 3 cols
-                    item = self.table.item(row, col)
-                    if item:
-                        # Or default background
-                        item.setBackground(QColor(Qt.GlobalColor.white))
-                        # Ensure font and color are reset to default unless it's the highlighted column
-                        font = item.font()
-                        font.setBold(False)
-                        item.setFont(font)
-                        # Ensure black text
-                        item.setForeground(QColor(Qt.GlobalColor.black))
-
-            if base_size and str(base_size).strip():
-                size_upper = str(base_size).strip().upper()
-                for col in range(3, self.table.columnCount()):
-                    header_item = self.table.item(1, col)
-                    if header_item and header_item.text().strip().upper() == size_upper:
-                        # Apply bold + blue to entire column
-                        # Start from data rows
-                        for row_idx in range(2, self.table.rowCount()):
-                            item = self.table.item(row_idx, col)
-                            if item:
-                                font = item.font()
-                                font.setBold(True)
-                                item.setFont(font)
-                                item.setForeground(QColor(0, 0, 255))  # Blue
-                        break  # Stop after finding the column
-        finally:
-            self.table.blockSignals(False)  # Unblock signals
+        """Moves the bold/blue base size column (painted by the delegate)."""
+        col = self.size_columns.get(str(base_size).strip().upper(), -1) if base_size else -1
+        self.table.set_base_size_column(col)
 
     def clear_data_rows(self):
         """Clears content of data rows in bottom table, keeping structure."""
@@ -1,15 +1,57 @@
 # down_allocation_app/ui/sections/table_delegate.py
 
-from PyQt6.QtWidgets import QStyledItemDelegate, QTableWidgetItem
-from PyQt6.QtGui import QFont, QDoubleValidator, QIntValidator, QKeyEvent, QPalette, QColor
-from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtWidgets import QStyledItemDelegate, QTableWidgetItem, QStyle, QCompleter
+from PyQt6.QtGui import QFont, QDoubleValidator, QIntValidator, QKeyEvent, QPalette, QColor, QBrush
+from PyQt6.QtCore import Qt, QEvent, QStringListModel
 from styles import AppStyles # Assuming styles.py is in the parent directory or accessible
 from ui.utils.upper_case_line_edit import UpperCaseLineEdit # Assuming this path
 
+_cell_font_cache = {}
+
+
+def _cell_font():
+    """Data cell font; cells without an item (or without a font set) fall back to it."""
+    size = AppStyles.TABLE_TEXT_SIZE
+    font = _cell_font_cache.get(size)
+    if font is None:
+        font = _cell_font_cache[size] = QFont("Courier New", size)
+    return font
+
+
+_WHITE_BRUSH = QBrush(QColor(Qt.GlobalColor.white))
+_BASE_SIZE_BRUSH = QBrush(AppStyles.BASE_SIZE_HIGHLIGHT_COLOR)
+# Hint text for empty data cells by column (0 is the name column's own delegate)
+_DATA_HINTS = {1: "0"}
+_AREA_HINT = "0.00"
+_size_hints = []
+
+
+def _size_hint(col):
+    """Cached "SIZE n" hint for size header column `col` (table coordinates)."""
+    while len(_size_hints) <= col:
+        _size_hints.append(f"SIZE {len(_size_hints) - 1}")
+    return _size_hints[col]
+
 
 class TableItemDelegate(QStyledItemDelegate):
+    """
+    Shared delegate for every top table column except the panel name column.
+    One instance is installed with setItemDelegate(); per-column instances are
+    not needed since behaviour only depends on the cell position.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._hint_palette = None
+        self._hint_palette_key = None
+
+    def _hint_palette_for(self, palette):
+        # Rebuilt only when the widget palette changes (e.g. style sheet reapplied)
+        if self._hint_palette_key != palette.cacheKey():
+            self._hint_palette_key = palette.cacheKey()
+            self._hint_palette = QPalette(palette)
+            self._hint_palette.setColor(QPalette.ColorRole.Text, AppStyles.TABLE_HINT_TEXT_COLOR)
+        return self._hint_palette
 
     def createEditor(self, parent, option, index):
         # Don't create editor for main header row (0) or total row
@@ -23,11 +65,11 @@ class TableItemDelegate(QStyledItemDelegate):
         if index.row() >= 2 and index.row() < self.parent().rowCount() - 1:
             editor = super().createEditor(parent, option, index)
             # Set validation based on column
-            if index.column() == 1:  # Panel Quantity column (1-9)
-                validator = QIntValidator(1, 9, parent)
+            if index.column() == 1:  # Panel Quantity column (1..MAX_PANEL_QTY)
+                validator = QIntValidator(1, AppStyles.MAX_PANEL_QTY, parent)
                 editor.setValidator(validator)
             elif index.column() >= 2:  # Sewing area columns
-                validator = QDoubleValidator(0, 9999, 2, parent)
+                validator = QDoubleValidator(0, AppStyles.MAX_SEWING_AREA, 2, parent)
                 validator.setNotation(QDoubleValidator.Notation.StandardNotation)
                 editor.setValidator(validator)
             return editor
@@ -45,34 +87,112 @@ class TableItemDelegate(QStyledItemDelegate):
                 return True
         return super().eventFilter(editor, event)
 
+    def paint(self, painter, option, index):
+        # Fast path: empty, unselected data cells (no item yet) are just a
+        # background and a fixed hint string, so skip the style machinery
+        row = index.row()
+        table = self.parent()
+        if (2 <= row < table.rowCount() - 1
+                and not option.state & (QStyle.StateFlag.State_Selected | QStyle.StateFlag.State_HasFocus)
+                and not index.data(Qt.ItemDataRole.DisplayRole)):
+            col = index.column()
+            painter.fillRect(option.rect, _BASE_SIZE_BRUSH if col == table.base_size_column else _WHITE_BRUSH)
+            painter.setFont(_cell_font())
+            painter.setPen(AppStyles.TABLE_HINT_TEXT_COLOR)
+            painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, _DATA_HINTS.get(col, _AREA_HINT))
+            return
+        super().paint(painter, option, index)
+
     def initStyleOption(self, option, index):
         super().initStyleOption(option, index)
         # Set text alignment to center for all cells
         option.displayAlignment = Qt.AlignmentFlag.AlignCenter
+        if index.data(Qt.ItemDataRole.FontRole) is None:
+            option.font = _cell_font()
+        # Base size column is highlighted here instead of restyling every item
+        table = self.parent()
+        row, col = index.row(), index.column()
+        if col == table.base_size_column:
+            option.backgroundBrush = _BASE_SIZE_BRUSH
+        elif row < table.rowCount() - 1 and not (row < 2 and col < 2):
+            # Plain cells are white; total row and fixed headers keep their own background
+            option.backgroundBrush = _WHITE_BRUSH
         # Show hint text for empty cells with gray color
-        if not index.data(Qt.ItemDataRole.DisplayRole):
-            option.palette.setColor(QPalette.ColorRole.Text, AppStyles.TABLE_HINT_TEXT_COLOR)
-            if index.row() == 1 and index.column() >= 2:  # Size headers
-                option.text = f"SIZE {index.column()-1}"
-            elif index.row() >= 2 and index.row() < self.parent().rowCount() - 1:
-                if index.column() == 0:  # Panel Name
-                    option.text = "PANEL NAME"
-                elif index.column() == 1:  # Panel Quantity
-                    option.text = "0"
-                elif index.column() >= 2:  # Sewing area
-                    option.text = "0.00"
+        if not option.text:
+            if row == 1 and col >= 2:  # Size headers
+                option.text = _size_hint(col)
+            elif 2 <= row < table.rowCount() - 1:
+                option.text = _DATA_HINTS.get(col, _AREA_HINT)
+            else:
+                return
+            option.palette = self._hint_palette_for(option.palette)
+
+class BaseSizeColumnDelegate(QStyledItemDelegate):
+    """Renders the base size column of the bottom table in bold blue text."""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.row() >= 2 and index.column() == self.parent().base_size_column:
+            font = QFont(option.font)
+            font.setBold(True)
+            option.font = font
+            option.palette.setColor(QPalette.ColorRole.Text, AppStyles.BASE_SIZE_TEXT_COLOR)
+
 
 class UpperCaseItemDelegate(QStyledItemDelegate):
+    # Completions shown under a panel name editor
+    COMPLETION_COUNT = 10
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Callable returning a PanelNameIndex, or None while it is not loaded yet
+        self.completion_source = None
 
     def createEditor(self, parent, option, index):
         # Apply to Panel Name column (column 0) and Size Headers (row 1, columns ≥2)
         if index.column() == 0 or (index.row() == 1 and index.column() >= 2):
             editor = UpperCaseLineEdit(parent)
+            if index.column() == 0 and index.row() >= 2 and self.completion_source is not None:
+                self._attach_completer(editor)
             return editor
         return super().createEditor(parent, option, index)
 
+    def _attach_completer(self, editor):
+        # The popup lists exactly what the name index returns (most used first), so Qt's own
+        # filtering is off and the model is refilled on every edit
+        completer = QCompleter(QStringListModel(editor), editor)
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        editor.setCompleter(completer)
+
+        def update_completions(text):
+            names = self.completion_source()
+            matches = names.complete(text, self.COMPLETION_COUNT) if names is not None and text.strip() else []
+            # Nothing to suggest once the name is typed out in full
+            if matches == [text.upper()]:
+                matches = []
+            completer.model().setStringList(matches)
+            if matches:
+                completer.complete()
+            else:
+                completer.popup().hide()
+
+        def accept_completion(_text):
+            self.commitData.emit(editor)
+            self.closeEditor.emit(editor, QStyledItemDelegate.EndEditHint.NoHint)
+
+        editor.textEdited.connect(update_completions)
+        completer.activated.connect(accept_completion)
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        # Panel name data cells are white and centered, matching TableItemDelegate
+        if 2 <= index.row() < self.parent().rowCount() - 1:
+            option.backgroundBrush = _WHITE_BRUSH
+            option.displayAlignment = Qt.AlignmentFlag.AlignCenter
+            if index.data(Qt.ItemDataRole.FontRole) is None:
+                option.font = _cell_font()
+
     def setEditorData(self, editor, index):
         if isinstance(editor, UpperCaseLineEdit):
             editor.blockSignals(True)
@@ -98,6 +218,9 @@ class UpperCaseItemDelegate(QStyledItemDelegate):
                     self.commitData.emit(editor)
                     return True
             elif event.type() == QEvent.Type.FocusOut:
+                completer = editor.completer()
+                if completer is not None and completer.popup().isVisible():
+                    return False  # Focus went to the completion popup; keep editing
                 self.commitData.emit(editor)
                 self.closeEditor.emit(editor, QStyledItemDelegate.EndEditHint.NoHint)
                 return True
@@ -15,6 +15,8 @@ class TopInputSection(QFrame):
         self.setSizePolicy(QSizePolicy.Policy.Expanding,
                            QSizePolicy.Policy.Fixed)
         self.setStyleSheet(AppStyles.FORM_CARD_STYLE)
+        # Last SizeRegistry version mirrored into base_size_combo
+        self._size_registry_version = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -226,16 +228,42 @@ class TopInputSection(QFrame):
         self.season_combo.setCurrentIndex(0)
         self.garments_stage_combo.setCurrentIndex(0)
         self.base_size_combo.clear()
+        self._size_registry_version = None  # Force the next sync to repopulate
         self.ecodown_input.clear()
         self.garment_weight_input.clear()
         self.set_approx_weight(0.0)
 
+    def sync_size_registry(self, registry):
+        """Updates the base size dropdown only if the size registry changed."""
+        if registry.version == self._size_registry_version:
+            return
+        self._size_registry_version = registry.version
+        self.update_base_size_dropdown(registry.sizes)
+
     def update_base_size_dropdown(self, sizes):
+        """
+        Diffs `sizes` against the dropdown entries and only inserts/removes
+        the changed span, so the popup's scroll position survives updates.
+        """
         try:
             self.base_size_combo.blockSignals(True)
             current_selection = self.base_size_combo.currentText()
-            self.base_size_combo.clear()
-            self.base_size_combo.addItems([""] + sizes)
+            wanted = [""] + list(sizes)
+            existing = [self.base_size_combo.itemText(i)
+                        for i in range(self.base_size_combo.count())]
+            if existing != wanted:
+                # Common prefix and suffix stay untouched
+                start = 0
+                while start < min(len(existing), len(wanted)) and existing[start] == wanted[start]:
+                    start += 1
+                end_existing, end_wanted = len(existing), len(wanted)
+                while (end_existing > start and end_wanted > start and
+                       existing[end_existing - 1] == wanted[end_wanted - 1]):
+                    end_existing -= 1
+                    end_wanted -= 1
+                for i in range(end_existing - 1, start - 1, -1):
+                    self.base_size_combo.removeItem(i)
+                self.base_size_combo.insertItems(start, wanted[start:end_wanted])
 
             if current_selection in sizes:
                 self.base_size_combo.setCurrentText(current_selection)
@@ -1,17 +1,29 @@
 # down_allocation_app/ui/sections/top_table.py
 
-from PyQt6.QtWidgets import QFrame, QHeaderView, QVBoxLayout, QMenu, QMessageBox, QTableWidgetItem, QSizePolicy
+import numpy as np
+
+from PyQt6.QtWidgets import QFrame, QHeaderView, QVBoxLayout, QMenu, QMessageBox, QTableWidgetItem, QSizePolicy, QToolTip
 from PyQt6.QtGui import QFont, QColor
-from PyQt6.QtCore import Qt, QModelIndex, pyqtSignal
+from PyQt6.QtCore import Qt, QModelIndex, QTimer, pyqtSignal
 # Assuming styles.py is in the parent directory or accessible
 from styles import AppStyles
+from core.size_registry import SizeRegistry
+from core.allocation_engine import PanelGrid
+from core.grading import GradingRules, grade_areas
+from core.panel_filter import PanelFilter
 from ui.widgets.table_widget import TableWidget  # Assuming this path
+from ui.widgets.panel_filter_bar import PanelFilterBar
 # Assuming this path
 from ui.sections.table_delegate import TableItemDelegate, UpperCaseItemDelegate
 # Import ConfirmationDialog
 from ui.dialogs.confirmation_dialog import ConfirmationDialog
 
 
+def _format_area(value):
+    """Area cell text for generated values: 2 decimals, trailing zeros dropped."""
+    return f"{value:.2f}".rstrip('0').rstrip('.')
+
+
 class TopTableSection(QFrame):
     # Signals to communicate changes back to main_window
     # Emitted when size headers are updated
@@ -22,6 +34,21 @@ class TopTableSection(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_window = parent  # Reference to the main window
+        # Size name <-> column index, maintained on header edits
+        self.size_registry = SizeRegistry()
+        # Numeric mirror of the data rows; patched per edit, rebuilt after bulk writes
+        self.grid = PanelGrid()
+        self._grid_dirty = True
+        # Bumped on every content/structure change; compared against the saved revision
+        # to tell whether the document is dirty without snapshotting the table
+        self.revision = 0
+        # Per-panel grade rules; graded rows follow their base size area
+        self.grading_rules = GradingRules()
+        # Rows not matching the filter bar are hidden; totals still use every row
+        self.panel_filter = PanelFilter()
+        self._refilter_pending = False
+        # Data rows edited one cell at a time since take_edited_rows(); None after bulk writes
+        self._edited_rows = None
         self.setSizePolicy(QSizePolicy.Policy.Expanding,
                            QSizePolicy.Policy.Expanding)  # Corrected usage
         self.setup_ui()
@@ -30,17 +57,21 @@ class TopTableSection(QFrame):
 
     def setup_ui(self):
         table_layout = QVBoxLayout(self)
+        self.filter_bar = PanelFilterBar(self)
+        self.filter_bar.filter_changed.connect(self.set_panel_filter)
+        table_layout.addWidget(self.filter_bar)
+
         # 2 headers + data rows + 1 total row
         self.table = TableWidget(
             AppStyles.DEFAULT_DATA_ROWS + 3, AppStyles.DEFAULT_COLS, self)
+        self.table.typed_clipboard = True
 
-        self.table.setItemDelegateForColumn(
-            0, UpperCaseItemDelegate(self.table))
-        # The TableItemDelegate includes validation and hint text
-        # Apply TableItemDelegate to all other editable columns
-        for i in range(1, AppStyles.DEFAULT_COLS):
-            self.table.setItemDelegateForColumn(
-                i, TableItemDelegate(self.table))
+        # One delegate instance per role, installed once for the lifetime of the table.
+        # The TableItemDelegate includes validation and hint text and covers every
+        # column (inserted ones included); the panel name column gets upper-casing.
+        self.table.setItemDelegate(TableItemDelegate(self.table))
+        self.name_delegate = UpperCaseItemDelegate(self.table)
+        self.table.setItemDelegateForColumn(0, self.name_delegate)
 
         self.table.verticalHeader().setVisible(False)
         self.table.horizontalHeader().setVisible(False)
@@ -86,6 +117,71 @@ class TopTableSection(QFrame):
 
         # Forward itemChanged signal from inner table
         self.table.itemChanged.connect(self._on_inner_item_changed)
+        # Bulk writes (paste, undo/redo) bypass itemChanged, so re-index headers afterwards
+        self.table.contents_reset.connect(self._rebuild_size_index)
+        self.table.contents_reset.connect(self.mark_grid_dirty)
+
+    def mark_grid_dirty(self):
+        """Flags the numeric grid for a full rebuild on next access (after bulk writes)."""
+        self._grid_dirty = True
+        self.revision += 1
+        self._edited_rows = None
+        self._schedule_refilter()
+
+    def _schedule_refilter(self):
+        """Bulk writes re-run the filter once, after the caller's batch has finished."""
+        if self.panel_filter.active and not self._refilter_pending:
+            self._refilter_pending = True
+            QTimer.singleShot(0, self.refilter)
+
+    def get_grid(self):
+        """Returns the PanelGrid mirror of the data rows, rebuilding it if stale."""
+        if self._grid_dirty:
+            self._rebuild_grid()
+        return self.grid
+
+    def _rebuild_grid(self):
+        total_row = self.table.rowCount() - 1
+        grid = PanelGrid(total_row - 2, self.table.columnCount() - 2)
+        for col in range(2, self.table.columnCount()):
+            item = self.table.item(1, col)
+            if item:
+                grid.set_size(col - 2, item.text())
+        for row in range(2, total_row):
+            for col in range(self.table.columnCount()):
+                item = self.table.item(row, col)
+                if item is None:
+                    continue  # Cells are only allocated once they hold data
+                self._set_grid_cell(grid, row, col, item.text())
+        self.grid = grid
+        self._grid_dirty = False
+
+    @staticmethod
+    def _set_grid_cell(grid, row, col, text):
+        """Writes one table cell (table coordinates) into the grid."""
+        if col == 0:
+            grid.set_name(row - 2, text)
+        elif col == 1:
+            grid.set_qty(row - 2, text)
+        else:
+            grid.set_area(row - 2, col - 2, text)
+
+    def _rebuild_size_index(self):
+        """Rebuilds the size registry from the size header row."""
+        names_by_column = {}
+        for col in range(2, self.table.columnCount()):
+            item = self.table.item(1, col)
+            if item:
+                names_by_column[col] = item.text()
+        self.size_registry.reset(names_by_column)
+
+    def _show_duplicate_size_hint(self, item, size_name):
+        """Non-blocking feedback for a rejected duplicate size header."""
+        rect = self.table.visualItemRect(item)
+        QToolTip.showText(
+            self.table.viewport().mapToGlobal(rect.bottomLeft()),
+            f"Size '{size_name}' already exists! Please choose a unique name.",
+            self.table.viewport(), rect, 3000)
 
     def _on_inner_item_changed(self, item):
         """Internal handler for item changes in the TableWidget."""
@@ -106,24 +202,41 @@ class TopTableSection(QFrame):
                 item.setText(item.text().upper())
                 self.table.blockSignals(False)  # Unblock signals
 
-        # Check for duplicate size headers
+        # Check for duplicate size headers (O(1) registry lookup)
         if item.row() == 1 and item.column() >= 2:
             current_text = item.text().strip()
-            if current_text:
-                for col_idx in range(2, self.table.columnCount()):
-                    if col_idx != item.column():
-                        other_item = self.table.item(1, col_idx)
-                        if other_item and other_item.text().strip() == current_text:
-                            QMessageBox.warning(self.parent_window, "Duplicate Size",
-                                                f"Size '{current_text}' already exists! Please choose a unique name.")
-                            # Block signals temporarily
-                            self.table.blockSignals(True)
-                            item.setText("")  # Clear the duplicate
-                            self.table.blockSignals(False)  # Unblock signals
-                            break
+            if current_text and self.size_registry.is_duplicate(item.column(), current_text):
+                self._show_duplicate_size_hint(item, current_text)
+                # Block signals temporarily
+                self.table.blockSignals(True)
+                item.setText("")  # Clear the duplicate
+                self.table.blockSignals(False)  # Unblock signals
+            self.size_registry.set(item.column(), item.text())
             # Emit signal about size headers change to update base size dropdown in TopInputSection
             self.size_headers_changed.emit(self.get_available_sizes())
 
+        # Patch the numeric grid for this one cell instead of re-reading the table
+        self.revision += 1
+        if not self._grid_dirty:
+            if item.row() == 1 and item.column() >= 2:
+                self.grid.set_size(item.column() - 2, item.text())
+            elif item.row() >= 2:
+                self._set_grid_cell(self.grid, item.row(), item.column(), item.text())
+        if item.row() >= 2 and self._edited_rows is not None:
+            self._edited_rows.add(item.row() - 2)
+
+        # A new base area (or panel name) regrades just that row
+        if item.row() >= 2 and item.column() in (0, self.table.base_size_column) and self.grading_rules:
+            self.apply_grading([item.row()])
+
+        # Re-check only the edited row against the filter (a size header can change every row)
+        if self.panel_filter.active:
+            if item.row() == 1:
+                if self.panel_filter.missing_areas:
+                    self.refilter()
+            else:
+                self._refilter_row(item.row())
+
         # Emit general data changed signal for parent to recalculate totals
         self.data_changed.emit()
 
@@ -132,12 +245,14 @@ class TopTableSection(QFrame):
         self.table.setRowCount(
             2 + data_rows + 1)  # 2 header rows + data_rows + 1 total row
         self.table.setColumnCount(total_cols)
+        # Drop every item in one call; data cells stay unallocated until edited
+        self.table.clearContents()
+        self.mark_grid_dirty()
 
         # Clear existing spans
-        for r in range(self.table.rowCount()):
-            for c in range(self.table.columnCount()):
-                if self.table.columnSpan(r, c) > 1 or self.table.rowSpan(r, c) > 1:
-                    self.table.setSpan(r, c, 1, 1)
+        self.table.clearSpans()
+        # Header/total items are written with signals blocked; callers recalculate once afterwards
+        self.table.blockSignals(True)
 
         # Set up header merges
         self.table.setSpan(0, 0, 2, 1)  # PANEL NAME (span 2 rows)
@@ -164,44 +279,12 @@ class TopTableSection(QFrame):
 
         # Set size headers in row 1 (below merged SIZE header)
         for col in range(2, total_cols):
-            # Initialize with empty string so delegate can show hint text
-            item = QTableWidgetItem("")
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            # Use TABLE_HEADERS_FONT_SIZE
-            item.setFont(
-                QFont("Courier New", AppStyles.TABLE_HEADERS_FONT_SIZE))
-            # Ensure black text - Issue 1
-            item.setForeground(QColor(Qt.GlobalColor.black))
-            item.setToolTip("Enter size name like XS, S, M, L")
-            # Make size headers fully editable
-            item.setFlags(Qt.ItemFlag.ItemIsEnabled |
-                          Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(1, col, item)
-
-        # Set up data rows (from row 2 to second-to-last row)
-        for row in range(2, self.table.rowCount() - 1):
-            # Panel Name column
-            name_item = QTableWidgetItem("")
-            name_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            # Use TABLE_TEXT_SIZE
-            name_item.setFont(QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
-            self.table.setItem(row, 0, name_item)
-
-            # Panel Quantity column
-            qty_item = QTableWidgetItem("")
-            qty_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            # Use TABLE_TEXT_SIZE
-            qty_item.setFont(QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
-            self.table.setItem(row, 1, qty_item)
-
-            # Sewing area columns
-            for col in range(2, total_cols):
-                area_item = QTableWidgetItem("")
-                area_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                # Use TABLE_TEXT_SIZE
-                area_item.setFont(
-                    QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
-                self.table.setItem(row, col, area_item)
+            self.table.setItem(1, col, self._make_size_header_item())
+
+        # Data rows (row 2 to second-to-last row) get no items: the delegates
+        # paint hint text, font and alignment for empty cells, and QTableWidget
+        # creates the item when a cell is first edited. This keeps large tables
+        # cheap to build and only the visible cells cost anything to render.
 
         # Set up TOTAL row
         total_item = QTableWidgetItem("TOTAL")
@@ -216,28 +299,186 @@ class TopTableSection(QFrame):
         self.table.setSpan(self.table.rowCount() - 1, 0, 1, 2)
 
         for col in range(2, total_cols):
-            total_cell = QTableWidgetItem("0.00")
-            total_cell.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            total_cell.setFont(
-                QFont("Courier New", AppStyles.TABLE_HEADERS_FONT_SIZE, QFont.Weight.Bold))  # Use TABLE_HEADERS_FONT_SIZE
-            # Ensure black text - Issue 1
-            total_cell.setForeground(QColor(Qt.GlobalColor.black))
-            total_cell.setFlags(Qt.ItemFlag.ItemIsEnabled |
-                                Qt.ItemFlag.ItemIsSelectable)  # Not editable
-            self.table.setItem(self.table.rowCount() - 1, col, total_cell)
+            self.table.setItem(self.table.rowCount() - 1, col, self._make_total_cell())
+        self.table.blockSignals(False)
 
         # Set column widths again after potential resize
+        self.apply_column_widths()
+
+        self._rebuild_size_index()
+        self.table.base_size_column = -1
+
+    def apply_column_widths(self):
+        """Re-applies the configured column widths (e.g. after a settings change)."""
         self.table.setColumnWidth(0, AppStyles.PANEL_NAME_COL_WIDTH)
         self.table.setColumnWidth(1, AppStyles.PANEL_QTY_COL_WIDTH)
         for col in range(2, self.table.columnCount()):
             self.table.setColumnWidth(col, AppStyles.SEWING_AREA_COL_WIDTH)
 
-        # Ensure delegates are re-applied if table dimensions change significantly
-        self.table.setItemDelegateForColumn(
-            0, UpperCaseItemDelegate(self.table))
-        for i in range(1, self.table.columnCount()):
-            self.table.setItemDelegateForColumn(
-                i, TableItemDelegate(self.table))
+    def apply_header_fonts(self):
+        """Re-applies header/total fonts after a settings change; data cells use the delegate font."""
+        header_font = QFont("Courier New", AppStyles.TABLE_HEADERS_FONT_SIZE)
+        bold_font = QFont("Courier New", AppStyles.TABLE_HEADERS_FONT_SIZE, QFont.Weight.Bold)
+        total_row = self.table.rowCount() - 1
+        self.table.blockSignals(True)
+        for col in range(self.table.columnCount()):
+            for row, font in ((0, bold_font), (1, header_font), (total_row, bold_font)):
+                item = self.table.item(row, col)
+                if item:
+                    item.setFont(font)
+        self.table.blockSignals(False)
+
+    @staticmethod
+    def _make_size_header_item():
+        # Initialize with empty string so delegate can show hint text
+        item = QTableWidgetItem("")
+        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Use TABLE_HEADERS_FONT_SIZE
+        item.setFont(QFont("Courier New", AppStyles.TABLE_HEADERS_FONT_SIZE))
+        # Ensure black text - Issue 1
+        item.setForeground(QColor(Qt.GlobalColor.black))
+        item.setToolTip("Enter size name like XS, S, M, L")
+        # Make size headers fully editable
+        item.setFlags(Qt.ItemFlag.ItemIsEnabled |
+                      Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable)
+        return item
+
+    @staticmethod
+    def _make_total_cell():
+        total_cell = QTableWidgetItem("0.00")
+        total_cell.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        total_cell.setFont(
+            QFont("Courier New", AppStyles.TABLE_HEADERS_FONT_SIZE, QFont.Weight.Bold))  # Use TABLE_HEADERS_FONT_SIZE
+        # Ensure black text - Issue 1
+        total_cell.setForeground(QColor(Qt.GlobalColor.black))
+        total_cell.setFlags(Qt.ItemFlag.ItemIsEnabled |
+                            Qt.ItemFlag.ItemIsSelectable)  # Not editable
+        total_cell.setBackground(QColor(220, 220, 220))
+        return total_cell
+
+    # region Structural edits
+    # Each operation is a single model insert/remove of `count` rows or columns
+    # plus the matching grid patch; only the affected header/total cells get items.
+    def insert_data_rows(self, at, count):
+        """Inserts `count` empty panel rows before table row `at` (2..total row)."""
+        self.revision += 1
+        self.table.model().insertRows(at, count)
+        if not self._grid_dirty:
+            self.grid.insert_rows(at - 2, count)
+
+    def remove_data_rows(self, at, count):
+        """Removes `count` panel rows starting at table row `at`."""
+        self.revision += 1
+        self.table.model().removeRows(at, count)
+        if not self._grid_dirty:
+            self.grid.remove_rows(at - 2, count)
+
+    def insert_size_columns(self, at, count):
+        """Inserts `count` empty size columns before table column `at` (2..columnCount)."""
+        self.revision += 1
+        self.table.model().insertColumns(at, count)
+        if not self._grid_dirty:
+            self.grid.insert_cols(at - 2, count)
+
+        total_row = self.table.rowCount() - 1
+        self.table.blockSignals(True)
+        for col in range(at, at + count):
+            self.table.setItem(1, col, self._make_size_header_item())
+            self.table.setItem(total_row, col, self._make_total_cell())
+            self.table.setColumnWidth(col, AppStyles.SEWING_AREA_COL_WIDTH)
+        self.table.blockSignals(False)
+        # Ensure the main header span is correct
+        self.table.setSpan(0, 2, 1, self.table.columnCount() - 2)
+
+    def remove_size_columns(self, at, count):
+        """Removes `count` size columns starting at table column `at`."""
+        self.revision += 1
+        self.table.model().removeColumns(at, count)
+        if not self._grid_dirty:
+            self.grid.remove_cols(at - 2, count)
+        # Re-adjust the main header span if columns changed
+        self.table.setSpan(0, 2, 1, self.table.columnCount() - 2)
+
+    def resize_data(self, data_rows, size_cols):
+        """Grows or truncates the panel rows / size columns at the end, keeping existing data."""
+        current_rows = self.table.rowCount() - 3
+        current_cols = self.table.columnCount() - 2
+        if data_rows > current_rows:
+            self.insert_data_rows(self.table.rowCount() - 1, data_rows - current_rows)
+        elif data_rows < current_rows:
+            self.remove_data_rows(2 + data_rows, current_rows - data_rows)
+        if size_cols > current_cols:
+            self.insert_size_columns(self.table.columnCount(), size_cols - current_cols)
+        elif size_cols < current_cols:
+            self.remove_size_columns(2 + size_cols, current_cols - size_cols)
+        self._rebuild_size_index()
+
+    def _selected_block(self, first, last, axis):
+        """
+        Returns (start, count) of the selected rows/columns (axis 'row'/'column')
+        clamped to first..last, or None if nothing in range is selected.
+        """
+        positions = sorted({getattr(index, axis)() for index in self.table.selectedIndexes()
+                            if first <= getattr(index, axis)() <= last})
+        if not positions:
+            return None
+        return positions[0], positions[-1] - positions[0] + 1
+
+    def _update_adjust_inputs(self):
+        # Update row/column inputs in AdjustTableSection
+        if self.parent_window and hasattr(self.parent_window, 'adjust_table_section'):
+            self.parent_window.adjust_table_section.update_row_col_inputs(
+                self.table.rowCount() - 3, self.table.columnCount() - 2)
+    # endregion
+
+    # region Filtering
+    def set_panel_filter(self, panel_filter):
+        self.panel_filter = panel_filter
+        self.refilter()
+
+    def refilter(self):
+        """Hides the panel rows not matching the filter; only rows whose visibility changes are touched."""
+        self._refilter_pending = False
+        total_row = self.table.rowCount() - 1
+        if self.panel_filter.active:
+            keep = self.panel_filter.mask(self.get_grid())
+        else:
+            keep = np.ones(total_row - 2, dtype=bool)
+        for row in range(2, total_row):
+            hidden = not keep[row - 2]
+            if self.table.isRowHidden(row) != hidden:
+                self.table.setRowHidden(row, hidden)
+        # Undo restores the row count at the end, which can move the total row onto a hidden row
+        for row in (0, 1, total_row):
+            self.table.setRowHidden(row, False)
+        self.filter_bar.set_counts(int(keep.sum()), len(keep), self.panel_filter.active)
+
+    def reveal_cell(self, row, col):
+        """Selects and scrolls to a table cell, clearing the filter if it hides the row."""
+        if self.table.isRowHidden(row):
+            self.filter_bar.clear()
+        self.table.setCurrentCell(row, col)
+        self.table.scrollTo(self.table.model().index(row, col))
+        self.table.setFocus()
+
+    def take_edited_rows(self):
+        """
+        Data rows changed by single-cell edits since the last call, or None if
+        a bulk write (paste, undo, load) since then calls for a full re-check.
+        """
+        rows, self._edited_rows = self._edited_rows, set()
+        return rows
+
+    def _refilter_row(self, row):
+        if self._grid_dirty:
+            self.refilter()
+            return
+        hidden = not self.panel_filter.row_matches(self.grid, row - 2)
+        if self.table.isRowHidden(row) != hidden:
+            self.table.setRowHidden(row, hidden)
+            shown = sum(not self.table.isRowHidden(r) for r in range(2, self.table.rowCount() - 1))
+            self.filter_bar.set_counts(shown, self.table.rowCount() - 3, True)
+    # endregion
 
     def create_context_menu(self, pos):
         context_menu = QMenu(self.table)
@@ -259,176 +500,149 @@ class TopTableSection(QFrame):
             self.delete_column()
 
     def insert_row(self):
-        current_row = self.table.currentRow()
-        if current_row == -1 or current_row >= self.table.rowCount() - 1:
-            current_row = self.table.rowCount() - 2  # Insert before total row
+        """Inserts as many panel rows as are selected (one if none) before the selection."""
+        total_row = self.table.rowCount() - 1
+        block = self._selected_block(2, total_row - 1, 'row')
+        if block:
+            at, count = block
+        else:
+            at, count = total_row, 1  # Insert before total row
+
+        if self.table.rowCount() - 3 + count > AppStyles.MAX_PANEL_ROWS:
+            QMessageBox.warning(self.parent_window, "Insert Row",
+                                f"The table is limited to {AppStyles.MAX_PANEL_ROWS} panels.")
+            return
 
         self.table.push_undo_state()  # Save state before modification
-
-        self.table.insertRow(current_row)
-        for col in range(self.table.columnCount()):
-            item = QTableWidgetItem("")
-            # Use TABLE_TEXT_SIZE
-            item.setFont(QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
-            self.table.setItem(current_row, col, item)
-        self.table.setRowHeight(current_row, 28)  # Default row height
-
-        # Update row input in AdjustTableSection
-        if self.parent_window and hasattr(self.parent_window, 'adjust_table_section'):
-            new_data_rows = self.table.rowCount() - 3  # Subtracting header and total rows
-            self.parent_window.adjust_table_section.update_row_col_inputs(
-                new_data_rows, self.table.columnCount() - 2)
-
+        self.insert_data_rows(at, count)
+        self._update_adjust_inputs()
         self.data_changed.emit()  # Recalculate totals
 
     def delete_row(self):
-        current_row = self.table.currentRow()
-        if current_row < 2 or current_row >= self.table.rowCount() - 1:  # Cannot delete header or total row
+        total_row = self.table.rowCount() - 1
+        block = self._selected_block(2, total_row - 1, 'row')
+        if block is None:  # Cannot delete header or total row
             QMessageBox.warning(self.parent_window, "Delete Row",
                                 "Cannot delete header rows or total row.")
             return
+        at, count = block
+        if count >= total_row - 2:
+            QMessageBox.warning(self.parent_window, "Delete Row",
+                                "At least one panel row must remain.")
+            return
+        if any(self.table.isRowHidden(row) for row in range(at, at + count)):
+            QMessageBox.warning(self.parent_window, "Delete Row",
+                                "The selection spans rows hidden by the panel filter. "
+                                "Clear the filter to delete them.")
+            return
 
-        confirm_dialog = ConfirmationDialog(
-            "Confirm Deletion", "Are you sure you want to delete this row?", self.parent_window)
+        message = ("Are you sure you want to delete this row?" if count == 1
+                   else f"Are you sure you want to delete these {count} rows?")
+        confirm_dialog = ConfirmationDialog("Confirm Deletion", message, self.parent_window)
         if confirm_dialog.exec() == QMessageBox.StandardButton.Yes:  # Use QMessageBox.StandardButton.Yes
             self.table.push_undo_state()  # Save state before modification
-            self.table.removeRow(current_row)
-
-            # Update row input in AdjustTableSection
-            if self.parent_window and hasattr(self.parent_window, 'adjust_table_section'):
-                new_data_rows = self.table.rowCount() - 3
-                self.parent_window.adjust_table_section.update_row_col_inputs(
-                    new_data_rows, self.table.columnCount() - 2)
-
+            self.remove_data_rows(at, count)
+            self._update_adjust_inputs()
             self.data_changed.emit()  # Recalculate totals
 
     def insert_column(self):
-        current_col = self.table.currentColumn()
-        # Insert after fixed columns (Panel Name, Panel Quantity)
-        if current_col < 2 or current_col == -1:
+        """Inserts as many size columns as are selected (one if none) before the selection."""
+        block = self._selected_block(2, self.table.columnCount() - 1, 'column')
+        if block:
+            at, count = block
+        else:
             # Insert at the end if no selection in data cols
-            current_col = self.table.columnCount()
-
-        self.table.push_undo_state()  # Save state before modification
+            at, count = self.table.columnCount(), 1
 
-        self.table.insertColumn(current_col)
-        self.table.setColumnWidth(current_col, AppStyles.SEWING_AREA_COL_WIDTH)
-        # Set delegate for new column
-        self.table.setItemDelegateForColumn(
-            current_col, TableItemDelegate(self.table))
-        self.table.setItemDelegateForColumn(
-            current_col, UpperCaseItemDelegate(self.table))  # Ensure uppercase too
-
-        # Update column header (Size X)
-        # Initialize with empty string so delegate can show hint text
-        item = QTableWidgetItem("")
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        # Use TABLE_HEADERS_FONT_SIZE
-        item.setFont(QFont("Courier New", AppStyles.TABLE_HEADERS_FONT_SIZE))
-        # Ensure black text - Issue 1
-        item.setForeground(QColor(Qt.GlobalColor.black))
-        item.setToolTip("Enter size name like XS, S, M, L")
-        item.setFlags(Qt.ItemFlag.ItemIsEnabled |
-                      Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable)
-        # Set the size header for the new column
-        self.table.setItem(1, current_col, item)
-
-        # Also, update main merged header if needed (not strictly necessary here as it spans dynamically)
-        # Ensure the main header span is correct
-        self.table.setSpan(0, 2, 1, self.table.columnCount() - 2)
-
-        # Initialize cells for the new column
-        for row in range(2, self.table.rowCount()):
-            new_item = QTableWidgetItem("")
-            new_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            # Use TABLE_TEXT_SIZE
-            new_item.setFont(QFont("Courier New", AppStyles.TABLE_TEXT_SIZE))
-            self.table.setItem(row, current_col, new_item)
+        if self.table.columnCount() - 2 + count > AppStyles.MAX_SIZE_COLS:
+            QMessageBox.warning(self.parent_window, "Insert Column",
+                                f"The table is limited to {AppStyles.MAX_SIZE_COLS} sizes.")
+            return
 
-        # Update column input in AdjustTableSection
-        if self.parent_window and hasattr(self.parent_window, 'adjust_table_section'):
-            new_data_cols = self.table.columnCount() - 2
-            self.parent_window.adjust_table_section.update_row_col_inputs(
-                self.table.rowCount() - 3, new_data_cols)
+        self.table.push_undo_state()  # Save state before modification
+        self.insert_size_columns(at, count)
+        self._rebuild_size_index()
+        self._update_adjust_inputs()
 
         self.size_headers_changed.emit(
             self.get_available_sizes())  # Update base size dropdown
         self.data_changed.emit()  # Recalculate totals
 
     def delete_column(self):
-        current_col = self.table.currentColumn()
-        if current_col < 2 or current_col >= self.table.columnCount():  # Cannot delete fixed columns
+        block = self._selected_block(2, self.table.columnCount() - 1, 'column')
+        if block is None:  # Cannot delete fixed columns
             QMessageBox.warning(self.parent_window, "Delete Column",
                                 "Cannot delete fixed columns (Panel Name, Panel Quantity).")
             return
+        at, count = block
 
-        if self.table.columnCount() - 2 <= 1:  # Prevent deleting if only one size column remains
+        if self.table.columnCount() - 2 - count < 1:  # Prevent deleting every size column
             QMessageBox.warning(self.parent_window, "Delete Column",
                                 "At least one size column must remain.")
             return
 
-        confirm_dialog = ConfirmationDialog(
-            "Confirm Deletion", "Are you sure you want to delete this column?", self.parent_window)
+        message = ("Are you sure you want to delete this column?" if count == 1
+                   else f"Are you sure you want to delete these {count} columns?")
+        confirm_dialog = ConfirmationDialog("Confirm Deletion", message, self.parent_window)
         if confirm_dialog.exec() == QMessageBox.StandardButton.Yes:
             self.table.push_undo_state()  # Save state before modification
-            self.table.removeColumn(current_col)
-
-            # Update column input in AdjustTableSection
-            if self.parent_window and hasattr(self.parent_window, 'adjust_table_section'):
-                new_data_cols = self.table.columnCount() - 2
-                self.parent_window.adjust_table_section.update_row_col_inputs(
-                    self.table.rowCount() - 3, new_data_cols)
-
-            # Re-label remaining size headers to be sequential (but as hint if empty)
-            for col in range(2, self.table.columnCount()):
-                item = self.table.item(1, col)
-                if item:
-                    # Clear text so delegate can apply hint if needed
-                    item.setText("")
-
-            # Re-adjust the main header span if columns changed
-            self.table.setSpan(0, 2, 1, self.table.columnCount() - 2)
+            self.remove_size_columns(at, count)
+            # Remaining size headers keep their names; only the registry indexes shift
+            self._rebuild_size_index()
+            self._update_adjust_inputs()
 
             self.size_headers_changed.emit(
                 self.get_available_sizes())  # Update base size dropdown
             self.data_changed.emit()  # Recalculate totals
 
     def get_available_sizes(self):
-        return [self.table.item(1, col).text().strip()
-                for col in range(2, self.table.columnCount())
-                if self.table.item(1, col) and self.table.item(1, col).text().strip()]
+        return self.size_registry.sizes
 
     def highlight_base_size(self, size):
-        # Block signals during highlight operations
+        """Moves the base size highlight to the column of `size` (painted by the delegate)."""
+        self.table.set_base_size_column(self.size_registry.column_of(size))
+
+    # region Grading
+    def set_grading_rules(self, rules):
+        self.grading_rules = rules
+        self.revision += 1
+
+    def apply_grading(self, rows=None):
+        """
+        Regenerates the size areas of graded panels from the base size column
+        in one batched write (all data rows, or the given table rows).
+        Returns the number of rows written; callers recalculate afterwards.
+        """
+        base_col = self.table.base_size_column - 2
+        if base_col < 0 or not self.grading_rules:
+            return 0
+        grid = self.get_grid()
+        data_rows = np.arange(grid.shape[0]) if rows is None else np.asarray(rows, dtype=np.intp) - 2
+        areas, graded = grade_areas(
+            grid.areas[data_rows, base_col], base_col, grid.sizes,
+            [self.grading_rules.get(grid.names[row]) for row in data_rows],
+            max_area=AppStyles.MAX_SEWING_AREA)
+        if not graded.any():
+            return 0
+
+        if rows is None:
+            self.table.push_undo_state()  # Whole-table regrade is one undo step
+        self.table.programmatic_change = True
         self.table.blockSignals(True)
         try:
-            # Clear previous highlights
-            for r in range(self.table.rowCount()):
-                for c in range(self.table.columnCount()):
-                    item = self.table.item(r, c)
-                    if item:
-                        # Ensure default white background for all cells, except totals which are grey
-                        # If it's a total row or a fixed header, retain its color
-                        if r == self.table.rowCount() - 1 or (r == 0 and c < 2) or (r == 1 and c < 2):
-                           pass
-                        else:
-                            item.setBackground(QColor(Qt.GlobalColor.white))
-
-            if size and str(size).strip():
-                size_upper = str(size).strip().upper()
-                # Find the column index of the base size
-                for col_idx in range(2, self.table.columnCount()):
-                    header_item = self.table.item(1, col_idx)
-                    if header_item and header_item.text().strip().upper() == size_upper:
-                        # Highlight the entire column
-                        for row_idx in range(self.table.rowCount()):
-                            item = self.table.item(row_idx, col_idx)
-                            if item:
-                                item.setBackground(
-                                    QColor(220, 230, 241))  # Light blue
-                        break  # Stop after finding the column
+            for row, values in zip(data_rows[graded], areas[graded]):
+                for col in np.flatnonzero(~np.isnan(values)):
+                    text = _format_area(values[col])
+                    self._set_cell_text(row + 2, col + 2, text)
+                    grid.areas[row, col] = float(text)
         finally:
-            self.table.blockSignals(False)  # Unblock signals
+            self.table.blockSignals(False)
+            self.table.programmatic_change = False
+        self.revision += 1
+        self.table.viewport().update()
+        self._schedule_refilter()  # Graded areas can change which rows a missing-areas filter shows
+        return int(graded.sum())
+    # endregion
 
     def save_table_content(self):
         """Save all table data and size headers."""
@@ -463,6 +677,16 @@ class TopTableSection(QFrame):
 
         return saved_data
 
+    def _set_cell_text(self, row, col, text):
+        """Sets a data cell's text, allocating an item only for non-empty text."""
+        item = self.table.item(row, col)
+        if item is None:
+            if not text:
+                return
+            item = QTableWidgetItem()
+            self.table.setItem(row, col, item)
+        item.setText(text)
+
     def restore_table_content(self, saved_data):
         """Restore table data and size headers after expansion."""
         self.table.blockSignals(True)  # Block signals during restore
@@ -477,45 +701,121 @@ class TopTableSection(QFrame):
                         if item:
                             item.setText(saved_data['size_names'][col - 2])
 
-            # Restore panel data
+            # Restore panel data; empty values only touch cells that already have an item
             if 'panel_data' in saved_data:
+                size_cols = self.table.columnCount() - 2
                 # Limit to available rows and saved data
                 for row_idx in range(min(self.table.rowCount() - 1 - 2, len(saved_data['panel_data']))):
                     current_table_row = row_idx + 2  # Actual row in QTableWidget
 
                     panel_entry = saved_data['panel_data'][row_idx]
+                    values = [panel_entry.get('name', ''), panel_entry.get('qty', '')]
+                    values.extend(panel_entry.get('areas', [])[:size_cols])
 
-                    name_item = self.table.item(current_table_row, 0)
-                    # Create if not exists (should be rare after setup_table_content)
-                    if not name_item:
-                        name_item = QTableWidgetItem()
-                        self.table.setItem(current_table_row, 0, name_item)
-                    name_item.setText(panel_entry.get('name', ''))
-
-                    qty_item = self.table.item(current_table_row, 1)
-                    if not qty_item:
-                        qty_item = QTableWidgetItem()
-                        self.table.setItem(current_table_row, 1, qty_item)
-                    qty_item.setText(panel_entry.get('qty', ''))
-
-                    for col_idx in range(2, min(self.table.columnCount(), len(panel_entry.get('areas', [])) + 2)):
-                        if col_idx - 2 < len(panel_entry.get('areas', [])):
-                            area_item = self.table.item(
-                                current_table_row, col_idx)
-                            if not area_item:
-                                area_item = QTableWidgetItem()
-                                self.table.setItem(
-                                    current_table_row, col_idx, area_item)
-                            area_item.setText(
-                                panel_entry['areas'][col_idx - 2])
+                    for col_idx, text in enumerate(values):
+                        self._set_cell_text(current_table_row, col_idx, text)
         finally:
             self.table.blockSignals(False)
             self.table.programmatic_change = False
             self.table.viewport().update()
+            self._rebuild_size_index()
+            self.mark_grid_dirty()
             # Ensure dropdown is updated
             self.size_headers_changed.emit(self.get_available_sizes())
             self.data_changed.emit()  # Recalculate totals after restoring
 
+    def replace_table_content(self, saved_data):
+        """
+        Replaces all panel rows and sizes with `saved_data` (save_table_content()
+        shape) in one load: a single resize, a single restore, one undo step.
+        Raises ValueError if the data exceeds the table limits.
+        """
+        rows = len(saved_data['panel_data'])
+        cols = len(saved_data['size_names'])
+        if rows > AppStyles.MAX_PANEL_ROWS or cols > AppStyles.MAX_SIZE_COLS:
+            raise ValueError(f"{rows} panels x {cols} sizes exceeds the table limits of "
+                             f"{AppStyles.MAX_PANEL_ROWS} x {AppStyles.MAX_SIZE_COLS} (see Settings)")
+        self.table.push_undo_state()
+        self.resize_data(max(rows, 1), max(cols, 1))
+        self._update_adjust_inputs()
+        self.restore_table_content(saved_data)
+
+    def load_area_matrix(self, names, sizes, areas, qty=None):
+        """
+        Batched load of a panel x size area matrix (e.g. from a CAD import).
+        Panels and sizes already in the table are updated in place; new ones
+        take the first unnamed rows/columns, then rows/columns are appended.
+        NaN areas leave the cell as it is; `qty` only fills empty quantities.
+        Raises ValueError if the table would exceed its row/column limits.
+        """
+        grid = self.get_grid()
+
+        def place(keys, existing, limit, what):
+            index = {}
+            for position, key in enumerate(existing):
+                if key and key not in index:
+                    index[key] = position
+            free = iter([position for position, key in enumerate(existing) if not key])
+            count = len(existing)
+            positions = []
+            for key in keys:
+                if key not in index:
+                    index[key] = next(free, None)
+                    if index[key] is None:
+                        index[key] = count
+                        count += 1
+                positions.append(index[key])
+            if count > limit:
+                raise ValueError(f"{count} {what} needed, the limit is {limit} (see Settings)")
+            return positions, count
+
+        rows, row_count = place(names, grid.names, AppStyles.MAX_PANEL_ROWS, "panels")
+        cols, col_count = place(sizes, grid.sizes, AppStyles.MAX_SIZE_COLS, "sizes")
+
+        self.table.push_undo_state()
+        if row_count > grid.shape[0] or col_count > grid.shape[1]:
+            self.resize_data(max(row_count, grid.shape[0]), max(col_count, grid.shape[1]))
+
+        self.table.blockSignals(True)
+        self.table.programmatic_change = True
+        try:
+            for col, size in zip(cols, sizes):
+                self.table.item(1, col + 2).setText(size)
+            for index, (row, name) in enumerate(zip(rows, names)):
+                self._set_cell_text(row + 2, 0, name)
+                qty_item = self.table.item(row + 2, 1)
+                if qty is not None and qty[index] > 0 and not (qty_item and qty_item.text()):
+                    self._set_cell_text(row + 2, 1, str(min(int(qty[index]), AppStyles.MAX_PANEL_QTY)))
+                for col, value in zip(cols, areas[index]):
+                    if not np.isnan(value):
+                        self._set_cell_text(row + 2, col + 2, _format_area(value))
+        finally:
+            self.table.blockSignals(False)
+            self.table.programmatic_change = False
+            self.table.viewport().update()
+            self._rebuild_size_index()
+            self.mark_grid_dirty()
+            self._update_adjust_inputs()
+            self.size_headers_changed.emit(self.get_available_sizes())
+            self.data_changed.emit()
+
+    def insert_template(self, template):
+        """
+        Materializes a PanelTemplate in one batched load_area_matrix() call (one
+        resize, one undo step), then applies the template's grade rules to its
+        panels. Raises ValueError if the table would exceed its limits.
+        """
+        self.load_area_matrix(template.names, template.sizes, template.areas, template.qty)
+        if not template.grading_rules:
+            return
+        rules = self.grading_rules.to_dict()
+        rules.update(template.grading_rules)
+        self.set_grading_rules(GradingRules.from_dict(rules))
+        names = set(template.grading_rules)
+        rows = [row + 2 for row, name in enumerate(self.get_grid().names) if name in names]
+        if self.apply_grading(rows):
+            self.data_changed.emit()
+
     def clear_data(self):
         """Clears all data rows and size headers, keeping the structure."""
         self.table.programmatic_change = True  # Prevent undo tracking during clear
@@ -543,6 +843,8 @@ class TopTableSection(QFrame):
             self.table.blockSignals(False)
             self.table.programmatic_change = False
             self.table.viewport().update()
+            self._rebuild_size_index()
+            self.mark_grid_dirty()
             self.size_headers_changed.emit(self.get_available_sizes())
             self.data_changed.emit()
 
@@ -550,56 +852,9 @@ class TopTableSection(QFrame):
         """
         Returns a structured dictionary of data from the top table
         suitable for calculations in BottomTableSection.
+        Only panels with a name and a quantity > 0 are included.
         """
-        data = {
-            'sizes': [],
-            # Each panel is {'name': 'PNL1', 'qty': 1, 'areas': [10.0, 12.0, ...]}
-            'panels': []
-        }
-
-        # Get sizes from header row
-        for col in range(2, self.table.columnCount()):
-            size_item = self.table.item(1, col)
-            # Ensure that the actual text is retrieved, not the hint text
-            size_text = size_item.text().strip() if size_item else ""
-            # If it's a hint (empty or default "SIZE X"), don't include it in sizes for calculation purposes
-            # The simplified get_available_sizes will already filter out empty strings,
-            # so this check is mostly for robustness during calculation if a hint somehow remains.
-            # Heuristic to check if it's a default hint
-            if size_text.startswith("SIZE ") and not size_text.replace("SIZE ", "").isdigit():
-                # Add empty string for calculation if it's just a hint
-                data['sizes'].append("")
-            else:
-                data['sizes'].append(size_text)
-
-        # Get panel data
-        for row in range(2, self.table.rowCount() - 1):
-            name_item = self.table.item(row, 0)
-            qty_item = self.table.item(row, 1)
-
-            try:
-                qty = int(qty_item.text()
-                          ) if qty_item and qty_item.text().isdigit() else 0
-            except ValueError:
-                qty = 0  # Invalid quantity
-
-            panel_areas = []
-            for col in range(2, self.table.columnCount()):
-                area_item = self.table.item(row, col)
-                try:
-                    area = float(area_item.text()
-                                 ) if area_item and area_item.text() else 0.0
-                except ValueError:
-                    area = 0.0  # Invalid area
-                panel_areas.append(area)
-
-            if name_item and name_item.text().strip() and qty > 0:  # Only include valid panels
-                data['panels'].append({
-                    'name': name_item.text().strip(),
-                    'qty': qty,
-                    'areas': panel_areas
-                })
-        return data
+        return self.get_grid().to_calculation_data()
 
     def get_total_area_for_size(self, size_name: str) -> float:
         """
@@ -611,16 +866,7 @@ class TopTableSection(QFrame):
         Returns:
             float: The total sewing area for the specified size, or 0.0 if not found/invalid.
         """
-        size_name_upper = size_name.strip().upper()
-
-        # Find the column index for the given size
-        col_index = -1
-        # Start from column 2 where sizes begin
-        for col in range(2, self.table.columnCount()):
-            header_item = self.table.item(1, col)  # Size headers are in row 1
-            if header_item and header_item.text().strip().upper() == size_name_upper:
-                col_index = col
-                break
+        col_index = self.size_registry.column_of(size_name)
 
         if col_index != -1:
             # Get the value from the total row in that column
@@ -0,0 +1,93 @@
+# down_allocation_app/ui/widgets/panel_filter_bar.py
+
+from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLineEdit, QCheckBox, QSpinBox, QLabel
+from PyQt6.QtCore import Qt, pyqtSignal
+
+from core.panel_filter import PanelFilter
+from styles import AppStyles
+
+
+class PanelFilterBar(QFrame):
+    """
+    Search row above the top table. Emits filter_changed with a PanelFilter
+    whenever a criterion changes; an invalid regex is flagged on the search
+    box and the previous filter stays in effect.
+    """
+    filter_changed = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 4)
+        layout.setSpacing(10)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Filter panels by name (Ctrl+F)")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        self.search_input.textChanged.connect(self._emit_filter)
+        layout.addWidget(self.search_input, 1)
+
+        self.regex_check = QCheckBox("Regex")
+        self.regex_check.toggled.connect(self._emit_filter)
+        self.missing_check = QCheckBox("Missing areas")
+        self.missing_check.setToolTip("Named panels with a blank area under any named size")
+        self.missing_check.toggled.connect(self._emit_filter)
+        self.qty_check = QCheckBox("Qty >")
+        self.qty_check.toggled.connect(self._emit_filter)
+        self.qty_spin = QSpinBox()
+        self.qty_spin.setRange(0, AppStyles.MAX_PANEL_QTY)
+        self.qty_spin.valueChanged.connect(lambda _value: self.qty_check.isChecked() and self._emit_filter())
+        for widget in (self.regex_check, self.missing_check, self.qty_check, self.qty_spin):
+            layout.addWidget(widget)
+
+        self.count_label = QLabel("")
+        self.count_label.setStyleSheet(AppStyles.LABEL_STYLE)
+        self.count_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        layout.addWidget(self.count_label)
+
+    def _emit_filter(self):
+        try:
+            panel_filter = PanelFilter(self.search_input.text(), self.regex_check.isChecked(),
+                                       self.missing_check.isChecked(),
+                                       self.qty_spin.value() if self.qty_check.isChecked() else None)
+        except ValueError as e:
+            self.search_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE + "QLineEdit { border-color: #dc3545; }")
+            self.search_input.setToolTip(str(e))
+            return
+        self.search_input.setStyleSheet(AppStyles.LINE_EDIT_STYLE)
+        self.search_input.setToolTip("")
+        self.filter_changed.emit(panel_filter)
+
+    def set_max_qty(self, max_qty):
+        """Follows the max panel quantity setting (the spin box is built before settings load)."""
+        self.qty_spin.setMaximum(max_qty)
+
+    def set_counts(self, shown, total, active):
+        """Shows "shown of total rows" while a filter is active."""
+        self.count_label.setText(f"{shown} of {total} rows" if active else "")
+
+    def clear(self):
+        """Resets every criterion, showing all rows again."""
+        for widget in (self.regex_check, self.missing_check, self.qty_check):
+            widget.blockSignals(True)
+            widget.setChecked(False)
+            widget.blockSignals(False)
+        self.search_input.blockSignals(True)
+        self.search_input.clear()
+        self.search_input.blockSignals(False)
+        self._emit_filter()
+
+    def focus_search(self):
+        self.search_input.setFocus(Qt.FocusReason.ShortcutFocusReason)
+        self.search_input.selectAll()
+
+    def keyPressEvent(self, event):
+        # Escape in the search box (which QLineEdit passes up) clears it
+        if event.key() == Qt.Key.Key_Escape and self.search_input.text():
+            self.search_input.clear()
+            return
+        super().keyPressEvent(event)
@@ -1,14 +1,61 @@
 # down_allocation_app/ui/widgets/table_widget.py
 
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QAbstractItemView, QApplication, QMessageBox
+import html
+
+import numpy as np
+
+from PyQt6.QtWidgets import (QTableWidget, QTableWidgetItem, QTableWidgetSelectionRange, QAbstractItemView,
+                             QApplication, QMessageBox)
 from PyQt6.QtGui import QKeyEvent
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QRect, QMimeData, QByteArray, pyqtSignal
 from ui.dialogs.progress_dialog import ProgressDialog # Assuming this path
+from styles import AppStyles
+from core.allocation_engine import number_text
+from core.cell_block import MIME_TYPE, CellBlock
+from core.telemetry import telemetry
+
+
+class _CellsMimeData(QMimeData):
+    """
+    Clipboard payload for copied cells: the typed CellBlock (if any) as binary,
+    plus TSV and HTML that are only rendered when a paste target asks for them.
+    """
+
+    def __init__(self, texts, block=None):
+        super().__init__()
+        self._texts = texts
+        self._block = block
+        self._encoded = None
+
+    def formats(self):
+        formats = ["text/plain", "text/html"]
+        if self._block is not None:
+            formats.insert(0, MIME_TYPE)
+        return formats
+
+    def hasFormat(self, mime_type):
+        return mime_type in self.formats()
+
+    def retrieveData(self, mime_type, preferred_type):
+        if mime_type == MIME_TYPE and self._block is not None:
+            if self._encoded is None:
+                self._encoded = QByteArray(self._block.encode())
+            return self._encoded
+        if mime_type.startswith("text/plain"):
+            return "\n".join("\t".join(row) for row in self._texts)
+        if mime_type == "text/html":
+            return "<table>" + "".join(
+                "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>"
+                for row in self._texts) + "</table>"
+        return super().retrieveData(mime_type, preferred_type)
+
 
 class TableWidget(QTableWidget):
     # Signal to notify parent of table dimension changes due to paste
     # This signal will be caught by main_window to orchestrate table resizing
     request_resize = pyqtSignal(int, int) # new_data_rows, new_size_cols
+    # Emitted after bulk writes (paste, undo/redo) that bypass itemChanged
+    contents_reset = pyqtSignal()
 
     def __init__(self, rows=0, cols=0, parent=None): # Set default rows/cols to 0 as they are setup later
         super().__init__(rows, cols, parent)
@@ -18,6 +65,10 @@ class TableWidget(QTableWidget):
         self.redo_stack = []
         self.initial_state_saved = False  # Track if initial state is saved
         self.programmatic_change = False  # Flag to prevent undo tracking during restore
+        self.base_size_column = -1  # Column painted as base size by the delegates (-1 = none)
+        # Set by tables laid out as name | qty | areas (the top table): copies then carry a typed
+        # CellBlock and pastes of one skip text parsing
+        self.typed_clipboard = False
 
     def setup_table_general_props(self): # Renamed
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)
@@ -55,7 +106,6 @@ class TableWidget(QTableWidget):
         if event.key() == Qt.Key.Key_C and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
             self.copy_selection()
         elif event.key() == Qt.Key.Key_V and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-            self.push_undo_state()
             self.paste_to_selection()
             # self.select_pasted_cells() # This is called at the end of paste_to_selection already
         elif event.key() == Qt.Key.Key_Delete:
@@ -102,8 +152,12 @@ class TableWidget(QTableWidget):
                 row, col = current.row(), current.column()
                 if event.key() == Qt.Key.Key_Up:
                     row -= 1
+                    while row > 0 and self.isRowHidden(row):  # Skip rows hidden by a filter
+                        row -= 1
                 elif event.key() == Qt.Key.Key_Down:
                     row += 1
+                    while row < self.rowCount() - 1 and self.isRowHidden(row):
+                        row += 1
                 elif event.key() == Qt.Key.Key_Left:
                     col -= 1
                 elif event.key() == Qt.Key.Key_Right:
@@ -118,6 +172,23 @@ class TableWidget(QTableWidget):
         else:
             super().keyPressEvent(event)
 
+    def update_columns(self, *columns):
+        """Schedules a repaint of only the given columns (negative indexes are ignored)."""
+        viewport = self.viewport()
+        for col in columns:
+            if col < 0 or col >= self.columnCount():
+                continue
+            x = self.columnViewportPosition(col)
+            viewport.update(QRect(x, 0, self.columnWidth(col), viewport.height()))
+
+    def set_base_size_column(self, col):
+        """Moves the base size highlight, repainting only the old and new columns."""
+        old_col = self.base_size_column
+        if col == old_col:
+            return
+        self.base_size_column = col
+        self.update_columns(old_col, col)
+
     def save_state(self):
         state = []
         for row in range(self.rowCount()):
@@ -191,16 +262,20 @@ class TableWidget(QTableWidget):
 
             for row in range(self.rowCount()):
                 for col in range(self.columnCount()):
+                    text = state[row][col]
                     item = self.item(row, col)
                     if not item:
+                        if not text:
+                            continue  # Empty cells stay unallocated; the delegate paints them
                         item = QTableWidgetItem()
                         self.setItem(row, col, item)
                     # Use .setText() directly, it will be handled by the delegate's editor
-                    item.setText(state[row][col])
+                    item.setText(text)
         finally:
             self.blockSignals(False)
             self.programmatic_change = False
             self.viewport().update()
+            self.contents_reset.emit()
             
             # Recalculate totals in main window after state restore
             if self.window() and hasattr(self.window(), 'update_all_tables_and_dropdowns'):
@@ -208,24 +283,151 @@ class TableWidget(QTableWidget):
 
 
     def copy_selection(self):
-        selection = self.selectedIndexes()
-        if not selection:
+        # Bounding box of the selection ranges; no per-index sorting
+        ranges = self.selectedRanges()
+        if not ranges:
             return
-        rows = sorted(index.row() for index in selection)
-        cols = sorted(index.column() for index in selection)
-        min_row, max_row = rows[0], rows[-1]
-        min_col, max_col = cols[0], cols[-1]
-        clipboard = QApplication.clipboard()
-        text = ""
-        for r in range(min_row, max_row + 1):
+        min_row = min(r.topRow() for r in ranges)
+        max_row = max(r.bottomRow() for r in ranges)
+        min_col = min(r.leftColumn() for r in ranges)
+        max_col = max(r.rightColumn() for r in ranges)
+        # Rows hidden by a filter are left out, as spreadsheets do
+        rows = [r for r in range(min_row, max_row + 1) if not self.isRowHidden(r)]
+        texts = []
+        for r in rows:
             row_text = []
             for c in range(min_col, max_col + 1):
                 item = self.item(r, c)
                 row_text.append(item.text() if item else "")
-            text += "\t".join(row_text) + "\n"
-        clipboard.setText(text.strip())
+            texts.append(row_text)
+        block = None
+        if self.typed_clipboard:
+            # The typed block leaves out the title row and the total row (e.g. after Select All)
+            block_rows = [i for i, r in enumerate(rows) if 1 <= r <= self.rowCount() - 2]
+            if block_rows:
+                block = CellBlock.from_texts(rows[block_rows[0]], min_col,
+                                             [texts[i] for i in block_rows])
+        QApplication.clipboard().setMimeData(_CellsMimeData(texts, block))
+
+    def _clipboard_block(self):
+        """The typed CellBlock on the clipboard, or None (other apps, other tables, old versions)."""
+        mime_data = QApplication.clipboard().mimeData()
+        if not self.typed_clipboard or mime_data is None or not mime_data.hasFormat(MIME_TYPE):
+            return None
+        try:
+            return CellBlock.decode(mime_data.data(MIME_TYPE).data())
+        except ValueError:
+            return None
+
+    def _set_text(self, row, col, text):
+        item = self.item(row, col)
+        if item is None:
+            item = QTableWidgetItem()
+            self.setItem(row, col, item)
+        item.setText(text)
+
+    def _conflicting_sizes(self, first_col, sizes):
+        """
+        Offsets into `sizes` (size headers to be written from column first_col
+        on) whose name is already used by another size column or earlier in
+        `sizes`. Those headers are left unchanged, as a typed duplicate is.
+        """
+        last_col = first_col + len(sizes)
+        taken = set()
+        for col in range(2, self.columnCount()):
+            item = self.item(1, col)
+            if item and item.text().strip() and not first_col <= col < last_col:
+                taken.add(item.text().strip().upper())
+        conflicts = set()
+        for offset, size in enumerate(sizes):
+            name = size.strip().upper()
+            if first_col + offset < 2 or not name:
+                continue
+            if name in taken:
+                conflicts.add(offset)
+            taken.add(name)
+        return conflicts
+
+    def _paste_block(self, block, first_row, first_col):
+        """
+        Fast path for a typed CellBlock: cells are written straight from the
+        arrays. A block's size headers always go to the size header row and
+        its panels start at the target row (the first panel row when pasted on
+        the headers), since the header cells above the name/qty columns can't
+        be selected. Returns False (nothing written) if the target is a
+        different kind of column than the block's origin, or if an area is
+        outside 0..MAX_SEWING_AREA (the block may come from another instance
+        or build), leaving the paste to the text path and its per-cell checks.
+        """
+        if first_row in (0, self.rowCount() - 1) or (first_row == 1 and block.sizes is None):
+            return False
+        if min(first_col, 2) != min(block.first_col, 2):
+            return False
+        if block.areas is not None:
+            values = block.areas[~np.isnan(block.areas)]
+            if ((values < 0) | (values > AppStyles.MAX_SEWING_AREA)).any():
+                return False
+
+        # Grow to fit the block's panels and sizes (request_resize is handled synchronously)
+        data_row = max(first_row, 2)
+        area_col = max(first_col, 2)
+        data_rows = max(self.rowCount() - 3, data_row - 2 + block.data_rows)
+        size_cols = max(self.columnCount() - 2, area_col - 2 + block.col_count - (area_col - first_col))
+        if data_rows > self.rowCount() - 3 or size_cols > self.columnCount() - 2:
+            self.request_resize.emit(data_rows, size_cols)
+
+        rows = max(0, min(block.data_rows, self.rowCount() - 1 - data_row))
+        col = first_col
+
+        self.programmatic_change = True
+        self.blockSignals(True)
+        try:
+            if block.sizes is not None:
+                size_col = max(first_col, 2)
+                sizes = block.sizes[:max(0, self.columnCount() - size_col)]
+                conflicts = self._conflicting_sizes(size_col, sizes)
+                for offset, size in enumerate(sizes):
+                    if offset not in conflicts:
+                        self._set_text(1, size_col + offset, size)
+            if block.names is not None:
+                for row in range(rows):
+                    self._set_text(data_row + row, col, block.names[row])
+                col += 1
+            if block.qty is not None:
+                qty = block.qty[:rows]
+                for row in np.flatnonzero((qty >= 1) & (qty <= AppStyles.MAX_PANEL_QTY)):
+                    self._set_text(data_row + row, col, str(qty[row]))
+                col += 1
+            if block.areas is not None:
+                areas = block.areas[:rows, :max(0, self.columnCount() - col)]
+                for row, offset in zip(*np.nonzero(~np.isnan(areas))):
+                    self._set_text(data_row + row, col + offset, number_text(areas[row, offset]) or "0")
+        finally:
+            self.blockSignals(False)
+            self.programmatic_change = False
 
+        self.pasted_cells = []
+        self.clearSelection()
+        self.setRangeSelected(QTableWidgetSelectionRange(
+            1 if block.sizes is not None else data_row, first_col, max(data_row + rows - 1, 1),
+            min(first_col + block.col_count, self.columnCount()) - 1), True)
+        self.viewport().update()
+        self.contents_reset.emit()
+        if self.window() and hasattr(self.window(), 'update_all_tables_and_dropdowns'):
+            self.window().update_all_tables_and_dropdowns()
+        return True
+
+    @telemetry.timed_method("paste_to_selection",
+                            lambda self: {'panels': self.rowCount() - 3, 'sizes': self.columnCount() - 2})
     def paste_to_selection(self):
+        selection = self.selectedIndexes()
+        if not selection:
+            return
+        self.push_undo_state()  # One undo step for the paste, whichever path writes it
+        block = self._clipboard_block()
+        if block is not None and self._paste_block(block, selection[0].row(), selection[0].column()):
+            return
+
         try:
             progress = ProgressDialog("Pasting Data", "Processing paste operation...", self.window())
             progress.show()
@@ -309,6 +511,7 @@ class TableWidget(QTableWidget):
             progress.label.setText("Pasting data...")
 
             self.pasted_cells = []
+            header_conflicts = self._conflicting_sizes(first_col, grid[0]) if is_size_header_paste else set()
             total_cells = needed_rows_for_paste * needed_cols_for_paste if grid else 1
             processed_cells = 0
             
@@ -336,16 +539,19 @@ class TableWidget(QTableWidget):
                         # Apply validation rules (simplified from original for brevity, but should be complete)
                         # Ensure proper validation based on column types
                         if current_row == 1 and current_col >= 2: # Size Header Row
-                            # Any text is allowed, will be uppercased by delegate
-                            pass 
-                        elif current_col == 1:  # Panel Quantity column (1-9)
-                            if not value.isdigit() or not (1 <= int(value) <= 9):
+                            # Any text is allowed (uppercased below) except an existing size name
+                            if r == 0 and c in header_conflicts:
+                                continue
+                        elif current_col == 1:  # Panel Quantity column (1..MAX_PANEL_QTY)
+                            if not value.isdigit() or not (1 <= int(value) <= AppStyles.MAX_PANEL_QTY):
                                 continue # Skip invalid qty
-                        elif current_col >= 2:  # Sewing area columns (float)
+                        elif current_col >= 2:  # Sewing area columns (0..MAX_SEWING_AREA)
                             try:
-                                float(value)
+                                area = float(value)
                             except ValueError:
                                 continue # Skip invalid float
+                            if not 0 <= area <= AppStyles.MAX_SEWING_AREA:
+                                continue # Skip negative or oversized area (also NaN)
 
                         if not self.item(current_row, current_col):
                             self.setItem(current_row, current_col, QTableWidgetItem())
@@ -363,6 +569,7 @@ class TableWidget(QTableWidget):
 
             progress.update_progress(95)
             self.select_pasted_cells()
+            self.contents_reset.emit()
             
             # Request totals calculation and dropdown update after paste
             # This covers the dropdown update for size headers (Issue 1)
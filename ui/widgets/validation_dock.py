@@ -0,0 +1,69 @@
+# down_allocation_app/ui/widgets/validation_dock.py
+
+from PyQt6.QtWidgets import QDockWidget, QListWidget, QListWidgetItem
+from PyQt6.QtCore import Qt, pyqtSignal
+
+_KEY_ROLE = Qt.ItemDataRole.UserRole
+
+
+class _IssueItem(QListWidgetItem):
+    """Sorts table-level issues first, then by row and column."""
+
+    def __init__(self, issue):
+        super().__init__(issue.message)
+        self.setData(_KEY_ROLE, issue.key)
+        self.order = (issue.row is not None, issue.row or 0, issue.col or 0, issue.kind)
+
+    def __lt__(self, other):
+        return self.order < other.order
+
+
+class ValidationDock(QDockWidget):
+    """
+    Non-blocking list of the table's validation issues, patched with the
+    (added, removed) changes a Validator reports. Activating an issue emits
+    issue_activated with its data row and table column.
+    """
+    issue_activated = pyqtSignal(int, int)
+    closed = pyqtSignal()  # Closed from its title bar (not when the window is hidden)
+
+    def __init__(self, parent=None):
+        super().__init__("Validation Issues", parent)
+        self.setObjectName("validation_dock")
+        self.setAllowedAreas(Qt.DockWidgetArea.LeftDockWidgetArea | Qt.DockWidgetArea.RightDockWidgetArea |
+                             Qt.DockWidgetArea.BottomDockWidgetArea)
+        self.issue_list = QListWidget()
+        self.issue_list.itemActivated.connect(self._activate)
+        self.issue_list.itemClicked.connect(self._activate)
+        self.setWidget(self.issue_list)
+        self._items = {}  # Issue.key -> _IssueItem
+
+    def apply_changes(self, added, removed):
+        if removed and len(removed) >= len(self._items):
+            self.issue_list.clear()
+            self._items = {}
+        for key in removed:
+            item = self._items.pop(key, None)
+            if item is not None:
+                self.issue_list.takeItem(self.issue_list.row(item))
+        # Sort once after a batch instead of on every insert
+        self.issue_list.setSortingEnabled(False)
+        for issue in added:
+            item = self._items.get(issue.key)
+            if item is not None:
+                item.setText(issue.message)
+                continue
+            item = _IssueItem(issue)
+            self._items[issue.key] = item
+            self.issue_list.addItem(item)
+        self.issue_list.setSortingEnabled(True)
+        self.setWindowTitle(f"Validation Issues ({len(self._items)})" if self._items else "Validation Issues")
+
+    def closeEvent(self, event):
+        super().closeEvent(event)
+        self.closed.emit()
+
+    def _activate(self, item):
+        _kind, row, col = item.data(_KEY_ROLE)
+        if row is not None:
+            self.issue_activated.emit(row, col)